@@ -10,6 +10,7 @@ import (
 	"syscall"
 	"time"
 
+	"github.com/google/uuid"
 	"github.com/hibiken/asynq"
 
 	"github.com/autocrawlerHQ/browsergrid/internal/config"
@@ -49,6 +50,11 @@ import (
 // @externalDocs.url          https://swagger.io/resources/open-api/
 
 func main() {
+	// Session, event and metric IDs are minted on every write; read random
+	// bytes in batches instead of one getrandom syscall per UUID. Must run
+	// before any goroutine generates UUIDs.
+	uuid.EnableRandPool()
+
 	cfg := config.Load()
 	log.Printf("========================================")
 	log.Printf("      BrowserGrid v2 API Server        ")
@@ -60,7 +66,7 @@ func main() {
 	ctx, stop := signal.NotifyContext(context.Background(), syscall.SIGINT, syscall.SIGTERM)
 	defer stop()
 
-	database, err := db.New(cfg.DatabaseURL)
+	database, err := db.New(cfg.DatabaseURL, cfg.DBPool)
 	if err != nil {
 		log.Fatalf("db: %v", err)
 	}
@@ -89,6 +95,7 @@ func main() {
 	defer taskClient.Close()
 
 	inspector := asynq.NewInspector(redisOpt)
+	defer inspector.Close()
 	if _, err := inspector.Queues(); err != nil {
 		log.Fatalf("Failed to connect to Redis: %v", err)
 	}
@@ -104,6 +111,7 @@ func main() {
 	defer schedulerSvc.Stop()
 
 	reconciler := poolmgr.NewReconciler(database.DB, taskClient, redisOpt)
+	defer reconciler.Close()
 	storageBackend, err := storage.New(cfg.Storage.Backend, map[string]string{"path": cfg.Storage.LocalPath, "bucket": cfg.Storage.S3Bucket, "region": cfg.Storage.S3Region, "prefix": cfg.Storage.S3Prefix})
 	if err != nil {
 		log.Fatalf("storage init: %v", err)
@@ -120,7 +128,7 @@ func main() {
 		}
 	}()
 
-	r := router.New(database, reconciler, taskClient, redisOpt, storageBackend)
+	r := router.New(database, reconciler, taskClient, inspector, storageBackend)
 
 	srv := &http.Server{
 		Addr:         ":" + strconv.Itoa(cfg.Port),
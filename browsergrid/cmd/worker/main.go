@@ -11,6 +11,7 @@ import (
 	"os"
 	"os/signal"
 	"path/filepath"
+	"sync"
 	"syscall"
 	"time"
 
@@ -36,6 +37,7 @@ type WorkerConfig struct {
 	RedisAddr   string
 	Concurrency int
 	Queues      map[string]int
+	DBPool      config.DBPoolConfig
 	Storage     config.StorageConfig
 }
 
@@ -50,6 +52,11 @@ func main() {
 	if err != nil {
 		log.Fatal("[STARTUP] ✗ Failed to connect to database:", err)
 	}
+	sqlDB, err := db.DB()
+	if err != nil {
+		log.Fatal("[STARTUP] ✗ Failed to get database handle:", err)
+	}
+	cfg.DBPool.Apply(sqlDB)
 
 	sessStore := sessions.NewStore(db)
 
@@ -90,6 +97,8 @@ func main() {
 		},
 	)
 
+	defer enqueueClients.Close()
+
 	mux := asynq.NewServeMux()
 
 	mux.HandleFunc(tasks.TypeSessionStart, handleSessionStart(sessStore, prov))
@@ -135,9 +144,9 @@ func handleSessionStart(store *sessions.Store, prov provider.Provisioner) asynq.
 
 		log.Printf("[TASK] Starting session %s", payload.SessionID)
 
-		sess, err := store.GetSession(ctx, payload.SessionID)
+		sess, err := store.MarkSessionStarting(ctx, payload.SessionID)
 		if err != nil {
-			return fmt.Errorf("failed to get session: %w", err)
+			return fmt.Errorf("failed to mark session starting: %w", err)
 		}
 
 		// Log if profile is being used
@@ -145,10 +154,6 @@ func handleSessionStart(store *sessions.Store, prov provider.Provisioner) asynq.
 			log.Printf("[TASK] Session %s using profile %s", sess.ID, *sess.ProfileID)
 		}
 
-		if err := store.UpdateSessionStatus(ctx, sess.ID, sessions.StatusStarting); err != nil {
-			log.Printf("[TASK] Warning: Failed to update session status: %v", err)
-		}
-
 		wsURL, liveURL, err := prov.Start(ctx, sess)
 		if err != nil {
 			log.Printf("[TASK] ✗ Failed to start session %s: %v", sess.ID, err)
@@ -174,8 +179,7 @@ func handleSessionStart(store *sessions.Store, prov provider.Provisioner) asynq.
 			log.Printf("[TASK] └── Profile: %s", *sess.ProfileID)
 		}
 
-		client := asynq.NewClient(asynq.RedisClientOpt{Addr: payload.RedisAddr})
-		defer client.Close()
+		client := enqueueClients.get(payload.RedisAddr)
 
 		healthCheckPayload := tasks.SessionHealthCheckPayload{
 			SessionID: sess.ID,
@@ -275,8 +279,7 @@ func handleSessionHealthCheck(store *sessions.Store, prov provider.Provisioner)
 
 			store.UpdateSessionStatus(ctx, sess.ID, sessions.StatusCrashed)
 
-			client := asynq.NewClient(asynq.RedisClientOpt{Addr: payload.RedisAddr})
-			defer client.Close()
+			client := enqueueClients.get(payload.RedisAddr)
 
 			stopPayload := tasks.SessionStopPayload{
 				SessionID: sess.ID,
@@ -297,8 +300,7 @@ func handleSessionHealthCheck(store *sessions.Store, prov provider.Provisioner)
 				safeDeref(metrics.MemoryMB, 0.0))
 		}
 
-		client := asynq.NewClient(asynq.RedisClientOpt{Addr: payload.RedisAddr})
-		defer client.Close()
+		client := enqueueClients.get(payload.RedisAddr)
 
 		nextHealthCheck, _ := tasks.NewSessionHealthCheckTask(payload)
 		_, err = client.Enqueue(nextHealthCheck,
@@ -319,8 +321,7 @@ func handleSessionTimeout(store *sessions.Store, prov provider.Provisioner, redi
 
 		log.Printf("[TIMEOUT] Session %s has reached its maximum duration", payload.SessionID)
 
-		client := asynq.NewClient(asynq.RedisClientOpt{Addr: redisAddr})
-		defer client.Close()
+		client := enqueueClients.get(redisAddr)
 
 		stopPayload := tasks.SessionStopPayload{
 			SessionID: payload.SessionID,
@@ -334,6 +335,38 @@ func handleSessionTimeout(store *sessions.Store, prov provider.Provisioner, redi
 	}
 }
 
+// taskClients shares one asynq client, and with it one Redis connection
+// pool, per address across task handlers. Handlers enqueue follow-up tasks
+// on most runs, and dialing Redis for each of them dominated their cost.
+type taskClients struct {
+	mu      sync.Mutex
+	clients map[string]*asynq.Client
+}
+
+var enqueueClients = &taskClients{clients: make(map[string]*asynq.Client)}
+
+func (c *taskClients) get(addr string) *asynq.Client {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	client, ok := c.clients[addr]
+	if !ok {
+		client = asynq.NewClient(asynq.RedisClientOpt{Addr: addr})
+		c.clients[addr] = client
+	}
+	return client
+}
+
+func (c *taskClients) Close() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	for addr, client := range c.clients {
+		client.Close()
+		delete(c.clients, addr)
+	}
+}
+
 func healthCheck(store *sessions.Store) func() error {
 	return func() error {
 		ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
@@ -357,6 +390,7 @@ func loadConfig() WorkerConfig {
 			"default":  5,
 			"low":      1,
 		},
+		DBPool: config.LoadDBPool(),
 		Storage: config.StorageConfig{
 			Backend:   "local",
 			LocalPath: "/tmp/browsergrid/storage",
@@ -496,7 +530,10 @@ func extractTarGz(src, dest string) error {
 }
 
 func connectDB(databaseURL string) (*gorm.DB, error) {
-	return gorm.Open(postgres.Open(databaseURL), &gorm.Config{})
+	return gorm.Open(postgres.Open(databaseURL), &gorm.Config{
+		PrepareStmt:            true,
+		SkipDefaultTransaction: true,
+	})
 }
 
 func safeDeref[T any](ptr *T, defaultVal T) T {
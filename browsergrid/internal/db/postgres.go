@@ -2,12 +2,12 @@ package db
 
 import (
 	"fmt"
-	"time"
 
 	"gorm.io/driver/postgres"
 	"gorm.io/gorm"
 	"gorm.io/gorm/logger"
 
+	"github.com/autocrawlerHQ/browsergrid/internal/config"
 	"github.com/autocrawlerHQ/browsergrid/internal/deployments"
 	"github.com/autocrawlerHQ/browsergrid/internal/sessions"
 	"github.com/autocrawlerHQ/browsergrid/internal/workpool"
@@ -17,9 +17,17 @@ type DB struct {
 	*gorm.DB
 }
 
-func New(dsn string) (*DB, error) {
+func New(dsn string, pool config.DBPoolConfig) (*DB, error) {
 	db, err := gorm.Open(postgres.Open(dsn), &gorm.Config{
-		Logger: logger.Default.LogMode(logger.Info),
+		// Info level formats and writes every statement on the request path;
+		// Warn still reports errors and slow queries, like the worker's default.
+		Logger: logger.Default.LogMode(logger.Warn),
+		// Cache a prepared statement per distinct SQL string so hot queries
+		// are parsed and planned once per connection instead of per call.
+		PrepareStmt: true,
+		// Single-statement writes don't need the BEGIN/COMMIT GORM wraps them
+		// in by default; multi-statement writes use explicit transactions.
+		SkipDefaultTransaction: true,
 	})
 	if err != nil {
 		return nil, fmt.Errorf("connect to database: %w", err)
@@ -30,9 +38,7 @@ func New(dsn string) (*DB, error) {
 		return nil, fmt.Errorf("get underlying sql.DB: %w", err)
 	}
 
-	sqlDB.SetMaxOpenConns(10)
-	sqlDB.SetMaxIdleConns(2)
-	sqlDB.SetConnMaxLifetime(30 * time.Second)
+	pool.Apply(sqlDB)
 
 	return &DB{DB: db}, nil
 }
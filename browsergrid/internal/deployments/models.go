@@ -71,9 +71,9 @@ type BrowserRequest struct {
 // @Description Deployment package with configuration and metadata
 type Deployment struct {
 	ID          uuid.UUID        `json:"id" gorm:"type:uuid;primary_key"`
-	Name        string           `json:"name" gorm:"not null;index"`
+	Name        string           `json:"name" gorm:"not null;index;index:idx_deployments_name_version,priority:1"`
 	Description string           `json:"description"`
-	Version     string           `json:"version" gorm:"not null"`
+	Version     string           `json:"version" gorm:"not null;index:idx_deployments_name_version,priority:2"`
 	Runtime     Runtime          `json:"runtime" gorm:"not null"`
 	PackageURL  string           `json:"package_url" gorm:"not null"`
 	PackageHash string           `json:"package_hash" gorm:"not null"`
@@ -136,14 +136,14 @@ func (d *Deployment) BeforeUpdate(tx *gorm.DB) error {
 // @Description Deployment run with execution details and results
 type DeploymentRun struct {
 	ID           uuid.UUID      `json:"id" gorm:"type:uuid;primary_key"`
-	DeploymentID uuid.UUID      `json:"deployment_id" gorm:"type:uuid;not null;index"`
+	DeploymentID uuid.UUID      `json:"deployment_id" gorm:"type:uuid;not null;index;index:idx_deployment_runs_deployment_id_created_at,priority:1"`
 	SessionID    *uuid.UUID     `json:"session_id,omitempty" gorm:"type:uuid;index"`
 	Status       RunStatus      `json:"status" gorm:"not null;default:pending"`
 	StartedAt    time.Time      `json:"started_at" gorm:"not null"`
 	CompletedAt  *time.Time     `json:"completed_at,omitempty"`
 	Output       datatypes.JSON `json:"output,omitempty"`
 	Error        *string        `json:"error,omitempty"`
-	CreatedAt    time.Time      `json:"created_at" gorm:"not null"`
+	CreatedAt    time.Time      `json:"created_at" gorm:"not null;index:idx_deployment_runs_deployment_id_created_at,priority:2,sort:desc"`
 	UpdatedAt    time.Time      `json:"updated_at" gorm:"not null"`
 
 	// Relationships
@@ -51,10 +51,15 @@ func (r *DeploymentRunner) ExecuteDeployment(ctx context.Context, runID uuid.UUI
 		return fmt.Errorf("failed to get deployment run: %w", err)
 	}
 
-	// Get the deployment
-	deployment, err := r.store.GetDeployment(ctx, run.DeploymentID)
-	if err != nil {
-		return fmt.Errorf("failed to get deployment: %w", err)
+	// The run is loaded with its deployment preloaded; only fall back to a
+	// separate lookup (which also loads recent runs and stats the runner
+	// never reads) when the preload came back empty.
+	deployment := run.Deployment
+	if deployment == nil {
+		deployment, err = r.store.GetDeployment(ctx, run.DeploymentID)
+		if err != nil {
+			return fmt.Errorf("failed to get deployment: %w", err)
+		}
 	}
 
 	// Update run status to running
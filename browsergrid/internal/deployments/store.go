@@ -35,7 +35,7 @@ func (s *Store) GetDeployment(ctx context.Context, id uuid.UUID) (*Deployment, e
 		Preload("Runs", func(db *gorm.DB) *gorm.DB {
 			return db.Order("created_at DESC").Limit(10)
 		}).
-		First(&deployment, "id = ?", id).Error
+		Take(&deployment, "id = ?", id).Error
 	if err != nil {
 		return nil, err
 	}
@@ -82,10 +82,12 @@ func (s *Store) ListDeployments(ctx context.Context, status *DeploymentStatus, r
 		return nil, 0, err
 	}
 
-	// Calculate computed fields for each deployment
+	// Calculate computed fields for all deployments in one query
+	ptrs := make([]*Deployment, len(deployments))
 	for i := range deployments {
-		s.calculateDeploymentStats(ctx, &deployments[i])
+		ptrs[i] = &deployments[i]
 	}
+	s.calculateDeploymentStats(ctx, ptrs...)
 
 	return deployments, total, nil
 }
@@ -137,7 +139,7 @@ func (s *Store) GetDeploymentRun(ctx context.Context, id uuid.UUID) (*Deployment
 	var run DeploymentRun
 	err := s.db.WithContext(ctx).
 		Preload("Deployment").
-		First(&run, "id = ?", id).Error
+		Take(&run, "id = ?", id).Error
 	if err != nil {
 		return nil, err
 	}
@@ -245,57 +247,84 @@ func (s *Store) GetDeploymentRunsForSession(ctx context.Context, sessionID uuid.
 	return runs, err
 }
 
+// terminalRunStatuses are the statuses of runs that will not change again.
+var terminalRunStatuses = []RunStatus{RunStatusCompleted, RunStatusFailed, RunStatusCancelled}
+
 func (s *Store) CleanupOldRuns(ctx context.Context, maxAge time.Duration) error {
 	cutoff := time.Now().Add(-maxAge)
 	return s.db.WithContext(ctx).
-		Where("created_at < ? AND status IN ?", cutoff, []RunStatus{RunStatusCompleted, RunStatusFailed, RunStatusCancelled}).
+		Where("created_at < ? AND status IN ?", cutoff, terminalRunStatuses).
 		Delete(&DeploymentRun{}).Error
 }
 
 // Helper methods
 
-func (s *Store) calculateDeploymentStats(ctx context.Context, deployment *Deployment) {
-	var stats struct {
-		TotalRuns      int64
-		SuccessfulRuns int64
-		FailedRuns     int64
-		LastRunAt      *time.Time
+// calculateDeploymentStats fills in the run counters for all given
+// deployments with a single grouped query rather than four per deployment.
+func (s *Store) calculateDeploymentStats(ctx context.Context, deployments ...*Deployment) {
+	if len(deployments) == 0 {
+		return
 	}
 
-	s.db.WithContext(ctx).
-		Model(&DeploymentRun{}).
-		Where("deployment_id = ?", deployment.ID).
-		Count(&stats.TotalRuns)
+	ids := make([]uuid.UUID, len(deployments))
+	for i, d := range deployments {
+		ids[i] = d.ID
+	}
 
+	var rows []struct {
+		DeploymentID   uuid.UUID
+		TotalRuns      int
+		SuccessfulRuns int
+		FailedRuns     int
+		LastRunAt      *time.Time
+	}
 	s.db.WithContext(ctx).
 		Model(&DeploymentRun{}).
-		Where("deployment_id = ? AND status = ?", deployment.ID, RunStatusCompleted).
-		Count(&stats.SuccessfulRuns)
+		Select(`deployment_id,
+			COUNT(*) AS total_runs,
+			COUNT(*) FILTER (WHERE status = ?) AS successful_runs,
+			COUNT(*) FILTER (WHERE status = ?) AS failed_runs,
+			MAX(created_at) AS last_run_at`, RunStatusCompleted, RunStatusFailed).
+		Where("deployment_id IN ?", ids).
+		Group("deployment_id").
+		Scan(&rows)
+
+	byID := make(map[uuid.UUID]int, len(rows))
+	for i, row := range rows {
+		byID[row.DeploymentID] = i
+	}
 
-	s.db.WithContext(ctx).
-		Model(&DeploymentRun{}).
-		Where("deployment_id = ? AND status = ?", deployment.ID, RunStatusFailed).
-		Count(&stats.FailedRuns)
+	for _, d := range deployments {
+		i, ok := byID[d.ID]
+		if !ok {
+			d.TotalRuns, d.SuccessfulRuns, d.FailedRuns, d.LastRunAt = 0, 0, 0, nil
+			continue
+		}
+		d.TotalRuns = rows[i].TotalRuns
+		d.SuccessfulRuns = rows[i].SuccessfulRuns
+		d.FailedRuns = rows[i].FailedRuns
+		d.LastRunAt = rows[i].LastRunAt
+	}
+}
 
-	s.db.WithContext(ctx).
-		Model(&DeploymentRun{}).
-		Where("deployment_id = ?", deployment.ID).
-		Select("MAX(created_at)").
-		Scan(&stats.LastRunAt)
-
-	deployment.TotalRuns = int(stats.TotalRuns)
-	deployment.SuccessfulRuns = int(stats.SuccessfulRuns)
-	deployment.FailedRuns = int(stats.FailedRuns)
-	deployment.LastRunAt = stats.LastRunAt
+// DeploymentExists reports whether a deployment with the given ID exists
+// without loading the row.
+func (s *Store) DeploymentExists(ctx context.Context, id uuid.UUID) (bool, error) {
+	var exists bool
+	err := s.db.WithContext(ctx).
+		Raw("SELECT EXISTS (SELECT 1 FROM deployments WHERE id = ?)", id).
+		Scan(&exists).Error
+	return exists, err
 }
 
 func (s *Store) GetDeploymentStats(ctx context.Context, deploymentID uuid.UUID) (map[string]interface{}, error) {
-	// First check if deployment exists
-	var deployment Deployment
-	err := s.db.WithContext(ctx).First(&deployment, "id = ?", deploymentID).Error
+	exists, err := s.DeploymentExists(ctx, deploymentID)
 	if err != nil {
 		return nil, err
 	}
+	if !exists {
+		return nil, gorm.ErrRecordNotFound
+	}
 
 	var stats map[string]interface{}
 
@@ -593,8 +593,11 @@ func TestCLI_ErrorHandling(t *testing.T) {
 	assert.Nil(t, deployment)
 	assert.Contains(t, err.Error(), "500")
 
-	// Test network errors
-	client.BaseURL = "http://invalid-url"
+	// Test network errors against a port nothing listens on, so the failure
+	// is an immediate refused connection rather than a DNS lookup.
+	closedServer := httptest.NewServer(http.NotFoundHandler())
+	closedServer.Close()
+	client.BaseURL = closedServer.URL
 	deployment, err = client.CreateDeployment(deploymentReq)
 	assert.Error(t, err)
 	assert.Nil(t, deployment)
@@ -13,9 +13,7 @@ import (
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
 	"gorm.io/datatypes"
-	postgresDriver "gorm.io/driver/postgres"
 	"gorm.io/gorm"
-	"gorm.io/gorm/logger"
 	"net/http"
 	"net/http/httptest"
 	"testing"
@@ -46,21 +44,7 @@ func (m *mockTaskClient) Close() error {
 }
 
 func setupHTTPTestDB(t *testing.T) (*gorm.DB, *gin.Engine) {
-	db, err := gorm.Open(postgresDriver.Open(testConnStr), &gorm.Config{
-		Logger: logger.Default.LogMode(logger.Silent),
-	})
-	if err != nil {
-		t.Fatalf("Failed to connect to test database: %v", err)
-	}
-
-	// Drop and recreate tables
-	err = db.Migrator().DropTable(&Deployment{}, &DeploymentRun{})
-	if err != nil {
-		t.Logf("Warning: Failed to drop tables (may not exist): %v", err)
-	}
-
-	err = db.AutoMigrate(&Deployment{}, &DeploymentRun{})
-	require.NoError(t, err)
+	db := resetTestDB(t)
 
 	gin.SetMode(gin.TestMode)
 	router := gin.New()
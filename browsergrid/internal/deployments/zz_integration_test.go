@@ -14,9 +14,7 @@ import (
 	"github.com/hibiken/asynq"
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
-	"gorm.io/driver/postgres"
 	"gorm.io/gorm"
-	"gorm.io/gorm/logger"
 	"net/http"
 	"net/http/httptest"
 	"os"
@@ -81,22 +79,7 @@ func (m *mockTaskQueue) SetHandler(handler func(*asynq.Task) error) {
 
 func setupIntegrationTest(t *testing.T) *IntegrationTestSuite {
 	// Setup database
-	db, err := gorm.Open(postgres.Open(testConnStr), &gorm.Config{
-		Logger: logger.Default.LogMode(logger.Silent),
-	})
-	if err != nil {
-		t.Fatalf("Failed to connect to test database: %v", err)
-	}
-
-	// Clean up tables
-	err = db.Migrator().DropTable(&Deployment{}, &DeploymentRun{}, &sessions.Session{})
-	if err != nil {
-		t.Logf("Warning: Failed to drop tables: %v", err)
-	}
-
-	// Auto-migrate
-	err = db.AutoMigrate(&Deployment{}, &DeploymentRun{}, &sessions.Session{})
-	require.NoError(t, err)
+	db := resetTestDB(t)
 
 	// Create temp directory
 	tempDir := t.TempDir()
@@ -15,9 +15,7 @@ import (
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
 	"gorm.io/datatypes"
-	"gorm.io/driver/postgres"
 	"gorm.io/gorm"
-	"gorm.io/gorm/logger"
 
 	"github.com/autocrawlerHQ/browsergrid/internal/sessions"
 )
@@ -73,21 +71,7 @@ func (m *mockSessionsStore) SetSessionStatus(id uuid.UUID, status sessions.Sessi
 }
 
 func setupRunnerTestDB(t *testing.T) (*gorm.DB, *DeploymentRunner) {
-	db, err := gorm.Open(postgres.Open(testConnStr), &gorm.Config{
-		Logger: logger.Default.LogMode(logger.Silent),
-	})
-	if err != nil {
-		t.Fatalf("Failed to connect to test database: %v", err)
-	}
-
-	// Drop and recreate tables
-	err = db.Migrator().DropTable(&Deployment{}, &DeploymentRun{})
-	if err != nil {
-		t.Logf("Warning: Failed to drop tables (may not exist): %v", err)
-	}
-
-	err = db.AutoMigrate(&Deployment{}, &DeploymentRun{})
-	require.NoError(t, err)
+	db := resetTestDB(t)
 
 	// Create temp directory for runner
 	tempDir := t.TempDir()
@@ -97,12 +81,7 @@ func setupRunnerTestDB(t *testing.T) (*gorm.DB, *DeploymentRunner) {
 }
 
 func TestNewDeploymentRunner(t *testing.T) {
-	db, err := gorm.Open(postgres.Open(testConnStr), &gorm.Config{
-		Logger: logger.Default.LogMode(logger.Silent),
-	})
-	if err != nil {
-		t.Skipf("Skipping test: PostgreSQL not available: %v", err)
-	}
+	db := testDB
 
 	tests := []struct {
 		name     string
@@ -7,6 +7,7 @@ import (
 	"testing"
 	"time"
 
+	"github.com/autocrawlerHQ/browsergrid/internal/sessions"
 	"github.com/google/uuid"
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
@@ -22,6 +23,9 @@ import (
 var (
 	testContainer *postgres.PostgresContainer
 	testConnStr   string
+	// testDB is opened once and shared by every test in the package so each
+	// test doesn't leave its own connection pool behind.
+	testDB *gorm.DB
 )
 
 func TestMain(m *testing.M) {
@@ -48,6 +52,17 @@ func TestMain(m *testing.M) {
 		log.Fatalf("Failed to get connection string: %v", err)
 	}
 
+	testDB, err = gorm.Open(postgresDriver.Open(testConnStr), &gorm.Config{
+		Logger: logger.Default.LogMode(logger.Silent),
+	})
+	if err != nil {
+		log.Fatalf("Failed to connect to test database: %v", err)
+	}
+
+	if err := testDB.AutoMigrate(&Deployment{}, &DeploymentRun{}, &sessions.Session{}); err != nil {
+		log.Fatalf("Failed to migrate test database: %v", err)
+	}
+
 	code := m.Run()
 
 	if err := testContainer.Terminate(ctx); err != nil {
@@ -57,26 +72,18 @@ func TestMain(m *testing.M) {
 	os.Exit(code)
 }
 
-func setupStoreTestDB(t *testing.T) *gorm.DB {
-	db, err := gorm.Open(postgresDriver.Open(testConnStr), &gorm.Config{
-		Logger: logger.Default.LogMode(logger.Silent),
-	})
-	if err != nil {
-		t.Fatalf("Failed to connect to test database: %v", err)
-	}
-
-	// Drop and recreate tables
-	err = db.Migrator().DropTable(&Deployment{}, &DeploymentRun{})
-	if err != nil {
-		t.Logf("Warning: Failed to drop tables (may not exist): %v", err)
-	}
-
-	err = db.AutoMigrate(&Deployment{}, &DeploymentRun{})
+// resetTestDB empties the tables migrated in TestMain. Truncating is much
+// cheaper than dropping and re-migrating the schema before every test.
+func resetTestDB(t *testing.T) *gorm.DB {
+	err := testDB.Exec("TRUNCATE TABLE deployment_runs, deployments, sessions CASCADE").Error
 	if err != nil {
-		t.Fatalf("Failed to migrate test database: %v", err)
+		t.Fatalf("Failed to reset test database: %v", err)
 	}
+	return testDB
+}
 
-	return db
+func setupStoreTestDB(t *testing.T) *gorm.DB {
+	return resetTestDB(t)
 }
 
 func TestStore_CreateDeployment(t *testing.T) {
@@ -406,6 +413,52 @@ func TestStore_ListDeployments(t *testing.T) {
 	}
 }
 
+func TestStore_ListDeployments_Stats(t *testing.T) {
+	db := setupStoreTestDB(t)
+	store := NewStore(db)
+	ctx := context.Background()
+
+	busy := &Deployment{
+		Name:        "busy-deployment",
+		Version:     "1.0.0",
+		Runtime:     RuntimeNode,
+		PackageURL:  "https://example.com/busy.zip",
+		PackageHash: "hash1",
+		Status:      StatusActive,
+	}
+	idle := &Deployment{
+		Name:        "idle-deployment",
+		Version:     "1.0.0",
+		Runtime:     RuntimeNode,
+		PackageURL:  "https://example.com/idle.zip",
+		PackageHash: "hash2",
+		Status:      StatusActive,
+	}
+	require.NoError(t, store.CreateDeployment(ctx, busy))
+	require.NoError(t, store.CreateDeployment(ctx, idle))
+
+	for _, status := range []RunStatus{RunStatusCompleted, RunStatusCompleted, RunStatusFailed, RunStatusRunning} {
+		require.NoError(t, store.CreateDeploymentRun(ctx, &DeploymentRun{DeploymentID: busy.ID, Status: status}))
+	}
+
+	result, _, err := store.ListDeployments(ctx, nil, nil, 0, 10)
+	require.NoError(t, err)
+	require.Len(t, result, 2)
+
+	byName := make(map[string]Deployment)
+	for _, d := range result {
+		byName[d.Name] = d
+	}
+
+	assert.Equal(t, 4, byName["busy-deployment"].TotalRuns)
+	assert.Equal(t, 2, byName["busy-deployment"].SuccessfulRuns)
+	assert.Equal(t, 1, byName["busy-deployment"].FailedRuns)
+	assert.NotNil(t, byName["busy-deployment"].LastRunAt)
+
+	assert.Equal(t, 0, byName["idle-deployment"].TotalRuns)
+	assert.Nil(t, byName["idle-deployment"].LastRunAt)
+}
+
 func TestStore_UpdateDeployment(t *testing.T) {
 	db := setupStoreTestDB(t)
 	store := NewStore(db)
@@ -975,6 +1028,33 @@ func TestStore_GetDeploymentStats(t *testing.T) {
 	assert.Len(t, recentRuns, 4)
 }
 
+func TestStore_DeploymentExists(t *testing.T) {
+	db := setupStoreTestDB(t)
+	store := NewStore(db)
+	ctx := context.Background()
+
+	deployment := &Deployment{
+		Name:        "exists-deployment",
+		Version:     "1.0.0",
+		Runtime:     RuntimeNode,
+		PackageURL:  "https://example.com/package.zip",
+		PackageHash: "hash123",
+		Status:      StatusActive,
+	}
+	require.NoError(t, store.CreateDeployment(ctx, deployment))
+
+	exists, err := store.DeploymentExists(ctx, deployment.ID)
+	require.NoError(t, err)
+	assert.True(t, exists)
+
+	exists, err = store.DeploymentExists(ctx, uuid.New())
+	require.NoError(t, err)
+	assert.False(t, exists)
+
+	_, err = store.GetDeploymentStats(ctx, uuid.New())
+	assert.ErrorIs(t, err, gorm.ErrRecordNotFound)
+}
+
 func TestStore_GetDeploymentRunsForSession(t *testing.T) {
 	db := setupStoreTestDB(t)
 	store := NewStore(db)
@@ -0,0 +1,90 @@
+package middleware
+
+import (
+	"bytes"
+	"net/http"
+	"strconv"
+	"strings"
+
+	"github.com/cespare/xxhash/v2"
+	"github.com/gin-gonic/gin"
+)
+
+const (
+	headerETag        = "ETag"
+	headerIfNoneMatch = "If-None-Match"
+)
+
+// etagWriter buffers the handler's response body so a validator can be
+// computed before anything reaches the client.
+type etagWriter struct {
+	gin.ResponseWriter
+	body bytes.Buffer
+}
+
+func (w *etagWriter) Write(data []byte) (int, error) {
+	return w.body.Write(data)
+}
+
+func (w *etagWriter) WriteString(s string) (int, error) {
+	return w.body.WriteString(s)
+}
+
+// ETag tags successful GET responses with a validator derived from the body
+// and answers 304 Not Modified when the client already holds it. The tag is
+// weak because Gzip may serve the same content under either encoding, and a
+// strong tag must identify exact bytes.
+//
+// The validator is computed from the finished body, so a 304 only saves
+// sending the response; the handler and its database queries still run in
+// full. The whole body is buffered, so ETag must only be mounted on routes
+// that return small JSON documents, never on streaming endpoints.
+func ETag() gin.HandlerFunc {
+	return func(c *gin.Context) {
+		if c.Request.Method != http.MethodGet {
+			c.Next()
+			return
+		}
+
+		original := c.Writer
+		w := &etagWriter{ResponseWriter: original}
+		c.Writer = w
+		// Deferred so that when a handler panics, recovery middleware writes
+		// its error response to the real writer instead of this buffer.
+		defer func() { c.Writer = original }()
+		c.Next()
+		c.Writer = original
+
+		if w.body.Len() == 0 {
+			return
+		}
+
+		if w.Status() == http.StatusOK {
+			etag := `W/"` + strconv.FormatUint(xxhash.Sum64(w.body.Bytes()), 16) + `"`
+			original.Header().Set(headerETag, etag)
+
+			if etagMatches(c.GetHeader(headerIfNoneMatch), etag) {
+				original.Header().Del("Content-Type")
+				original.WriteHeader(http.StatusNotModified)
+				original.WriteHeaderNow()
+				return
+			}
+		}
+
+		original.Write(w.body.Bytes())
+	}
+}
+
+func etagMatches(ifNoneMatch, etag string) bool {
+	if ifNoneMatch == "" {
+		return false
+	}
+	for _, candidate := range strings.Split(ifNoneMatch, ",") {
+		candidate = strings.TrimSpace(candidate)
+		// If-None-Match uses weak comparison, so W/ prefixes are ignored.
+		if candidate == "*" || strings.TrimPrefix(candidate, "W/") == strings.TrimPrefix(etag, "W/") {
+			return true
+		}
+	}
+	return false
+}
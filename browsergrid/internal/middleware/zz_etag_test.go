@@ -0,0 +1,89 @@
+package middleware
+
+import (
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+
+	"github.com/gin-gonic/gin"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestETag(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+
+	r := gin.New()
+	r.GET("/pools", ETag(), func(c *gin.Context) {
+		c.JSON(http.StatusOK, gin.H{"pools": []string{"a", "b"}})
+	})
+	r.GET("/missing", ETag(), func(c *gin.Context) {
+		c.JSON(http.StatusNotFound, gin.H{"error": "not found"})
+	})
+
+	w := httptest.NewRecorder()
+	r.ServeHTTP(w, httptest.NewRequest("GET", "/pools", nil))
+	require.Equal(t, http.StatusOK, w.Code)
+	etag := w.Header().Get("ETag")
+	require.True(t, strings.HasPrefix(etag, `W/"`), "expected a weak ETag, got %q", etag)
+	assert.JSONEq(t, `{"pools":["a","b"]}`, w.Body.String())
+
+	t.Run("matching If-None-Match returns 304", func(t *testing.T) {
+		req := httptest.NewRequest("GET", "/pools", nil)
+		req.Header.Set("If-None-Match", etag)
+		w := httptest.NewRecorder()
+		r.ServeHTTP(w, req)
+
+		assert.Equal(t, http.StatusNotModified, w.Code)
+		assert.Equal(t, etag, w.Header().Get("ETag"))
+		assert.Empty(t, w.Body.String())
+	})
+
+	t.Run("strong form and listed validators match", func(t *testing.T) {
+		req := httptest.NewRequest("GET", "/pools", nil)
+		req.Header.Set("If-None-Match", `"stale", `+strings.TrimPrefix(etag, "W/"))
+		w := httptest.NewRecorder()
+		r.ServeHTTP(w, req)
+
+		assert.Equal(t, http.StatusNotModified, w.Code)
+	})
+
+	t.Run("stale If-None-Match returns body", func(t *testing.T) {
+		req := httptest.NewRequest("GET", "/pools", nil)
+		req.Header.Set("If-None-Match", `"stale"`)
+		w := httptest.NewRecorder()
+		r.ServeHTTP(w, req)
+
+		assert.Equal(t, http.StatusOK, w.Code)
+		assert.JSONEq(t, `{"pools":["a","b"]}`, w.Body.String())
+	})
+
+	t.Run("non-200 responses are not tagged", func(t *testing.T) {
+		w := httptest.NewRecorder()
+		r.ServeHTTP(w, httptest.NewRequest("GET", "/missing", nil))
+
+		assert.Equal(t, http.StatusNotFound, w.Code)
+		assert.Empty(t, w.Header().Get("ETag"))
+		assert.Contains(t, w.Body.String(), "not found")
+	})
+}
+
+func TestETag_RecoveredPanic(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+
+	r := gin.New()
+	r.Use(gin.CustomRecovery(func(c *gin.Context, recovered interface{}) {
+		c.AbortWithStatusJSON(http.StatusInternalServerError, gin.H{"error": "internal server error"})
+	}))
+	r.GET("/panic", ETag(), func(c *gin.Context) {
+		panic("boom")
+	})
+
+	w := httptest.NewRecorder()
+	r.ServeHTTP(w, httptest.NewRequest("GET", "/panic", nil))
+
+	assert.Equal(t, http.StatusInternalServerError, w.Code)
+	assert.JSONEq(t, `{"error":"internal server error"}`, w.Body.String())
+	assert.Empty(t, w.Header().Get("ETag"))
+}
@@ -0,0 +1,119 @@
+package middleware
+
+import (
+	"compress/gzip"
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+
+	"github.com/gin-gonic/gin"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestGzip(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+
+	large := strings.Repeat("browsergrid ", 200)
+
+	r := gin.New()
+	r.Use(Gzip(1024))
+	r.GET("/large", func(c *gin.Context) {
+		c.String(http.StatusOK, large)
+	})
+	r.GET("/small", func(c *gin.Context) {
+		c.JSON(http.StatusOK, gin.H{"status": "ok"})
+	})
+	r.GET("/image", func(c *gin.Context) {
+		c.Data(http.StatusOK, "image/png", []byte(large))
+	})
+	r.GET("/partial", func(c *gin.Context) {
+		c.Header("Content-Range", "bytes 0-2399/5000")
+		c.Data(http.StatusPartialContent, "text/plain; charset=utf-8", []byte(large))
+	})
+	r.GET("/stream", func(c *gin.Context) {
+		c.Writer.WriteString("first\n")
+		c.Writer.Flush()
+		c.Writer.WriteString(large)
+	})
+
+	get := func(path string, acceptGzip bool) *httptest.ResponseRecorder {
+		req := httptest.NewRequest("GET", path, nil)
+		if acceptGzip {
+			req.Header.Set("Accept-Encoding", "gzip, deflate")
+		}
+		w := httptest.NewRecorder()
+		r.ServeHTTP(w, req)
+		return w
+	}
+
+	t.Run("large body is compressed", func(t *testing.T) {
+		w := get("/large", true)
+		require.Equal(t, http.StatusOK, w.Code)
+		assert.Equal(t, "gzip", w.Header().Get("Content-Encoding"))
+		assert.Contains(t, w.Header().Get("Vary"), "Accept-Encoding")
+		assert.Less(t, w.Body.Len(), len(large))
+
+		gz, err := gzip.NewReader(w.Body)
+		require.NoError(t, err)
+		body, err := io.ReadAll(gz)
+		require.NoError(t, err)
+		assert.Equal(t, large, string(body))
+	})
+
+	t.Run("small body is sent as is", func(t *testing.T) {
+		w := get("/small", true)
+		assert.Empty(t, w.Header().Get("Content-Encoding"))
+		assert.JSONEq(t, `{"status":"ok"}`, w.Body.String())
+	})
+
+	t.Run("client without gzip gets plain body", func(t *testing.T) {
+		w := get("/large", false)
+		assert.Empty(t, w.Header().Get("Content-Encoding"))
+		assert.Equal(t, large, w.Body.String())
+	})
+
+	t.Run("non-text content type is sent as is", func(t *testing.T) {
+		w := get("/image", true)
+		assert.Empty(t, w.Header().Get("Content-Encoding"))
+		assert.Equal(t, large, w.Body.String())
+	})
+
+	t.Run("partial response is sent as is", func(t *testing.T) {
+		w := get("/partial", true)
+		assert.Equal(t, http.StatusPartialContent, w.Code)
+		assert.Empty(t, w.Header().Get("Content-Encoding"))
+		assert.Equal(t, large, w.Body.String())
+	})
+
+	t.Run("early flush leaves stream uncompressed", func(t *testing.T) {
+		w := get("/stream", true)
+		assert.Empty(t, w.Header().Get("Content-Encoding"))
+		assert.Equal(t, "first\n"+large, w.Body.String())
+	})
+}
+
+func TestGzip_RecoveredPanic(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+
+	r := gin.New()
+	r.Use(
+		gin.CustomRecovery(func(c *gin.Context, recovered interface{}) {
+			c.AbortWithStatusJSON(http.StatusInternalServerError, gin.H{"error": "internal server error"})
+		}),
+		Gzip(1024),
+	)
+	r.GET("/panic", func(c *gin.Context) {
+		panic("boom")
+	})
+
+	req := httptest.NewRequest("GET", "/panic", nil)
+	req.Header.Set("Accept-Encoding", "gzip")
+	w := httptest.NewRecorder()
+	r.ServeHTTP(w, req)
+
+	assert.Equal(t, http.StatusInternalServerError, w.Code)
+	assert.JSONEq(t, `{"error":"internal server error"}`, w.Body.String())
+}
@@ -19,22 +19,34 @@ type Reconciler struct {
 	wpStore    *workpool.Store
 	sessStore  *sessions.Store
 	taskClient *asynq.Client
+	inspector  *asynq.Inspector
 	redisOpt   asynq.RedisClientOpt
+	stats      *statsCache
 
 	tickInterval time.Duration
 }
 
+// poolStatsTTL is how long GetPoolStats results are reused
+const poolStatsTTL = 5 * time.Second
+
 func NewReconciler(db *gorm.DB, taskClient *asynq.Client, redisOpt asynq.RedisClientOpt) *Reconciler {
 	return &Reconciler{
 		db:           db,
 		wpStore:      workpool.NewStore(db),
 		sessStore:    sessions.NewStore(db),
 		taskClient:   taskClient,
+		inspector:    asynq.NewInspector(redisOpt),
 		redisOpt:     redisOpt,
+		stats:        newStatsCache(poolStatsTTL),
 		tickInterval: 30 * time.Second,
 	}
 }
 
+// Close releases the Redis connections held by the reconciler's inspector.
+func (r *Reconciler) Close() error {
+	return r.inspector.Close()
+}
+
 func (r *Reconciler) Start(ctx context.Context) error {
 	log.Println("[RECONCILER] Starting pool reconciler...")
 
@@ -58,40 +70,46 @@ func (r *Reconciler) Start(ctx context.Context) error {
 	}
 }
 
+// reconcileColumns are the work pool columns a reconcile pass reads. The
+// JSON defaults and descriptive fields are left in the database.
+var reconcileColumns = []string{
+	"id", "name", "paused", "auto_scale", "min_size", "max_concurrency", "max_idle_time",
+}
+
 func (r *Reconciler) reconcile(ctx context.Context) error {
-	pools, err := r.wpStore.ListWorkPools(ctx, nil)
+	var pools []workpool.WorkPool
+	err := r.db.WithContext(ctx).
+		Select(reconcileColumns).
+		Where("paused = ? AND auto_scale = ?", false, true).
+		Find(&pools).Error
 	if err != nil {
 		return err
 	}
-
-	for _, pool := range pools {
-		if pool.Paused || !pool.AutoScale {
-			continue
-		}
-
-		if err := r.reconcilePool(ctx, &pool); err != nil {
-			log.Printf("[RECONCILER] Error reconciling pool %s: %v", pool.Name, err)
-		}
+	if len(pools) == 0 {
+		return nil
 	}
 
-	return nil
-}
+	poolIDs := make([]uuid.UUID, len(pools))
+	for i, pool := range pools {
+		poolIDs[i] = pool.ID
+	}
 
-func (r *Reconciler) reconcilePool(ctx context.Context, pool *workpool.WorkPool) error {
-	activeCount, err := r.countSessionsByStatus(ctx, pool.ID, []sessions.SessionStatus{
-		sessions.StatusStarting, sessions.StatusRunning, sessions.StatusIdle,
-	})
+	counts, err := r.countActiveAndPendingByPool(ctx, poolIDs)
 	if err != nil {
 		return err
 	}
 
-	pendingCount, err := r.countSessionsByStatus(ctx, pool.ID, []sessions.SessionStatus{
-		sessions.StatusPending,
-	})
-	if err != nil {
-		return err
+	for _, pool := range pools {
+		c := counts[pool.ID]
+		if err := r.reconcilePoolWithCounts(ctx, &pool, c.Active, c.Pending); err != nil {
+			log.Printf("[RECONCILER] Error reconciling pool %s: %v", pool.Name, err)
+		}
 	}
 
+	return nil
+}
+
+func (r *Reconciler) reconcilePoolWithCounts(ctx context.Context, pool *workpool.WorkPool, activeCount, pendingCount int) error {
 	totalSessions := activeCount + pendingCount
 
 	log.Printf("[RECONCILER] Pool %s: active=%d, pending=%d, min_size=%d, max=%d",
@@ -135,23 +153,16 @@ func (r *Reconciler) reconcilePool(ctx context.Context, pool *workpool.WorkPool)
 		idleTimeout := time.Duration(pool.MaxIdleTime) * time.Second
 		cutoff := time.Now().Add(-idleTimeout)
 
-		status := sessions.StatusIdle
-		sessionsList, err := r.sessStore.ListSessions(ctx, &status, nil, &cutoff, 0, 1000)
+		idleIDs, err := r.listIdleSessionIDs(ctx, pool.ID, cutoff)
 		if err != nil {
 			return err
 		}
-		var idleSessions []sessions.Session
-		for _, sess := range sessionsList {
-			if sess.WorkPoolID != nil && *sess.WorkPoolID == pool.ID {
-				idleSessions = append(idleSessions, sess)
-			}
-		}
 
-		for _, sess := range idleSessions {
-			log.Printf("[RECONCILER] Session %s has been idle for too long, terminating", sess.ID)
+		for _, id := range idleIDs {
+			log.Printf("[RECONCILER] Session %s has been idle for too long, terminating", id)
 
 			stopPayload := tasks.SessionStopPayload{
-				SessionID: sess.ID,
+				SessionID: id,
 				Reason:    "idle_timeout",
 			}
 
@@ -187,46 +198,100 @@ func (r *Reconciler) scheduleCleanupTasks() error {
 	return nil
 }
 
-func (r *Reconciler) countSessionsByStatus(ctx context.Context, poolID uuid.UUID, statuses []sessions.SessionStatus) (int, error) {
-	var count int64
+// maxIdleSessionsPerPass bounds how many idle sessions a single reconcile
+// pass will stop for one pool.
+const maxIdleSessionsPerPass = 1000
+
+// listIdleSessionIDs returns the IDs of a pool's sessions that have been idle
+// since before cutoff. The filter runs entirely in SQL and is served by the
+// idx_sessions_idle partial index.
+func (r *Reconciler) listIdleSessionIDs(ctx context.Context, poolID uuid.UUID, cutoff time.Time) ([]uuid.UUID, error) {
+	var ids []uuid.UUID
 	err := r.db.WithContext(ctx).Model(&sessions.Session{}).
-		Where("work_pool_id = ? AND status IN ?", poolID, statuses).
-		Count(&count).Error
+		Where("work_pool_id = ? AND status = ? AND updated_at < ?", poolID, sessions.StatusIdle, cutoff).
+		Limit(maxIdleSessionsPerPass).
+		Pluck("id", &ids).Error
 
-	return int(count), err
+	return ids, err
 }
 
+// activeStatuses are the statuses that count against a pool's concurrency.
+var activeStatuses = []sessions.SessionStatus{
+	sessions.StatusStarting, sessions.StatusRunning, sessions.StatusIdle,
+}
+
+// poolSessionCounts holds a pool's active and pending session counts.
+type poolSessionCounts struct {
+	Active  int
+	Pending int
+}
+
+// countActiveAndPendingByPool returns active and pending counts for every
+// pool in poolIDs from one grouped query, so a reconcile pass costs one
+// round trip for counts regardless of how many pools it visits. Pools with
+// no sessions are absent from the map and read as zero counts.
+func (r *Reconciler) countActiveAndPendingByPool(ctx context.Context, poolIDs []uuid.UUID) (map[uuid.UUID]poolSessionCounts, error) {
+	var rows []struct {
+		WorkPoolID uuid.UUID
+		Active     int
+		Pending    int
+	}
+	err := r.db.WithContext(ctx).Model(&sessions.Session{}).
+		Select("work_pool_id, count(*) FILTER (WHERE status IN ?) AS active, count(*) FILTER (WHERE status = ?) AS pending",
+			activeStatuses, sessions.StatusPending).
+		Where("work_pool_id IN ?", poolIDs).
+		Group("work_pool_id").
+		Scan(&rows).Error
+	if err != nil {
+		return nil, err
+	}
+
+	counts := make(map[uuid.UUID]poolSessionCounts, len(rows))
+	for _, row := range rows {
+		counts[row.WorkPoolID] = poolSessionCounts{Active: row.Active, Pending: row.Pending}
+	}
+	return counts, nil
+}
+
+// GetPoolStats returns session, queue and scaling stats for a pool. Results
+// are cached for poolStatsTTL; each call gets its own copy.
 func (r *Reconciler) GetPoolStats(ctx context.Context, poolID uuid.UUID) (*PoolStats, error) {
+	if stats, ok := r.stats.get(poolID); ok {
+		return stats, nil
+	}
+
 	pool, err := r.wpStore.GetWorkPool(ctx, poolID)
 	if err != nil {
 		return nil, err
 	}
 
-	inspector := asynq.NewInspector(r.redisOpt)
-
 	queueName := getQueueNameForProvider(pool.Provider)
-	queueInfo, err := inspector.GetQueueInfo(queueName)
-	if err != nil {
+	queueInfo, err := r.inspector.GetQueueInfo(queueName)
+	queueInfoOK := err == nil
+	if !queueInfoOK {
 		log.Printf("[RECONCILER] Failed to get queue info: %v", err)
+		queueInfo = &asynq.QueueInfo{}
 	}
 
-	statusCounts := make(map[sessions.SessionStatus]int)
-	statuses := []sessions.SessionStatus{
-		sessions.StatusPending, sessions.StatusStarting, sessions.StatusRunning,
-		sessions.StatusIdle, sessions.StatusCompleted, sessions.StatusFailed,
-		sessions.StatusExpired, sessions.StatusCrashed, sessions.StatusTimedOut,
-		sessions.StatusTerminated,
+	statusCounts := make(map[sessions.SessionStatus]int, len(statsStatuses))
+	for _, status := range statsStatuses {
+		statusCounts[status] = 0
 	}
 
-	for _, status := range statuses {
-		var count int64
-		err := r.db.WithContext(ctx).Model(&sessions.Session{}).
-			Where("work_pool_id = ? AND status = ?", poolID, status).
-			Count(&count).Error
-		if err != nil {
-			return nil, err
-		}
-		statusCounts[status] = int(count)
+	var rows []struct {
+		Status sessions.SessionStatus
+		Count  int
+	}
+	err = r.db.WithContext(ctx).Model(&sessions.Session{}).
+		Select("status, count(*) AS count").
+		Where("work_pool_id = ? AND status IN ?", poolID, statsStatuses).
+		Group("status").
+		Scan(&rows).Error
+	if err != nil {
+		return nil, err
+	}
+	for _, row := range rows {
+		statusCounts[row.Status] = row.Count
 	}
 
 	activeSessions := statusCounts[sessions.StatusStarting] +
@@ -259,9 +324,22 @@ func (r *Reconciler) GetPoolStats(ctx context.Context, poolID uuid.UUID) (*PoolS
 		},
 	}
 
+	// Zeroed queue stats from a transient Redis error shouldn't be served
+	// for the whole TTL, so only complete results are cached.
+	if queueInfoOK {
+		r.stats.set(poolID, stats)
+	}
 	return stats, nil
 }
 
+// statsStatuses are the statuses reported in PoolStats.SessionsByStatus
+var statsStatuses = []sessions.SessionStatus{
+	sessions.StatusPending, sessions.StatusStarting, sessions.StatusRunning,
+	sessions.StatusIdle, sessions.StatusCompleted, sessions.StatusFailed,
+	sessions.StatusExpired, sessions.StatusCrashed, sessions.StatusTimedOut,
+	sessions.StatusTerminated,
+}
+
 type PoolStats struct {
 	Pool               workpool.WorkPool              `json:"pool"`
 	SessionsByStatus   map[sessions.SessionStatus]int `json:"sessions_by_status"`
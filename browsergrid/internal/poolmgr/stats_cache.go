@@ -0,0 +1,83 @@
+package poolmgr
+
+import (
+	"sync"
+	"time"
+
+	"github.com/google/uuid"
+	"gorm.io/datatypes"
+
+	"github.com/autocrawlerHQ/browsergrid/internal/sessions"
+)
+
+// statsCache holds recently computed pool stats so dashboards polling the
+// same pool every few seconds do not rerun the aggregate each time. It stores
+// and hands out copies, and drops expired entries whenever it is written.
+type statsCache struct {
+	ttl time.Duration
+
+	mu      sync.Mutex
+	entries map[uuid.UUID]statsEntry
+}
+
+type statsEntry struct {
+	stats     *PoolStats
+	expiresAt time.Time
+}
+
+func newStatsCache(ttl time.Duration) *statsCache {
+	return &statsCache{
+		ttl:     ttl,
+		entries: make(map[uuid.UUID]statsEntry),
+	}
+}
+
+func (c *statsCache) get(poolID uuid.UUID) (*PoolStats, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	entry, ok := c.entries[poolID]
+	if !ok {
+		return nil, false
+	}
+	if time.Now().After(entry.expiresAt) {
+		delete(c.entries, poolID)
+		return nil, false
+	}
+	return entry.stats.clone(), true
+}
+
+func (c *statsCache) set(poolID uuid.UUID, stats *PoolStats) {
+	if c.ttl <= 0 {
+		return
+	}
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	now := time.Now()
+	for id, entry := range c.entries {
+		if now.After(entry.expiresAt) {
+			delete(c.entries, id)
+		}
+	}
+	c.entries[poolID] = statsEntry{stats: stats.clone(), expiresAt: now.Add(c.ttl)}
+}
+
+// clone deep-copies stats so callers of the cache can't change what other
+// callers see through the shared map and slices.
+func (s *PoolStats) clone() *PoolStats {
+	out := *s
+	out.SessionsByStatus = make(map[sessions.SessionStatus]int, len(s.SessionsByStatus))
+	for status, count := range s.SessionsByStatus {
+		out.SessionsByStatus[status] = count
+	}
+	if s.Pool.DefaultEnv != nil {
+		out.Pool.DefaultEnv = append(datatypes.JSON(nil), s.Pool.DefaultEnv...)
+	}
+	if s.Pool.DefaultImage != nil {
+		image := *s.Pool.DefaultImage
+		out.Pool.DefaultImage = &image
+	}
+	return &out
+}
@@ -148,7 +148,7 @@ func TestNewReconciler(t *testing.T) {
 	assert.Equal(t, 30*time.Second, reconciler.tickInterval)
 }
 
-func TestReconciler_CountSessionsByStatus(t *testing.T) {
+func TestReconciler_CountActiveAndPending(t *testing.T) {
 	reconciler := setupTestReconciler(t)
 	defer reconciler.taskClient.Close()
 	ctx := context.Background()
@@ -161,50 +161,49 @@ func TestReconciler_CountSessionsByStatus(t *testing.T) {
 	err := reconciler.wpStore.CreateWorkPool(ctx, pool)
 	require.NoError(t, err)
 
-	testSessions := []*sessions.Session{
-		createTestSession(pool.ID, sessions.StatusPending),
-		createTestSession(pool.ID, sessions.StatusPending),
-		createTestSession(pool.ID, sessions.StatusRunning),
-		createTestSession(pool.ID, sessions.StatusCompleted),
-	}
-
-	for _, sess := range testSessions {
-		err := reconciler.sessStore.CreateSession(ctx, sess)
+	for _, status := range []sessions.SessionStatus{
+		sessions.StatusPending,
+		sessions.StatusPending,
+		sessions.StatusStarting,
+		sessions.StatusRunning,
+		sessions.StatusIdle,
+		sessions.StatusCompleted,
+	} {
+		err := reconciler.sessStore.CreateSession(ctx, createTestSession(pool.ID, status))
 		require.NoError(t, err)
 	}
 
-	tests := []struct {
-		name     string
-		statuses []sessions.SessionStatus
-		expected int
-	}{
-		{
-			name:     "count pending sessions",
-			statuses: []sessions.SessionStatus{sessions.StatusPending},
-			expected: 2,
-		},
-		{
-			name:     "count active sessions",
-			statuses: []sessions.SessionStatus{sessions.StatusStarting, sessions.StatusRunning, sessions.StatusIdle},
-			expected: 1,
-		},
-		{
-			name:     "count all sessions",
-			statuses: []sessions.SessionStatus{sessions.StatusPending, sessions.StatusRunning, sessions.StatusCompleted},
-			expected: 4,
-		},
-	}
+	counts, err := reconciler.countActiveAndPendingByPool(ctx, []uuid.UUID{pool.ID})
+	assert.NoError(t, err)
+	assert.Equal(t, poolSessionCounts{Active: 3, Pending: 2}, counts[pool.ID])
+}
 
-	for _, tt := range tests {
-		t.Run(tt.name, func(t *testing.T) {
-			count, err := reconciler.countSessionsByStatus(ctx, pool.ID, tt.statuses)
-			assert.NoError(t, err)
-			assert.Equal(t, tt.expected, count)
-		})
+func TestReconciler_CountActiveAndPendingByPool(t *testing.T) {
+	reconciler := setupTestReconciler(t)
+	defer reconciler.taskClient.Close()
+	ctx := context.Background()
+
+	busy := &workpool.WorkPool{Name: "busy-pool", Provider: workpool.ProviderDocker, MaxConcurrency: 10}
+	empty := &workpool.WorkPool{Name: "empty-pool", Provider: workpool.ProviderDocker, MaxConcurrency: 10}
+	require.NoError(t, reconciler.wpStore.CreateWorkPool(ctx, busy))
+	require.NoError(t, reconciler.wpStore.CreateWorkPool(ctx, empty))
+
+	for _, status := range []sessions.SessionStatus{
+		sessions.StatusPending,
+		sessions.StatusRunning,
+		sessions.StatusIdle,
+		sessions.StatusFailed,
+	} {
+		require.NoError(t, reconciler.sessStore.CreateSession(ctx, createTestSession(busy.ID, status)))
 	}
+
+	counts, err := reconciler.countActiveAndPendingByPool(ctx, []uuid.UUID{busy.ID, empty.ID})
+	require.NoError(t, err)
+	assert.Equal(t, poolSessionCounts{Active: 2, Pending: 1}, counts[busy.ID])
+	assert.Equal(t, poolSessionCounts{}, counts[empty.ID])
 }
 
-func TestReconciler_ReconcilePool(t *testing.T) {
+func TestReconciler_Reconcile(t *testing.T) {
 	reconciler := setupTestReconciler(t)
 	defer reconciler.taskClient.Close()
 	ctx := context.Background()
@@ -278,7 +277,7 @@ func TestReconciler_ReconcilePool(t *testing.T) {
 				require.NoError(t, err)
 			}
 
-			err = reconciler.reconcilePool(ctx, tt.pool)
+			err = reconciler.reconcile(ctx)
 			assert.NoError(t, err)
 
 			time.Sleep(100 * time.Millisecond)
@@ -290,10 +289,13 @@ func TestReconciler_ReconcilePool(t *testing.T) {
 			var scalePayload tasks.PoolScalePayload
 
 			for _, task := range pendingTasks {
-				if task.Type == tasks.TypePoolScale {
+				if task.Type != tasks.TypePoolScale {
+					continue
+				}
+				err = json.Unmarshal(task.Payload, &scalePayload)
+				require.NoError(t, err)
+				if scalePayload.WorkPoolID == tt.pool.ID {
 					foundScaleTask = true
-					err = json.Unmarshal(task.Payload, &scalePayload)
-					require.NoError(t, err)
 					break
 				}
 			}
@@ -313,6 +315,42 @@ func TestReconciler_ReconcilePool(t *testing.T) {
 	}
 }
 
+func TestReconciler_ReconcilePoolWithCounts_CapsAtMaxConcurrency(t *testing.T) {
+	reconciler := setupTestReconciler(t)
+	defer reconciler.taskClient.Close()
+	ctx := context.Background()
+
+	inspector := asynq.NewInspector(asynq.RedisClientOpt{Addr: testRedisAddr})
+	inspector.DeleteAllPendingTasks("low")
+
+	pool := &workpool.WorkPool{
+		Name:           "capped-pool",
+		Provider:       workpool.ProviderDocker,
+		MaxConcurrency: 4,
+		MinSize:        10,
+		AutoScale:      true,
+	}
+	require.NoError(t, reconciler.wpStore.CreateWorkPool(ctx, pool))
+
+	require.NoError(t, reconciler.reconcilePoolWithCounts(ctx, pool, 1, 1))
+
+	pendingTasks, err := inspector.ListPendingTasks("low")
+	require.NoError(t, err)
+
+	var scalePayload tasks.PoolScalePayload
+	found := false
+	for _, task := range pendingTasks {
+		if task.Type == tasks.TypePoolScale {
+			require.NoError(t, json.Unmarshal(task.Payload, &scalePayload))
+			found = true
+			break
+		}
+	}
+	require.True(t, found, "expected a pool scale task")
+	assert.Equal(t, pool.ID, scalePayload.WorkPoolID)
+	assert.Equal(t, 2, scalePayload.DesiredSessions)
+}
+
 func TestReconciler_HandleIdleSessions(t *testing.T) {
 	reconciler := setupTestReconciler(t)
 	defer reconciler.taskClient.Close()
@@ -341,7 +379,7 @@ func TestReconciler_HandleIdleSessions(t *testing.T) {
 
 	inspector.DeleteAllPendingTasks("default")
 
-	err = reconciler.reconcilePool(ctx, pool)
+	err = reconciler.reconcile(ctx)
 	assert.NoError(t, err)
 
 	time.Sleep(100 * time.Millisecond)
@@ -366,6 +404,35 @@ func TestReconciler_HandleIdleSessions(t *testing.T) {
 	assert.True(t, foundStopTask, "Expected stop task for idle session")
 }
 
+func TestReconciler_ListIdleSessionIDs(t *testing.T) {
+	reconciler := setupTestReconciler(t)
+	defer reconciler.taskClient.Close()
+	ctx := context.Background()
+
+	poolID := uuid.New()
+	otherPoolID := uuid.New()
+	stale := time.Now().Add(-2 * time.Minute)
+
+	oldIdle := createTestSession(poolID, sessions.StatusIdle)
+	oldIdle.UpdatedAt = stale
+	require.NoError(t, reconciler.sessStore.CreateSession(ctx, oldIdle))
+
+	recentIdle := createTestSession(poolID, sessions.StatusIdle)
+	require.NoError(t, reconciler.sessStore.CreateSession(ctx, recentIdle))
+
+	oldRunning := createTestSession(poolID, sessions.StatusRunning)
+	oldRunning.UpdatedAt = stale
+	require.NoError(t, reconciler.sessStore.CreateSession(ctx, oldRunning))
+
+	otherPoolIdle := createTestSession(otherPoolID, sessions.StatusIdle)
+	otherPoolIdle.UpdatedAt = stale
+	require.NoError(t, reconciler.sessStore.CreateSession(ctx, otherPoolIdle))
+
+	ids, err := reconciler.listIdleSessionIDs(ctx, poolID, time.Now().Add(-time.Minute))
+	require.NoError(t, err)
+	assert.Equal(t, []uuid.UUID{oldIdle.ID}, ids)
+}
+
 func TestReconciler_GetPoolStats(t *testing.T) {
 	db := setupTestDB(t)
 	client := setupTestRedisClient(t)
@@ -438,6 +505,62 @@ func TestReconciler_GetPoolStats_NonExistentPool(t *testing.T) {
 	assert.Nil(t, stats)
 }
 
+func TestReconciler_GetPoolStats_Cached(t *testing.T) {
+	db := setupTestDB(t)
+	client := setupTestRedisClient(t)
+	defer client.Close()
+
+	reconciler := NewReconciler(db, client, asynq.RedisClientOpt{Addr: testRedisAddr})
+	ctx := context.Background()
+
+	pool := &workpool.WorkPool{
+		Name:           "test-pool",
+		Provider:       workpool.ProviderDocker,
+		MaxConcurrency: 10,
+	}
+	require.NoError(t, reconciler.wpStore.CreateWorkPool(ctx, pool))
+	require.NoError(t, reconciler.sessStore.CreateSession(ctx, createTestSession(pool.ID, sessions.StatusPending)))
+
+	first, err := reconciler.GetPoolStats(ctx, pool.ID)
+	require.NoError(t, err)
+	assert.Equal(t, 1, first.SessionsByStatus[sessions.StatusPending])
+
+	require.NoError(t, reconciler.sessStore.CreateSession(ctx, createTestSession(pool.ID, sessions.StatusPending)))
+
+	cached, err := reconciler.GetPoolStats(ctx, pool.ID)
+	require.NoError(t, err)
+	assert.Equal(t, 1, cached.SessionsByStatus[sessions.StatusPending], "stats within the TTL should come from the cache")
+	assert.NotSame(t, first, cached, "callers should get their own copy")
+
+	reconciler.stats = newStatsCache(0)
+	fresh, err := reconciler.GetPoolStats(ctx, pool.ID)
+	require.NoError(t, err)
+	assert.Equal(t, 2, fresh.SessionsByStatus[sessions.StatusPending])
+}
+
+func TestStatsCache(t *testing.T) {
+	cache := newStatsCache(time.Minute)
+	poolID := uuid.New()
+
+	stats := &PoolStats{SessionsByStatus: map[sessions.SessionStatus]int{sessions.StatusPending: 1}}
+	cache.set(poolID, stats)
+	stats.SessionsByStatus[sessions.StatusPending] = 5
+
+	got, ok := cache.get(poolID)
+	require.True(t, ok)
+	assert.Equal(t, 1, got.SessionsByStatus[sessions.StatusPending], "set should store a copy")
+
+	got.SessionsByStatus[sessions.StatusPending] = 7
+	again, ok := cache.get(poolID)
+	require.True(t, ok)
+	assert.Equal(t, 1, again.SessionsByStatus[sessions.StatusPending], "get should return a copy")
+
+	stalePool := uuid.New()
+	cache.entries[stalePool] = statsEntry{stats: stats, expiresAt: time.Now().Add(-time.Second)}
+	cache.set(uuid.New(), stats)
+	assert.NotContains(t, cache.entries, stalePool, "set should sweep expired entries")
+}
+
 func TestReconciler_Start_StopOnContext(t *testing.T) {
 	db := setupTestDB(t)
 	client := setupTestRedisClient(t)
@@ -1,6 +1,7 @@
 package profiles
 
 import (
+	"errors"
 	"fmt"
 	"github.com/autocrawlerHQ/browsergrid/internal/sessions"
 	"github.com/autocrawlerHQ/browsergrid/internal/storage"
@@ -156,6 +157,7 @@ func getProfile(deps Dependencies) gin.HandlerFunc {
 // @Success 200 {object} Profile "Updated profile"
 // @Failure 400 {object} ErrorResponse "Invalid request"
 // @Failure 404 {object} ErrorResponse "Profile not found"
+// @Failure 409 {object} ErrorResponse "Profile name already in use"
 // @Failure 500 {object} ErrorResponse "Internal server error"
 // @Router /api/v1/profiles/{id} [patch]
 func updateProfile(deps Dependencies) gin.HandlerFunc {
@@ -172,26 +174,9 @@ func updateProfile(deps Dependencies) gin.HandlerFunc {
 			return
 		}
 
-		// Check if profile exists first
-		_, err = deps.Store.GetProfile(c.Request.Context(), id)
-		if err != nil {
-			if err == gorm.ErrRecordNotFound {
-				c.JSON(http.StatusNotFound, gin.H{"error": "profile not found"})
-			} else {
-				c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
-			}
-			return
-		}
-
 		// Build updates map
 		updates := make(map[string]interface{})
 		if req.Name != nil {
-			// Check if new name is unique
-			existing, _ := deps.Store.GetProfileByName(c.Request.Context(), *req.Name)
-			if existing != nil && existing.ID != id {
-				c.JSON(http.StatusConflict, gin.H{"error": "profile with this name already exists"})
-				return
-			}
 			updates["name"] = *req.Name
 		}
 		if req.Description != nil {
@@ -203,15 +188,17 @@ func updateProfile(deps Dependencies) gin.HandlerFunc {
 			return
 		}
 
-		if err := deps.Store.UpdateProfile(c.Request.Context(), id, updates); err != nil {
-			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
-			return
-		}
-
-		// Get updated profile
-		profile, err := deps.Store.GetProfile(c.Request.Context(), id)
+		// Existence and name uniqueness are checked by the UPDATE itself
+		profile, err := deps.Store.UpdateProfileReturning(c.Request.Context(), id, updates)
 		if err != nil {
-			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+			switch {
+			case errors.Is(err, gorm.ErrRecordNotFound):
+				c.JSON(http.StatusNotFound, gin.H{"error": "profile not found"})
+			case errors.Is(err, ErrProfileNameTaken):
+				c.JSON(http.StatusConflict, gin.H{"error": err.Error()})
+			default:
+				c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+			}
 			return
 		}
 
@@ -305,9 +292,11 @@ func importProfile(deps Dependencies) gin.HandlerFunc {
 			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 			return
 		}
-		_ = deps.Store.UpdateProfileSize(c.Request.Context(), profile.ID, header.Size)
+		// The size update returns the stored row, so no separate read is needed
+		if updated, err := deps.Store.UpdateProfileSize(c.Request.Context(), profile.ID, header.Size); err == nil {
+			profile = updated
+		}
 
-		profile, _ = deps.Store.GetProfile(c.Request.Context(), profile.ID)
 		c.JSON(http.StatusCreated, profile)
 	}
 }
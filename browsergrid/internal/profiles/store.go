@@ -2,15 +2,20 @@ package profiles
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"time"
 
 	"github.com/google/uuid"
 	"gorm.io/gorm"
+	"gorm.io/gorm/clause"
 
 	"github.com/autocrawlerHQ/browsergrid/internal/sessions"
 )
 
+// ErrProfileNameTaken is returned when a rename collides with another profile
+var ErrProfileNameTaken = errors.New("profile with this name already exists")
+
 // Store provides database operations for profiles
 type Store struct {
 	db *gorm.DB
@@ -29,13 +34,23 @@ func (s *Store) CreateProfile(ctx context.Context, profile *Profile) error {
 // GetProfile retrieves a profile by ID
 func (s *Store) GetProfile(ctx context.Context, id uuid.UUID) (*Profile, error) {
 	var profile Profile
-	err := s.db.WithContext(ctx).First(&profile, "id = ?", id).Error
+	err := s.db.WithContext(ctx).Take(&profile, "id = ?", id).Error
 	if err != nil {
 		return nil, err
 	}
 	return &profile, nil
 }
 
+// ProfileExists reports whether a profile with the given ID exists without
+// loading the row
+func (s *Store) ProfileExists(ctx context.Context, id uuid.UUID) (bool, error) {
+	var exists bool
+	err := s.db.WithContext(ctx).
+		Raw("SELECT EXISTS (SELECT 1 FROM profiles WHERE id = ?)", id).
+		Scan(&exists).Error
+	return exists, err
+}
+
 // GetProfileByName retrieves a profile by name
 func (s *Store) GetProfileByName(ctx context.Context, name string) (*Profile, error) {
 	var profile Profile
@@ -76,37 +91,73 @@ func (s *Store) UpdateProfile(ctx context.Context, id uuid.UUID, updates map[str
 		Updates(updates).Error
 }
 
+// UpdateProfileReturning applies updates and returns the updated profile in a
+// single statement. A name change is checked for collisions in the same
+// UPDATE, so the happy path costs one round trip; the failure path looks up
+// whether the profile is missing or the name is taken.
+func (s *Store) UpdateProfileReturning(ctx context.Context, id uuid.UUID, updates map[string]interface{}) (*Profile, error) {
+	updates["updated_at"] = time.Now()
+
+	var profile Profile
+	query := s.db.WithContext(ctx).Model(&profile).
+		Clauses(clause.Returning{}).
+		Where("id = ?", id)
+	if name, ok := updates["name"]; ok {
+		query = query.Where("NOT EXISTS (SELECT 1 FROM profiles other WHERE other.name = ? AND other.id <> ?)", name, id)
+	}
+
+	result := query.Updates(updates)
+	if result.Error != nil {
+		return nil, result.Error
+	}
+	if result.RowsAffected == 0 {
+		exists, err := s.ProfileExists(ctx, id)
+		if err != nil {
+			return nil, err
+		}
+		if !exists {
+			return nil, gorm.ErrRecordNotFound
+		}
+		return nil, ErrProfileNameTaken
+	}
+	return &profile, nil
+}
+
 // DeleteProfile deletes a profile from the database
 func (s *Store) DeleteProfile(ctx context.Context, id uuid.UUID) error {
-	// Check if profile has active sessions
-	var count int64
-	err := s.db.WithContext(ctx).Model(&sessions.Session{}).
-		Where("profile_id = ? AND status NOT IN (?)", id, []sessions.SessionStatus{
-			sessions.StatusCompleted,
-			sessions.StatusFailed,
-			sessions.StatusExpired,
-			sessions.StatusCrashed,
-			sessions.StatusTimedOut,
-			sessions.StatusTerminated,
-		}).
-		Count(&count).Error
+	// Check if profile has active sessions; EXISTS stops at the first match
+	// instead of counting every session that ever used the profile
+	var inUse bool
+	err := s.db.WithContext(ctx).
+		Raw("SELECT EXISTS (SELECT 1 FROM sessions WHERE profile_id = ? AND status NOT IN ?)", id, sessions.TerminalStatuses).
+		Scan(&inUse).Error
 
 	if err != nil {
 		return err
 	}
 
-	if count > 0 {
+	if inUse {
 		return gorm.ErrInvalidData
 	}
 
 	return s.db.WithContext(ctx).Delete(&Profile{}, "id = ?", id).Error
 }
 
-// UpdateProfileSize updates the size of a profile
-func (s *Store) UpdateProfileSize(ctx context.Context, id uuid.UUID, sizeBytes int64) error {
-	return s.db.WithContext(ctx).Model(&Profile{}).
+// UpdateProfileSize updates the size of a profile and returns the updated row
+// in the same statement
+func (s *Store) UpdateProfileSize(ctx context.Context, id uuid.UUID, sizeBytes int64) (*Profile, error) {
+	var profile Profile
+	result := s.db.WithContext(ctx).Model(&profile).
+		Clauses(clause.Returning{}).
 		Where("id = ?", id).
-		Update("size_bytes", sizeBytes).Error
+		Update("size_bytes", sizeBytes)
+	if result.Error != nil {
+		return nil, result.Error
+	}
+	if result.RowsAffected == 0 {
+		return nil, gorm.ErrRecordNotFound
+	}
+	return &profile, nil
 }
 
 // UpdateProfileLastUsed updates the last used timestamp
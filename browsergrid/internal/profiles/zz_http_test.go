@@ -481,6 +481,7 @@ func TestImportProfile(t *testing.T) {
 				assert.Equal(t, tt.formData["name"], response.Name)
 				assert.Equal(t, tt.formData["description"], response.Description)
 				assert.Equal(t, sessions.Browser(tt.formData["browser"]), response.Browser)
+				assert.Greater(t, response.SizeBytes, int64(0))
 			} else if tt.expectedError != "" {
 				var errorResp ErrorResponse
 				err := json.Unmarshal(w.Body.Bytes(), &errorResp)
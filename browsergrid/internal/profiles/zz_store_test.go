@@ -66,6 +66,26 @@ func TestStore_GetProfile(t *testing.T) {
 	assert.Equal(t, profile.Browser, retrieved.Browser)
 }
 
+func TestStore_ProfileExists(t *testing.T) {
+	db := setupTestDB(t)
+	store := NewStore(db)
+	ctx := context.Background()
+
+	profile := &Profile{
+		Name:    "exists-profile",
+		Browser: sessions.BrowserChrome,
+	}
+	require.NoError(t, store.CreateProfile(ctx, profile))
+
+	exists, err := store.ProfileExists(ctx, profile.ID)
+	require.NoError(t, err)
+	assert.True(t, exists)
+
+	exists, err = store.ProfileExists(ctx, uuid.New())
+	require.NoError(t, err)
+	assert.False(t, exists)
+}
+
 func TestStore_GetProfileByName(t *testing.T) {
 	db := setupTestDB(t)
 	store := NewStore(db)
@@ -165,6 +185,36 @@ func TestStore_UpdateProfile(t *testing.T) {
 	assert.True(t, updated.UpdatedAt.After(originalUpdatedAt))
 }
 
+func TestStore_UpdateProfileReturning(t *testing.T) {
+	db := setupTestDB(t)
+	store := NewStore(db)
+	ctx := context.Background()
+
+	profile := &Profile{Name: "original", Browser: sessions.BrowserChrome}
+	require.NoError(t, store.CreateProfile(ctx, profile))
+	other := &Profile{Name: "taken", Browser: sessions.BrowserChrome}
+	require.NoError(t, store.CreateProfile(ctx, other))
+
+	updated, err := store.UpdateProfileReturning(ctx, profile.ID, map[string]interface{}{
+		"name":        "renamed",
+		"description": "Updated description",
+	})
+	require.NoError(t, err)
+	assert.Equal(t, profile.ID, updated.ID)
+	assert.Equal(t, "renamed", updated.Name)
+	assert.Equal(t, "Updated description", updated.Description)
+
+	// Keeping the current name is not a collision
+	_, err = store.UpdateProfileReturning(ctx, profile.ID, map[string]interface{}{"name": "renamed"})
+	require.NoError(t, err)
+
+	_, err = store.UpdateProfileReturning(ctx, profile.ID, map[string]interface{}{"name": "taken"})
+	assert.ErrorIs(t, err, ErrProfileNameTaken)
+
+	_, err = store.UpdateProfileReturning(ctx, uuid.New(), map[string]interface{}{"description": "x"})
+	assert.ErrorIs(t, err, gorm.ErrRecordNotFound)
+}
+
 func TestStore_DeleteProfile(t *testing.T) {
 	db := setupTestDB(t)
 	store := NewStore(db)
@@ -188,6 +238,32 @@ func TestStore_DeleteProfile(t *testing.T) {
 	assert.Error(t, err)
 }
 
+func TestStore_DeleteProfile_ActiveSession(t *testing.T) {
+	db := setupTestDB(t)
+	store := NewStore(db)
+	ctx := context.Background()
+
+	profile := &Profile{
+		Name:    "in-use-profile",
+		Browser: sessions.BrowserChrome,
+	}
+	require.NoError(t, store.CreateProfile(ctx, profile))
+
+	session := &sessions.Session{
+		ID:        uuid.New(),
+		Browser:   sessions.BrowserChrome,
+		Status:    sessions.StatusRunning,
+		ProfileID: &profile.ID,
+	}
+	require.NoError(t, db.Create(session).Error)
+
+	err := store.DeleteProfile(ctx, profile.ID)
+	assert.ErrorIs(t, err, gorm.ErrInvalidData)
+
+	require.NoError(t, db.Model(session).Update("status", sessions.StatusCompleted).Error)
+	assert.NoError(t, store.DeleteProfile(ctx, profile.ID))
+}
+
 func TestStore_UpdateProfileSize(t *testing.T) {
 	db := setupTestDB(t)
 	store := NewStore(db)
@@ -202,8 +278,14 @@ func TestStore_UpdateProfileSize(t *testing.T) {
 	require.NoError(t, err)
 
 	// Update size
-	err = store.UpdateProfileSize(ctx, profile.ID, 2048)
+	returned, err := store.UpdateProfileSize(ctx, profile.ID, 2048)
 	require.NoError(t, err)
+	assert.Equal(t, profile.ID, returned.ID)
+	assert.Equal(t, "test-profile", returned.Name)
+	assert.Equal(t, int64(2048), returned.SizeBytes)
+
+	_, err = store.UpdateProfileSize(ctx, uuid.New(), 2048)
+	assert.ErrorIs(t, err, gorm.ErrRecordNotFound)
 
 	// Verify size is updated
 	updated, err := store.GetProfile(ctx, profile.ID)
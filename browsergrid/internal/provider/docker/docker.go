@@ -13,6 +13,7 @@ import (
 	"path/filepath"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/docker/docker/api/types/container"
@@ -35,8 +36,15 @@ type DockerProvisioner struct {
 	defaultPort     int
 	healthTimeout   time.Duration
 	profileBasePath string // Base path for extracted profiles
+
+	imagesMu     sync.Mutex
+	imagesPulled map[string]time.Time // image -> when it was last ensured
 }
 
+// imageRefreshInterval is how long an image that was pulled (or found
+// locally) is trusted before Start checks the registry for it again.
+const imageRefreshInterval = 5 * time.Minute
+
 func NewDockerProvisioner(storageBackend storage.Backend) *DockerProvisioner {
 	cli, err := client.NewClientWithOpts(client.FromEnv, client.WithAPIVersionNegotiation())
 	if err != nil {
@@ -76,21 +84,7 @@ func (p *DockerProvisioner) Start(
 	}
 
 	browserCName := "bg-browser-" + shortID
-	browserEnv := []string{
-		fmt.Sprintf("HEADLESS=%t", sess.Headless),
-		fmt.Sprintf("RESOLUTION_WIDTH=%d", sess.Screen.Width),
-		fmt.Sprintf("RESOLUTION_HEIGHT=%d", sess.Screen.Height),
-	}
-
-	// Add custom environment variables
-	var envMap map[string]string
-	if sess.Environment != nil {
-		if err := json.Unmarshal(sess.Environment, &envMap); err == nil {
-			for k, v := range envMap {
-				browserEnv = append(browserEnv, k+"="+v)
-			}
-		}
-	}
+	browserEnv := containerEnv(sess)
 
 	// Prepare container configuration
 	containerConfig := &container.Config{
@@ -131,7 +125,7 @@ func (p *DockerProvisioner) Start(
 			})
 
 			// Add environment variable to indicate profile is mounted
-			browserEnv = append(browserEnv, fmt.Sprintf("BROWSERGRID_PROFILE_MOUNTED=true"))
+			browserEnv = append(browserEnv, "BROWSERGRID_PROFILE_MOUNTED=true")
 			containerConfig.Env = browserEnv
 		}
 	}
@@ -526,14 +520,17 @@ func (p *DockerProvisioner) chownRecursive(path string, uid, gid int) error {
 	})
 }
 
+// healthClient is shared by all health checks so keep-alive connections to
+// browser containers are reused between probes.
+var healthClient = &http.Client{Timeout: 3 * time.Second}
+
 func (p *DockerProvisioner) HealthCheck(ctx context.Context, sess *sessions.Session) error {
 	if sess.WSEndpoint == nil {
 		return fmt.Errorf("no ws endpoint recorded")
 	}
 	u := "http://" + wsToHTTP(*sess.WSEndpoint) + "/health"
-	cli := &http.Client{Timeout: 3 * time.Second}
 
-	resp, err := cli.Get(u)
+	resp, err := healthClient.Get(u)
 	if err != nil {
 		return err
 	}
@@ -577,21 +574,48 @@ func (p *DockerProvisioner) GetMetrics(
 }
 
 func (p *DockerProvisioner) ensureImage(ctx context.Context, imageName string) error {
-	// Always try to pull the latest image. If the pull fails because the image
+	// Every session of a pool uses the same image, so skip the registry
+	// round trip if it was ensured recently.
+	if p.imageRecentlyEnsured(imageName) {
+		return nil
+	}
+
+	// Try to pull the latest image. If the pull fails because the image
 	// isn't available in a remote registry, but it exists locally, continue.
 	rd, err := p.cli.ImagePull(ctx, imageName, image.PullOptions{})
 	if err != nil {
 		// If the image exists locally, ignore the pull error.
 		if _, inspectErr := p.cli.ImageInspect(ctx, imageName); inspectErr == nil {
+			p.markImageEnsured(imageName)
 			return nil
 		}
 		return fmt.Errorf("pull %s: %w", imageName, err)
 	}
 	defer rd.Close()
-	_, _ = io.Copy(io.Discard, rd)
+	if _, err := io.Copy(io.Discard, rd); err == nil {
+		p.markImageEnsured(imageName)
+	}
 	return nil
 }
 
+func (p *DockerProvisioner) imageRecentlyEnsured(imageName string) bool {
+	p.imagesMu.Lock()
+	defer p.imagesMu.Unlock()
+
+	at, ok := p.imagesPulled[imageName]
+	return ok && time.Since(at) < imageRefreshInterval
+}
+
+func (p *DockerProvisioner) markImageEnsured(imageName string) {
+	p.imagesMu.Lock()
+	defer p.imagesMu.Unlock()
+
+	if p.imagesPulled == nil {
+		p.imagesPulled = make(map[string]time.Time)
+	}
+	p.imagesPulled[imageName] = time.Now()
+}
+
 func (p *DockerProvisioner) waitForContainer(ctx context.Context, containerID string) (hostPort int, err error) {
 	deadline := time.Now().Add(p.healthTimeout)
 
@@ -657,6 +681,30 @@ func strPtr(s string) *string { return &s }
 
 func int64Ptr(i int64) *int64 { return &i }
 
+// containerEnv builds the browser container's environment in a single
+// pre-sized slice: the fixed display settings, the session's custom
+// variables, and room for the profile flag Start may append. Custom
+// variables that are not a JSON object of strings are ignored.
+func containerEnv(sess *sessions.Session) []string {
+	var custom map[string]string
+	if len(sess.Environment) > 0 {
+		if err := json.Unmarshal(sess.Environment, &custom); err != nil {
+			custom = nil
+		}
+	}
+
+	env := make([]string, 0, 4+len(custom))
+	env = append(env,
+		"HEADLESS="+strconv.FormatBool(sess.Headless),
+		"RESOLUTION_WIDTH="+strconv.Itoa(sess.Screen.Width),
+		"RESOLUTION_HEIGHT="+strconv.Itoa(sess.Screen.Height),
+	)
+	for k, v := range custom {
+		env = append(env, k+"="+v)
+	}
+	return env
+}
+
 func defaultStr(s, d string) string {
 	if s == "" {
 		return d
@@ -2,11 +2,15 @@ package docker
 
 import (
 	"testing"
+	"time"
 
 	"github.com/docker/docker/api/types/container"
 	"github.com/docker/go-connections/nat"
 	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
+	"gorm.io/datatypes"
+
+	"github.com/autocrawlerHQ/browsergrid/internal/sessions"
 )
 
 func TestNatSet(t *testing.T) {
@@ -292,6 +296,55 @@ func TestCpuPercentUnix(t *testing.T) {
 	}
 }
 
+func TestContainerEnv(t *testing.T) {
+	tests := []struct {
+		name        string
+		environment datatypes.JSON
+		expected    []string
+	}{
+		{
+			name:     "no custom environment",
+			expected: []string{"HEADLESS=true", "RESOLUTION_WIDTH=1920", "RESOLUTION_HEIGHT=1080"},
+		},
+		{
+			name:        "custom environment appended",
+			environment: datatypes.JSON(`{"BROWSER_IMAGE":"browsergrid/chrome:latest"}`),
+			expected: []string{"HEADLESS=true", "RESOLUTION_WIDTH=1920", "RESOLUTION_HEIGHT=1080",
+				"BROWSER_IMAGE=browsergrid/chrome:latest"},
+		},
+		{
+			name:        "invalid custom environment ignored",
+			environment: datatypes.JSON(`["not","an","object"]`),
+			expected:    []string{"HEADLESS=true", "RESOLUTION_WIDTH=1920", "RESOLUTION_HEIGHT=1080"},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			sess := &sessions.Session{
+				Headless:    true,
+				Screen:      sessions.ScreenConfig{Width: 1920, Height: 1080},
+				Environment: tt.environment,
+			}
+			env := containerEnv(sess)
+			assert.Equal(t, tt.expected, env)
+			assert.Greater(t, cap(env), len(env), "room should be left for the profile flag")
+		})
+	}
+}
+
+func TestImageRecentlyEnsured(t *testing.T) {
+	p := &DockerProvisioner{}
+	assert.False(t, p.imageRecentlyEnsured("browsergrid/chrome:latest"))
+
+	p.markImageEnsured("browsergrid/chrome:latest")
+	assert.True(t, p.imageRecentlyEnsured("browsergrid/chrome:latest"))
+	assert.False(t, p.imageRecentlyEnsured("browsergrid/firefox:latest"))
+
+	p.imagesPulled["browsergrid/chrome:latest"] = time.Now().Add(-imageRefreshInterval)
+	assert.False(t, p.imageRecentlyEnsured("browsergrid/chrome:latest"))
+}
+
 func TestWsToHTTP(t *testing.T) {
 	tests := []struct {
 		name     string
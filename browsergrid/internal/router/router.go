@@ -3,16 +3,16 @@ package router
 import (
 	"context"
 	"fmt"
+	"net/http"
 
 	"github.com/gin-contrib/cors"
 	"github.com/gin-gonic/gin"
 	"github.com/google/uuid"
 	"github.com/hibiken/asynq"
-	swaggerFiles "github.com/swaggo/files"
-	ginSwagger "github.com/swaggo/gin-swagger"
 
 	"github.com/autocrawlerHQ/browsergrid/internal/db"
 	"github.com/autocrawlerHQ/browsergrid/internal/deployments"
+	"github.com/autocrawlerHQ/browsergrid/internal/middleware"
 	"github.com/autocrawlerHQ/browsergrid/internal/poolmgr"
 	"github.com/autocrawlerHQ/browsergrid/internal/profiles"
 	"github.com/autocrawlerHQ/browsergrid/internal/sessions"
@@ -21,8 +21,26 @@ import (
 	"github.com/autocrawlerHQ/browsergrid/internal/storage"
 )
 
-func New(database *db.DB, reconciler *poolmgr.Reconciler, taskClient *asynq.Client, redisOpt asynq.RedisClientOpt, storeBackend storage.Backend) *gin.Engine {
-	r := gin.Default()
+// healthyBody is the constant /health response, encoded once since it is
+// served on every probe.
+var healthyBody = []byte(`{"database":"up","redis":"up","status":"healthy"}`)
+
+// gzipMinSize is the smallest response body worth compressing; below about
+// a kilobyte the gzip framing and CPU cost outweigh the bytes saved.
+const gzipMinSize = 1024
+
+func New(database *db.DB, reconciler *poolmgr.Reconciler, taskClient *asynq.Client, inspector *asynq.Inspector, storeBackend storage.Backend) *gin.Engine {
+	// gin.Default, minus access log lines for health probes, which are the
+	// most frequent requests and carry no information when they succeed.
+	// Panics are answered with the same JSON error shape as handled errors.
+	r := gin.New()
+	r.Use(
+		gin.LoggerWithConfig(gin.LoggerConfig{SkipPaths: []string{"/health"}}),
+		gin.CustomRecovery(func(c *gin.Context, recovered interface{}) {
+			c.AbortWithStatusJSON(http.StatusInternalServerError, gin.H{"error": "internal server error"})
+		}),
+		middleware.Gzip(gzipMinSize),
+	)
 
 	r.Use(cors.New(cors.Config{
 		AllowOrigins:     []string{"*"},
@@ -39,20 +57,15 @@ func New(database *db.DB, reconciler *poolmgr.Reconciler, taskClient *asynq.Clie
 			return
 		}
 
-		inspector := asynq.NewInspector(redisOpt)
 		if _, err := inspector.Queues(); err != nil {
 			c.JSON(503, gin.H{"status": "unhealthy", "redis": "down", "error": err.Error()})
 			return
 		}
 
-		c.JSON(200, gin.H{
-			"status":   "healthy",
-			"database": "up",
-			"redis":    "up",
-		})
+		c.Data(200, "application/json; charset=utf-8", healthyBody)
 	})
 
-	r.GET("/swagger/*any", ginSwagger.WrapHandler(swaggerFiles.Handler))
+	r.GET("/swagger/*any", swaggerHandler())
 
 	v1 := r.Group("/api/v1")
 	{
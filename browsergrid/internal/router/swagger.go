@@ -0,0 +1,43 @@
+package router
+
+import (
+	"net/http"
+	"sync"
+
+	"github.com/gin-gonic/gin"
+	swaggerFiles "github.com/swaggo/files"
+	ginSwagger "github.com/swaggo/gin-swagger"
+	"github.com/swaggo/swag"
+)
+
+// swaggerHandler serves the Swagger UI. doc.json is rendered from the swag
+// template once and then served from memory, since the spec cannot change
+// while the process is running.
+func swaggerHandler() gin.HandlerFunc {
+	ui := ginSwagger.WrapHandler(swaggerFiles.Handler)
+
+	var (
+		once sync.Once
+		doc  []byte
+		err  error
+	)
+
+	return func(c *gin.Context) {
+		if c.Param("any") != "/doc.json" {
+			ui(c)
+			return
+		}
+
+		once.Do(func() {
+			var s string
+			s, err = swag.ReadDoc()
+			doc = []byte(s)
+		})
+		if err != nil {
+			c.AbortWithStatus(http.StatusInternalServerError)
+			return
+		}
+
+		c.Data(http.StatusOK, "application/json; charset=utf-8", doc)
+	}
+}
@@ -73,21 +73,32 @@ func (s *Service) handlePoolScale(ctx context.Context, t *asynq.Task) error {
 	log.Printf("[SCHEDULER] Processing pool scale task for pool %s (desired: %d sessions)",
 		payload.WorkPoolID, payload.DesiredSessions)
 
+	if payload.DesiredSessions <= 0 {
+		return nil
+	}
+
 	var pool workpool.WorkPool
-	if err := s.db.WithContext(ctx).First(&pool, "id = ?", payload.WorkPoolID).Error; err != nil {
+	if err := s.db.WithContext(ctx).Take(&pool, "id = ?", payload.WorkPoolID).Error; err != nil {
 		return err
 	}
 
 	sessStore := sessions.NewStore(s.db)
 	created := 0
 
-	for i := 0; i < payload.DesiredSessions; i++ {
-		sess := s.createSessionFromPool(&pool)
-		if err := sessStore.CreateSession(ctx, sess); err != nil {
-			log.Printf("[SCHEDULER] Failed to create session: %v", err)
-			continue
-		}
+	env := poolSessionEnvironment(&pool)
+	batch := make([]*sessions.Session, payload.DesiredSessions)
+	for i := range batch {
+		batch[i] = newPoolSession(&pool, env)
+	}
+	// CreateSessions is all-or-nothing, so a failed insert leaves no rows
+	// behind and the retry asynq schedules can't overshoot the pool size.
+	if err := sessStore.CreateSessions(ctx, batch); err != nil {
+		log.Printf("[SCHEDULER] Failed to create %d sessions: %v", len(batch), err)
+		return err
+	}
 
+	var failed []uuid.UUID
+	for _, sess := range batch {
 		startPayload := tasks.SessionStartPayload{
 			SessionID:          sess.ID,
 			WorkPoolID:         pool.ID,
@@ -108,7 +119,7 @@ func (s *Service) handlePoolScale(ctx context.Context, t *asynq.Task) error {
 		)
 		if err != nil {
 			log.Printf("[SCHEDULER] Failed to enqueue start task: %v", err)
-			sessStore.UpdateSessionStatus(ctx, sess.ID, sessions.StatusFailed)
+			failed = append(failed, sess.ID)
 			continue
 		}
 
@@ -116,6 +127,10 @@ func (s *Service) handlePoolScale(ctx context.Context, t *asynq.Task) error {
 		created++
 	}
 
+	if err := sessStore.UpdateSessionsStatus(ctx, failed, sessions.StatusFailed); err != nil {
+		log.Printf("[SCHEDULER] Failed to mark %d sessions failed: %v", len(failed), err)
+	}
+
 	log.Printf("[SCHEDULER] Pool scale completed: %d/%d sessions created for pool %s",
 		created, payload.DesiredSessions, pool.Name)
 
@@ -132,17 +147,8 @@ func (s *Service) handleCleanupExpired(ctx context.Context, t *asynq.Task) error
 
 	cutoff := time.Now().Add(-time.Duration(payload.MaxAge) * time.Hour)
 
-	terminalStatuses := []sessions.SessionStatus{
-		sessions.StatusCompleted,
-		sessions.StatusFailed,
-		sessions.StatusExpired,
-		sessions.StatusCrashed,
-		sessions.StatusTimedOut,
-		sessions.StatusTerminated,
-	}
-
 	result := s.db.WithContext(ctx).
-		Where("status IN ? AND updated_at < ?", terminalStatuses, cutoff).
+		Where("status IN ? AND updated_at < ?", sessions.TerminalStatuses, cutoff).
 		Delete(&sessions.Session{})
 
 	if result.Error != nil {
@@ -159,14 +165,30 @@ func (s *Service) handleCleanupExpired(ctx context.Context, t *asynq.Task) error
 	return nil
 }
 
-func (s *Service) createSessionFromPool(pool *workpool.WorkPool) *sessions.Session {
+// poolSessionEnvironment builds the environment shared by every session a
+// pool spawns. It is computed once per scale task rather than once per session.
+func poolSessionEnvironment(pool *workpool.WorkPool) datatypes.JSON {
 	env := pool.DefaultEnv
 	if env == nil {
-		envData, _ := json.Marshal(map[string]string{})
+		env = datatypes.JSON("{}")
+	}
+
+	if pool.DefaultImage != nil {
+		var envMap map[string]string
+		if err := json.Unmarshal(env, &envMap); err != nil || envMap == nil {
+			envMap = make(map[string]string)
+		}
+		envMap["BROWSER_IMAGE"] = *pool.DefaultImage
+
+		envData, _ := json.Marshal(envMap)
 		env = datatypes.JSON(envData)
 	}
 
-	sess := &sessions.Session{
+	return env
+}
+
+func newPoolSession(pool *workpool.WorkPool, env datatypes.JSON) *sessions.Session {
+	return &sessions.Session{
 		ID:              uuid.New(),
 		Browser:         sessions.BrowserChrome,
 		Version:         sessions.VerLatest,
@@ -183,19 +205,6 @@ func (s *Service) createSessionFromPool(pool *workpool.WorkPool) *sessions.Sessi
 		Provider:    string(pool.Provider),
 		WorkPoolID:  &pool.ID,
 	}
-
-	if pool.DefaultImage != nil {
-		var envMap map[string]string
-		if err := json.Unmarshal(sess.Environment, &envMap); err != nil {
-			envMap = make(map[string]string)
-		}
-		envMap["BROWSER_IMAGE"] = *pool.DefaultImage
-
-		envData, _ := json.Marshal(envMap)
-		sess.Environment = datatypes.JSON(envData)
-	}
-
-	return sess
 }
 
 func getQueueName(provider workpool.ProviderType) string {
@@ -161,10 +161,7 @@ func TestHandleCleanupExpired(t *testing.T) {
 	assert.NoError(t, err)
 }
 
-func TestCreateSessionFromPool(t *testing.T) {
-	service, _, _ := setupTestScheduler(t)
-	defer service.Stop()
-
+func TestNewPoolSession(t *testing.T) {
 	tests := []struct {
 		name string
 		pool *workpool.WorkPool
@@ -192,7 +189,7 @@ func TestCreateSessionFromPool(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			session := service.createSessionFromPool(tt.pool)
+			session := newPoolSession(tt.pool, poolSessionEnvironment(tt.pool))
 
 			assert.NotEqual(t, uuid.Nil, session.ID)
 			assert.Equal(t, sessions.StatusPending, session.Status)
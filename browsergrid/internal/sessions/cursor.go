@@ -0,0 +1,48 @@
+package sessions
+
+import (
+	"encoding/base64"
+	"errors"
+	"strings"
+	"time"
+
+	"github.com/google/uuid"
+)
+
+// ErrInvalidCursor is returned when a pagination cursor cannot be decoded
+var ErrInvalidCursor = errors.New("invalid cursor")
+
+// Cursor is a keyset position used to page through lists ordered by
+// (timestamp DESC, id DESC). Seeking past the last row of the previous page
+// keeps every page fetch bounded by the page size instead of the offset.
+type Cursor struct {
+	Timestamp time.Time
+	ID        uuid.UUID
+}
+
+// Encode returns the opaque string form of the cursor used in query params
+func (c Cursor) Encode() string {
+	raw := c.Timestamp.UTC().Format(time.RFC3339Nano) + "|" + c.ID.String()
+	return base64.RawURLEncoding.EncodeToString([]byte(raw))
+}
+
+// DecodeCursor parses a cursor produced by Cursor.Encode
+func DecodeCursor(s string) (*Cursor, error) {
+	raw, err := base64.RawURLEncoding.DecodeString(s)
+	if err != nil {
+		return nil, ErrInvalidCursor
+	}
+	ts, id, ok := strings.Cut(string(raw), "|")
+	if !ok {
+		return nil, ErrInvalidCursor
+	}
+	t, err := time.Parse(time.RFC3339Nano, ts)
+	if err != nil {
+		return nil, ErrInvalidCursor
+	}
+	uid, err := uuid.Parse(id)
+	if err != nil {
+		return nil, ErrInvalidCursor
+	}
+	return &Cursor{Timestamp: t, ID: uid}, nil
+}
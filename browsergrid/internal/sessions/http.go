@@ -6,9 +6,11 @@ import (
 	"net/http"
 	"os"
 	"strconv"
+	"strings"
 	"time"
 
 	"github.com/gin-gonic/gin"
+	json "github.com/goccy/go-json"
 	"github.com/google/uuid"
 	"github.com/hibiken/asynq"
 	"gorm.io/gorm"
@@ -27,18 +29,26 @@ type Dependencies struct {
 	PoolSvc    PoolService
 	TaskClient *asynq.Client
 	ProfileSvc ProfileService
+	// RedisAddr is passed to workers in session start payloads. It defaults
+	// to REDIS_ADDR, read once when the routes are registered.
+	RedisAddr string
 }
 
 func RegisterRoutes(rg *gin.RouterGroup, deps Dependencies) {
 	store := NewStore(deps.DB)
+	if deps.RedisAddr == "" {
+		deps.RedisAddr = os.Getenv("REDIS_ADDR")
+	}
 
-	rg.POST("/sessions", createSession(store, deps))
+	rg.POST("/sessions", createSession(store, deps, newWorkPoolCache(workPoolCacheTTL)))
 	rg.GET("/sessions", listSessions(store))
 	rg.GET("/sessions/:id", getSession(store))
 	rg.DELETE("/sessions/:id", deleteSession(store, deps))
 	rg.POST("/sessions/:id/events", createEvent(store))
 	rg.GET("/sessions/:id/events", listEvents(store))
 	rg.POST("/sessions/:id/metrics", createMetrics(store))
+	rg.GET("/sessions/:id/metrics", getMetricsSeries(store))
+	rg.GET("/sessions/:id/metrics/raw", streamMetrics(store))
 
 	rg.POST("/events", createEvent(store))
 	rg.GET("/events", listEvents(store))
@@ -56,7 +66,7 @@ func RegisterRoutes(rg *gin.RouterGroup, deps Dependencies) {
 // @Failure 400 {object} ErrorResponse "Invalid request data"
 // @Failure 500 {object} ErrorResponse "Internal server error"
 // @Router /api/v1/sessions [post]
-func createSession(store *Store, deps Dependencies) gin.HandlerFunc {
+func createSession(store *Store, deps Dependencies, pools *workPoolCache) gin.HandlerFunc {
 	return func(c *gin.Context) {
 		var req Session
 		if err := c.ShouldBindJSON(&req); err != nil {
@@ -134,13 +144,13 @@ func createSession(store *Store, deps Dependencies) gin.HandlerFunc {
 		}
 
 		req.Status = StatusPending
-		if err := store.CreateSession(c.Request.Context(), &req); err != nil {
+		if err := store.CreateSessionWithEvent(c.Request.Context(), &req); err != nil {
 			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 			return
 		}
 
 		ctx := c.Request.Context()
-		pool, err := getWorkPool(ctx, deps.DB, *req.WorkPoolID)
+		pool, err := pools.get(ctx, deps.DB, *req.WorkPoolID)
 		if err != nil {
 			c.JSON(http.StatusInternalServerError, gin.H{"error": "failed to get work pool: " + err.Error()})
 			return
@@ -150,7 +160,7 @@ func createSession(store *Store, deps Dependencies) gin.HandlerFunc {
 			SessionID:          req.ID,
 			WorkPoolID:         *req.WorkPoolID,
 			MaxSessionDuration: pool.MaxSessionDuration,
-			RedisAddr:          os.Getenv("REDIS_ADDR"),
+			RedisAddr:          deps.RedisAddr,
 			QueueName:          getQueueName(pool.Provider),
 		}
 
@@ -179,13 +189,6 @@ func createSession(store *Store, deps Dependencies) gin.HandlerFunc {
 			log.Printf("[API] Created session %s (task client disabled for testing)", req.ID)
 		}
 
-		event := SessionEvent{
-			SessionID: req.ID,
-			Event:     EvtSessionCreated,
-			Timestamp: time.Now(),
-		}
-		store.CreateEvent(ctx, &event)
-
 		c.JSON(http.StatusCreated, req)
 	}
 }
@@ -255,13 +258,15 @@ func deleteSession(store *Store, deps Dependencies) gin.HandlerFunc {
 // @Description Get a list of browser sessions with optional filtering by status, time range, and pagination
 // @Tags sessions
 // @Accept json
-// @Produce json
+// @Produce json,application/x-ndjson
 // @Param status query string false "Filter by session status" Enums(pending, starting, available, claimed, running, idle, completed, failed, expired, crashed, timed_out, terminated)
 // @Param start_time query string false "Filter sessions created after this time (RFC3339 format)"
 // @Param end_time query string false "Filter sessions created before this time (RFC3339 format)"
-// @Param offset query integer false "Number of sessions to skip" default(0) minimum(0)
-// @Param limit query integer false "Maximum number of sessions to return" default(100) minimum(1) maximum(1000)
-// @Success 200 {object} SessionListResponse "List of sessions"
+// @Param cursor query string false "Opaque cursor from a previous response's next_cursor"
+// @Param offset query integer false "Number of sessions to skip (deprecated, prefer cursor)" default(0) minimum(0)
+// @Param limit query integer false "Maximum number of sessions to return; when streaming, defaults to and is capped at 100000" default(100) minimum(1) maximum(1000)
+// @Success 200 {object} SessionListResponse "List of sessions, or one session per line when Accept is application/x-ndjson"
+// @Failure 400 {object} ErrorResponse "Invalid cursor"
 // @Failure 500 {object} ErrorResponse "Internal server error"
 // @Router /api/v1/sessions [get]
 func listSessions(store *Store) gin.HandlerFunc {
@@ -284,23 +289,93 @@ func listSessions(store *Store) gin.HandlerFunc {
 				end = &t
 			}
 		}
+		if strings.Contains(c.GetHeader("Accept"), ndjsonContentType) {
+			limit, _ := strconv.Atoi(c.Query("limit"))
+			if limit <= 0 || limit > maxSessionStreamSize {
+				limit = maxSessionStreamSize
+			}
+			streamSessions(c, store, status, start, end, limit)
+			return
+		}
+
 		offset, _ := strconv.Atoi(c.DefaultQuery("offset", "0"))
 		limit, _ := strconv.Atoi(c.DefaultQuery("limit", "100"))
+		if limit > maxSessionPageSize {
+			limit = maxSessionPageSize
+		}
+
+		cursor, ok := parseCursor(c)
+		if !ok {
+			return
+		}
 
-		sessions, err := store.ListSessions(c.Request.Context(), status, start, end, offset, limit)
+		var (
+			sessions []Session
+			err      error
+		)
+		if offset > 0 && cursor == nil {
+			sessions, err = store.ListSessions(c.Request.Context(), status, start, end, offset, limit)
+		} else {
+			sessions, err = store.ListSessionsAfter(c.Request.Context(), status, start, end, cursor, limit)
+		}
 		if err != nil {
 			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 			return
 		}
-		c.JSON(http.StatusOK, gin.H{
-			"sessions": sessions,
-			"total":    len(sessions),
-			"offset":   offset,
-			"limit":    limit,
+
+		var nextCursor string
+		if limit > 0 && len(sessions) == limit {
+			last := sessions[len(sessions)-1]
+			nextCursor = Cursor{Timestamp: last.CreatedAt, ID: last.ID}.Encode()
+		}
+		c.JSON(http.StatusOK, SessionListResponse{
+			Sessions:   sessions,
+			Total:      len(sessions),
+			Offset:     offset,
+			Limit:      limit,
+			NextCursor: nextCursor,
 		})
 	}
 }
 
+const (
+	// maxSessionPageSize bounds JSON session pages. Larger reads should use
+	// the NDJSON stream, which does not hold the result set in memory.
+	maxSessionPageSize = 1000
+
+	// maxSessionStreamSize bounds NDJSON streams, which keep a pooled
+	// connection busy for as long as the client takes to read them. It is
+	// also the default when no limit is given.
+	maxSessionStreamSize = 100000
+
+	ndjsonContentType = "application/x-ndjson"
+)
+
+// streamSessions writes matching sessions as newline-delimited JSON while
+// they are read from the database.
+func streamSessions(c *gin.Context, store *Store, status *SessionStatus, start, end *time.Time, limit int) {
+	c.Header("Content-Type", ndjsonContentType)
+	c.Status(http.StatusOK)
+
+	enc := json.NewEncoder(c.Writer)
+	written := 0
+	err := store.StreamSessions(c.Request.Context(), status, start, end, limit, func(sess *Session) error {
+		if err := enc.Encode(sess); err != nil {
+			return err
+		}
+		if written++; written%500 == 0 {
+			c.Writer.Flush()
+		}
+		return nil
+	})
+	if err != nil {
+		// Headers are already sent; all we can do is stop and log
+		log.Printf("[API] session stream aborted: %v", err)
+		return
+	}
+	c.Writer.Flush()
+}
+
 // GetSession retrieves a specific session by ID
 // @Summary Get a browser session
 // @Description Get detailed information about a specific browser session by its ID
@@ -369,19 +444,12 @@ func createEvent(store *Store) gin.HandlerFunc {
 			return
 		}
 
-		if err := store.CreateEvent(c.Request.Context(), &ev); err != nil {
+		// The event and any status transition it implies commit together
+		if err := store.RecordEvent(c.Request.Context(), &ev); err != nil {
 			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 			return
 		}
 
-		// Update session status if event triggers a transition
-		if newStatus, shouldUpdate := statusFromEvent(ev.Event); shouldUpdate {
-			if err := store.UpdateSessionStatus(c.Request.Context(), ev.SessionID, newStatus); err != nil {
-				// Log error but don't fail the request since event was created
-				log.Printf("Failed to update session status for event %s: %v", ev.Event, err)
-			}
-		}
-
 		c.JSON(http.StatusCreated, ev)
 	}
 }
@@ -397,7 +465,8 @@ func createEvent(store *Store) gin.HandlerFunc {
 // @Param event_type query string false "Filter by event type" Enums(session_created, resource_allocated, session_starting, container_started, browser_started, session_available, session_claimed, session_assigned, session_ready, session_active, session_idle, heartbeat, pool_added, pool_removed, pool_drained, session_completed, session_expired, session_timed_out, session_terminated, startup_failed, browser_crashed, container_crashed, resource_exhausted, network_error, status_changed, config_updated, health_check)
 // @Param start_time query string false "Filter events after this time (RFC3339 format)"
 // @Param end_time query string false "Filter events before this time (RFC3339 format)"
-// @Param offset query integer false "Number of events to skip" default(0) minimum(0)
+// @Param cursor query string false "Opaque cursor from a previous response's next_cursor"
+// @Param offset query integer false "Number of events to skip (deprecated, prefer cursor)" default(0) minimum(0)
 // @Param limit query integer false "Maximum number of events to return" default(100) minimum(1) maximum(1000)
 // @Success 200 {object} SessionEventListResponse "List of events"
 // @Failure 400 {object} ErrorResponse "Invalid session ID or parameters"
@@ -445,16 +514,36 @@ func listEvents(store *Store) gin.HandlerFunc {
 		offset, _ := strconv.Atoi(c.DefaultQuery("offset", "0"))
 		limit, _ := strconv.Atoi(c.DefaultQuery("limit", "100"))
 
-		events, err := store.ListEvents(c.Request.Context(), sessionIDPtr, eventType, start, end, offset, limit)
+		cursor, ok := parseCursor(c)
+		if !ok {
+			return
+		}
+
+		var (
+			events []SessionEvent
+			err    error
+		)
+		if offset > 0 && cursor == nil {
+			events, err = store.ListEvents(c.Request.Context(), sessionIDPtr, eventType, start, end, offset, limit)
+		} else {
+			events, err = store.ListEventsAfter(c.Request.Context(), sessionIDPtr, eventType, start, end, cursor, limit)
+		}
 		if err != nil {
 			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 			return
 		}
-		c.JSON(http.StatusOK, gin.H{
-			"events": events,
-			"total":  len(events),
-			"offset": offset,
-			"limit":  limit,
+
+		var nextCursor string
+		if limit > 0 && len(events) == limit {
+			last := events[len(events)-1]
+			nextCursor = Cursor{Timestamp: last.Timestamp, ID: last.ID}.Encode()
+		}
+		c.JSON(http.StatusOK, SessionEventListResponse{
+			Events:     events,
+			Total:      len(events),
+			Offset:     offset,
+			Limit:      limit,
+			NextCursor: nextCursor,
 		})
 	}
 }
@@ -502,6 +591,164 @@ func createMetrics(store *Store) gin.HandlerFunc {
 	}
 }
 
+// maxMetricsBuckets bounds the size of a metrics series response
+const maxMetricsBuckets = 1440
+
+// maxMetricsStreamWindow bounds the time range of a raw metrics stream, which
+// keeps a pooled connection busy for as long as the client takes to read it.
+// Longer ranges should use the aggregated series.
+const maxMetricsStreamWindow = 24 * time.Hour
+
+// GetMetricsSeries returns aggregated session metrics
+// @Summary Get session metrics time series
+// @Description Get session metrics averaged into fixed-width buckets. Every bucket in the time range is returned, including those without samples.
+// @Tags metrics
+// @Accept json
+// @Produce json
+// @Param id path string true "Session ID (UUID)"
+// @Param start_time query string false "Start of the range (RFC3339 format), defaults to one hour before end_time"
+// @Param end_time query string false "End of the range (RFC3339 format), defaults to now"
+// @Param interval query integer false "Bucket width in seconds" default(60) minimum(1)
+// @Success 200 {object} SessionMetricsSeriesResponse "Metrics time series"
+// @Failure 400 {object} ErrorResponse "Invalid session ID or parameters"
+// @Failure 500 {object} ErrorResponse "Internal server error"
+// @Router /api/v1/sessions/{id}/metrics [get]
+func getMetricsSeries(store *Store) gin.HandlerFunc {
+	return func(c *gin.Context) {
+		id, err := uuid.Parse(c.Param("id"))
+		if err != nil {
+			c.JSON(http.StatusBadRequest, gin.H{"error": "invalid session ID"})
+			return
+		}
+
+		start, end, ok := parseTimeRange(c)
+		if !ok {
+			return
+		}
+
+		intervalSecs, err := strconv.Atoi(c.DefaultQuery("interval", "60"))
+		if err != nil || intervalSecs < 1 {
+			c.JSON(http.StatusBadRequest, gin.H{"error": "interval must be a positive number of seconds"})
+			return
+		}
+		interval := time.Duration(intervalSecs) * time.Second
+
+		if end.Sub(start)/interval > maxMetricsBuckets {
+			c.JSON(http.StatusBadRequest, gin.H{"error": "time range too large for interval"})
+			return
+		}
+
+		buckets, err := store.MetricsSeries(c.Request.Context(), id, start, end, interval)
+		if err != nil {
+			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+			return
+		}
+
+		c.JSON(http.StatusOK, SessionMetricsSeriesResponse{
+			SessionID: id,
+			Interval:  intervalSecs,
+			Buckets:   buckets,
+		})
+	}
+}
+
+// StreamMetrics streams raw session metrics samples
+// @Summary Stream raw session metrics
+// @Description Stream every metrics sample for a session in the time range as newline-delimited JSON, oldest first. The range may span at most 24 hours. If the stream fails after it has started, the last line is an object with an "error" field.
+// @Tags metrics
+// @Produce application/x-ndjson
+// @Param id path string true "Session ID (UUID)"
+// @Param start_time query string false "Start of the range (RFC3339 format), defaults to one hour before end_time"
+// @Param end_time query string false "End of the range (RFC3339 format), defaults to now"
+// @Success 200 {object} SessionMetrics "One metrics sample per line"
+// @Failure 400 {object} ErrorResponse "Invalid session ID or parameters, or a time range longer than 24 hours"
+// @Router /api/v1/sessions/{id}/metrics/raw [get]
+func streamMetrics(store *Store) gin.HandlerFunc {
+	return func(c *gin.Context) {
+		id, err := uuid.Parse(c.Param("id"))
+		if err != nil {
+			c.JSON(http.StatusBadRequest, gin.H{"error": "invalid session ID"})
+			return
+		}
+
+		start, end, ok := parseTimeRange(c)
+		if !ok {
+			return
+		}
+		if end.Sub(start) > maxMetricsStreamWindow {
+			c.JSON(http.StatusBadRequest, gin.H{"error": "time range too large; use at most 24 hours"})
+			return
+		}
+
+		c.Header("Content-Type", ndjsonContentType)
+		c.Status(http.StatusOK)
+
+		enc := json.NewEncoder(c.Writer)
+		written := 0
+		err = store.StreamMetrics(c.Request.Context(), id, start, end, func(m *SessionMetrics) error {
+			if err := enc.Encode(m); err != nil {
+				return err
+			}
+			if written++; written%500 == 0 {
+				c.Writer.Flush()
+			}
+			return nil
+		})
+		if err != nil {
+			// Headers are already sent, so end the stream with an error line
+			// that clients can tell apart from a metrics sample
+			log.Printf("[METRICS] stream for session %s aborted: %v", id, err)
+			enc.Encode(gin.H{"error": "stream aborted: " + err.Error()})
+			c.Writer.Flush()
+			return
+		}
+		c.Writer.Flush()
+	}
+}
+
+// parseTimeRange reads start_time/end_time, defaulting to the last hour. It
+// writes a 400 response and returns ok=false when either value is malformed.
+func parseTimeRange(c *gin.Context) (start, end time.Time, ok bool) {
+	end = time.Now()
+	if v := c.Query("end_time"); v != "" {
+		t, err := time.Parse(time.RFC3339, v)
+		if err != nil {
+			c.JSON(http.StatusBadRequest, gin.H{"error": "invalid end_time"})
+			return start, end, false
+		}
+		end = t
+	}
+	start = end.Add(-time.Hour)
+	if v := c.Query("start_time"); v != "" {
+		t, err := time.Parse(time.RFC3339, v)
+		if err != nil {
+			c.JSON(http.StatusBadRequest, gin.H{"error": "invalid start_time"})
+			return start, end, false
+		}
+		start = t
+	}
+	if !start.Before(end) {
+		c.JSON(http.StatusBadRequest, gin.H{"error": "start_time must be before end_time"})
+		return start, end, false
+	}
+	return start, end, true
+}
+
+// parseCursor decodes the optional cursor query param, writing a 400 response
+// and returning ok=false when it is malformed.
+func parseCursor(c *gin.Context) (cursor *Cursor, ok bool) {
+	v := c.Query("cursor")
+	if v == "" {
+		return nil, true
+	}
+	cursor, err := DecodeCursor(v)
+	if err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return nil, false
+	}
+	return cursor, true
+}
+
 func assignToDefaultWorkPool(ctx context.Context, poolSvc PoolService, session *Session) error {
 	id, err := poolSvc.GetOrCreateDefault(ctx, session.Provider)
 	if err != nil {
@@ -511,9 +758,13 @@ func assignToDefaultWorkPool(ctx context.Context, poolSvc PoolService, session *
 	return nil
 }
 
+// getWorkPool reads only the pool columns a start payload needs; without an
+// explicit Select GORM would fetch every column, JSON defaults included.
 func getWorkPool(ctx context.Context, db *gorm.DB, id uuid.UUID) (*WorkPool, error) {
 	var pool WorkPool
-	err := db.WithContext(ctx).First(&pool, "id = ?", id).Error
+	err := db.WithContext(ctx).
+		Select("id", "provider", "max_session_duration").
+		Take(&pool, "id = ?", id).Error
 	return &pool, err
 }
 
@@ -109,7 +109,7 @@ func (r *ResourceLimits) Scan(value interface{}) error {
 // Session represents a browser session
 // @Description Browser session with configuration and status
 type Session struct {
-	ID              uuid.UUID       `json:"id" example:"550e8400-e29b-41d4-a716-446655440000"`
+	ID              uuid.UUID       `json:"id" example:"550e8400-e29b-41d4-a716-446655440000" gorm:"index:idx_sessions_created_at_id,priority:2,sort:desc"`
 	Browser         Browser         `json:"browser" example:"chrome"`
 	Version         BrowserVersion  `json:"version" example:"latest"`
 	Headless        bool            `json:"headless" example:"true"`
@@ -118,9 +118,9 @@ type Session struct {
 	Proxy           ProxyConfig     `json:"proxy,omitempty"`
 	ResourceLimits  ResourceLimits  `json:"resource_limits,omitempty"`
 	Environment     datatypes.JSON  `json:"environment" swaggertype:"object"`
-	Status          SessionStatus   `json:"status" example:"pending"`
-	CreatedAt       time.Time       `json:"created_at" example:"2023-01-01T00:00:00Z"`
-	UpdatedAt       time.Time       `json:"updated_at" example:"2023-01-01T00:00:00Z"`
+	Status          SessionStatus   `json:"status" example:"pending" gorm:"index:idx_sessions_work_pool_id_status,priority:2;index:idx_sessions_profile_id_status,priority:2"`
+	CreatedAt       time.Time       `json:"created_at" example:"2023-01-01T00:00:00Z" gorm:"index:idx_sessions_created_at_id,priority:1,sort:desc"`
+	UpdatedAt       time.Time       `json:"updated_at" example:"2023-01-01T00:00:00Z" gorm:"index:idx_sessions_idle,priority:2"`
 	ExpiresAt       *time.Time      `json:"expires_at,omitempty" example:"2023-01-01T01:00:00Z"`
 
 	ContainerID      *string `json:"container_id,omitempty" example:"abc123"`
@@ -131,14 +131,14 @@ type Session struct {
 	WSEndpoint *string `json:"ws_endpoint,omitempty" example:"ws://localhost:80/devtools/browser"`
 	LiveURL    *string `json:"live_url,omitempty" example:"http://localhost:80"`
 
-	WorkPoolID *uuid.UUID `json:"work_pool_id,omitempty" example:"550e8400-e29b-41d4-a716-446655440002"`
-	ProfileID  *uuid.UUID `json:"profile_id,omitempty" example:"550e8400-e29b-41d4-a716-446655440001"`
-	PoolID     *string    `json:"pool_id,omitempty" example:"chrome-pool"`
+	WorkPoolID *uuid.UUID `json:"work_pool_id,omitempty" example:"550e8400-e29b-41d4-a716-446655440002" gorm:"index:idx_sessions_work_pool_id_status,priority:1;index:idx_sessions_idle,priority:1,where:status = 'idle'"`
+	ProfileID  *uuid.UUID `json:"profile_id,omitempty" example:"550e8400-e29b-41d4-a716-446655440001" gorm:"index:idx_sessions_profile_id_status,priority:1"`
+	PoolID     *string    `json:"pool_id,omitempty" example:"chrome-pool" gorm:"index:idx_sessions_pool_available,priority:1,where:status = 'available' AND claimed_by IS NULL"`
 	IsPooled   bool       `json:"is_pooled" example:"false"`
 	ClaimedAt  *time.Time `json:"claimed_at,omitempty" example:"2023-01-01T00:30:00Z"`
 	ClaimedBy  *string    `json:"claimed_by,omitempty" example:"client-123"`
 
-	AvailableAt *time.Time `json:"available_at,omitempty" example:"2023-01-01T00:15:00Z"`
+	AvailableAt *time.Time `json:"available_at,omitempty" example:"2023-01-01T00:15:00Z" gorm:"index:idx_sessions_pool_available,priority:2"`
 } //@name Session
 
 func (Session) TableName() string {
@@ -168,11 +168,11 @@ func (s *Session) BeforeCreate(tx *gorm.DB) error {
 // SessionEvent represents an event that occurred during a session
 // @Description Session event with type, data and timestamp
 type SessionEvent struct {
-	ID        uuid.UUID        `json:"id" example:"550e8400-e29b-41d4-a716-446655440003"`
-	SessionID uuid.UUID        `json:"session_id" example:"550e8400-e29b-41d4-a716-446655440000"`
-	Event     SessionEventType `json:"event" example:"session_created"`
+	ID        uuid.UUID        `json:"id" example:"550e8400-e29b-41d4-a716-446655440003" gorm:"index:idx_session_events_timestamp_id,priority:2,sort:desc"`
+	SessionID uuid.UUID        `json:"session_id" example:"550e8400-e29b-41d4-a716-446655440000" gorm:"index:idx_session_events_session_id_event_timestamp,priority:1"`
+	Event     SessionEventType `json:"event" example:"session_created" gorm:"index:idx_session_events_session_id_event_timestamp,priority:2"`
 	Data      datatypes.JSON   `json:"data,omitempty" swaggertype:"object"`
-	Timestamp time.Time        `json:"timestamp" example:"2023-01-01T00:00:00Z"`
+	Timestamp time.Time        `json:"timestamp" example:"2023-01-01T00:00:00Z" gorm:"index:idx_session_events_timestamp_id,priority:1,sort:desc;index:idx_session_events_session_id_event_timestamp,priority:3,sort:desc"`
 
 	Session Session `json:"-" gorm:"foreignKey:SessionID;constraint:OnDelete:CASCADE"`
 } //@name SessionEvent
@@ -193,12 +193,12 @@ func (se *SessionEvent) BeforeCreate(tx *gorm.DB) error {
 // @Description Performance metrics including CPU, memory and network usage
 type SessionMetrics struct {
 	ID             uuid.UUID `json:"id" example:"550e8400-e29b-41d4-a716-446655440004"`
-	SessionID      uuid.UUID `json:"session_id" example:"550e8400-e29b-41d4-a716-446655440000"`
+	SessionID      uuid.UUID `json:"session_id" example:"550e8400-e29b-41d4-a716-446655440000" gorm:"index:idx_session_metrics_session_id_timestamp,priority:1"`
 	CPUPercent     *float64  `json:"cpu_percent,omitempty" example:"45.2"`
 	MemoryMB       *float64  `json:"memory_mb,omitempty" example:"1024.5"`
 	NetworkRXBytes *int64    `json:"network_rx_bytes,omitempty" example:"1048576"`
 	NetworkTXBytes *int64    `json:"network_tx_bytes,omitempty" example:"2097152"`
-	Timestamp      time.Time `json:"timestamp" example:"2023-01-01T00:00:00Z"`
+	Timestamp      time.Time `json:"timestamp" example:"2023-01-01T00:00:00Z" gorm:"index:idx_session_metrics_session_id_timestamp,priority:2"` // plus a BRIN index, see migration 20250804090000
 
 	Session Session `json:"-" gorm:"foreignKey:SessionID;constraint:OnDelete:CASCADE"`
 } //@name SessionMetrics
@@ -257,22 +257,43 @@ func (p *Pool) CanAcceptMore() bool {
 	return p.Enabled && p.CurrentSize < p.MaxSize
 }
 
+// SessionMetricsBucket represents aggregated metrics for one time bucket
+// @Description Session metrics averaged over a fixed interval. Buckets without samples have null values and zero samples.
+type SessionMetricsBucket struct {
+	Timestamp      time.Time `json:"timestamp" example:"2023-01-01T00:00:00Z"`
+	CPUPercent     *float64  `json:"cpu_percent" example:"45.2"`
+	MemoryMB       *float64  `json:"memory_mb" example:"1024.5"`
+	NetworkRXBytes *int64    `json:"network_rx_bytes" example:"1048576"`
+	NetworkTXBytes *int64    `json:"network_tx_bytes" example:"2097152"`
+	Samples        int       `json:"samples" example:"12"`
+} //@name SessionMetricsBucket
+
+// SessionMetricsSeriesResponse represents a bucketed metrics time series
+// @Description Dense time series of session metrics between start_time and end_time
+type SessionMetricsSeriesResponse struct {
+	SessionID uuid.UUID              `json:"session_id" example:"550e8400-e29b-41d4-a716-446655440000"`
+	Interval  int                    `json:"interval" example:"60"`
+	Buckets   []SessionMetricsBucket `json:"buckets"`
+} //@name SessionMetricsSeriesResponse
+
 // SessionListResponse represents a response containing a list of sessions
 // @Description Response containing a list of sessions with pagination info
 type SessionListResponse struct {
-	Sessions []Session `json:"sessions"`
-	Total    int       `json:"total" example:"25"`
-	Offset   int       `json:"offset" example:"0"`
-	Limit    int       `json:"limit" example:"100"`
+	Sessions   []Session `json:"sessions"`
+	Total      int       `json:"total" example:"25"`
+	Offset     int       `json:"offset" example:"0"`
+	Limit      int       `json:"limit" example:"100"`
+	NextCursor string    `json:"next_cursor,omitempty" example:"MjAyMy0wMS0wMVQwMDowMDowMFp8NTUwZTg0MDAtZTI5Yi00MWQ0LWE3MTYtNDQ2NjU1NDQwMDAw"`
 } //@name SessionListResponse
 
 // SessionEventListResponse represents a response containing a list of session events
 // @Description Response containing a list of session events with pagination info
 type SessionEventListResponse struct {
-	Events []SessionEvent `json:"events"`
-	Total  int            `json:"total" example:"15"`
-	Offset int            `json:"offset" example:"0"`
-	Limit  int            `json:"limit" example:"100"`
+	Events     []SessionEvent `json:"events"`
+	Total      int            `json:"total" example:"15"`
+	Offset     int            `json:"offset" example:"0"`
+	Limit      int            `json:"limit" example:"100"`
+	NextCursor string         `json:"next_cursor,omitempty" example:"MjAyMy0wMS0wMVQwMDowMDowMFp8NTUwZTg0MDAtZTI5Yi00MWQ0LWE3MTYtNDQ2NjU1NDQwMDAz"`
 } //@name SessionEventListResponse
 
 // ErrorResponse represents an error response
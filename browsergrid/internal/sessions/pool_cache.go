@@ -0,0 +1,64 @@
+package sessions
+
+import (
+	"context"
+	"sync"
+	"time"
+
+	"github.com/google/uuid"
+	"gorm.io/gorm"
+)
+
+// workPoolCacheTTL bounds how stale cached pool settings may be. Pools are
+// edited through the workpool API, which cannot reach this cache, so the
+// TTL is the only invalidation.
+const workPoolCacheTTL = 30 * time.Second
+
+// workPoolCache keeps the pool settings createSession needs so that
+// consecutive sessions for the same pool do not each re-read the row.
+type workPoolCache struct {
+	ttl time.Duration
+
+	mu      sync.Mutex
+	entries map[uuid.UUID]workPoolEntry
+}
+
+type workPoolEntry struct {
+	pool      WorkPool
+	expiresAt time.Time
+}
+
+func newWorkPoolCache(ttl time.Duration) *workPoolCache {
+	return &workPoolCache{
+		ttl:     ttl,
+		entries: make(map[uuid.UUID]workPoolEntry),
+	}
+}
+
+// get returns the pool from cache or loads it with getWorkPool.
+func (c *workPoolCache) get(ctx context.Context, db *gorm.DB, id uuid.UUID) (*WorkPool, error) {
+	c.mu.Lock()
+	entry, ok := c.entries[id]
+	c.mu.Unlock()
+	if ok && time.Now().Before(entry.expiresAt) {
+		pool := entry.pool
+		return &pool, nil
+	}
+
+	pool, err := getWorkPool(ctx, db, id)
+	if err != nil {
+		return nil, err
+	}
+
+	c.mu.Lock()
+	now := time.Now()
+	for k, e := range c.entries {
+		if !now.Before(e.expiresAt) {
+			delete(c.entries, k)
+		}
+	}
+	c.entries[id] = workPoolEntry{pool: *pool, expiresAt: now.Add(c.ttl)}
+	c.mu.Unlock()
+
+	return pool, nil
+}
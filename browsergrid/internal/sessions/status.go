@@ -1,63 +1,64 @@
 package sessions
 
+// eventStatuses maps each event that implies a status change to that
+// status. Events that leave the status alone (heartbeats, config updates,
+// pool removal and draining) are absent.
+var eventStatuses = map[SessionEventType]SessionStatus{
+	EvtSessionCreated:    StatusPending,
+	EvtResourceAllocated: StatusPending,
+	EvtSessionStarting:   StatusStarting,
+	EvtContainerStarted:  StatusStarting,
+	EvtBrowserStarted:    StatusStarting,
+	EvtSessionAvailable:  StatusAvailable,
+	EvtPoolAdded:         StatusAvailable,
+	EvtSessionClaimed:    StatusClaimed,
+	EvtSessionAssigned:   StatusRunning,
+	EvtSessionReady:      StatusRunning,
+	EvtSessionActive:     StatusRunning,
+	EvtSessionIdle:       StatusIdle,
+	EvtSessionCompleted:  StatusCompleted,
+	EvtSessionExpired:    StatusExpired,
+	EvtSessionTimedOut:   StatusTimedOut,
+	EvtSessionTerminated: StatusTerminated,
+	EvtStartupFailed:     StatusFailed,
+	EvtResourceExhausted: StatusFailed,
+	EvtNetworkError:      StatusFailed,
+	EvtBrowserCrashed:    StatusCrashed,
+	EvtContainerCrashed:  StatusCrashed,
+}
+
 func statusFromEvent(e SessionEventType) (SessionStatus, bool) {
-	switch e {
-	case EvtSessionCreated:
-		return StatusPending, true
-	case EvtResourceAllocated:
-		return StatusPending, true
-	case EvtSessionStarting, EvtContainerStarted:
-		return StatusStarting, true
-	case EvtBrowserStarted:
-		return StatusStarting, true
-	case EvtSessionAvailable, EvtPoolAdded:
-		return StatusAvailable, true
-	case EvtSessionClaimed:
-		return StatusClaimed, true
-	case EvtSessionAssigned, EvtSessionReady:
-		return StatusRunning, true
-	case EvtSessionActive:
-		return StatusRunning, true
-	case EvtSessionIdle:
-		return StatusIdle, true
-	case EvtSessionCompleted:
-		return StatusCompleted, true
-	case EvtSessionExpired:
-		return StatusExpired, true
-	case EvtSessionTimedOut:
-		return StatusTimedOut, true
-	case EvtSessionTerminated:
-		return StatusTerminated, true
-	case EvtStartupFailed, EvtResourceExhausted, EvtNetworkError:
-		return StatusFailed, true
-	case EvtBrowserCrashed, EvtContainerCrashed:
-		return StatusCrashed, true
-	case EvtHeartbeat, EvtStatusChanged, EvtConfigUpdated, EvtHealthCheck,
-		EvtPoolRemoved, EvtPoolDrained:
-		return "", false
-	default:
-		return "", false
-	}
+	status, ok := eventStatuses[e]
+	return status, ok
 }
 
-func shouldUpdateStatus(cur, next SessionStatus) bool {
-	order := map[SessionStatus]int{
-		StatusPending:    0,
-		StatusStarting:   1,
-		StatusAvailable:  2,
-		StatusClaimed:    3,
-		StatusRunning:    4,
-		StatusIdle:       4,
-		StatusCompleted:  5,
-		StatusFailed:     5,
-		StatusExpired:    5,
-		StatusCrashed:    5,
-		StatusTimedOut:   5,
-		StatusTerminated: 5,
-	}
+// statusOrder ranks statuses by lifecycle stage. It is built once rather than
+// on every event that may move a session forward.
+var statusOrder = map[SessionStatus]int{
+	StatusPending:    0,
+	StatusStarting:   1,
+	StatusAvailable:  2,
+	StatusClaimed:    3,
+	StatusRunning:    4,
+	StatusIdle:       4,
+	StatusCompleted:  5,
+	StatusFailed:     5,
+	StatusExpired:    5,
+	StatusCrashed:    5,
+	StatusTimedOut:   5,
+	StatusTerminated: 5,
+}
 
-	curOrder := order[cur]
-	nextOrder := order[next]
+// allStatuses lists every session status in lifecycle order.
+var allStatuses = []SessionStatus{
+	StatusPending, StatusStarting, StatusAvailable, StatusClaimed,
+	StatusRunning, StatusIdle, StatusCompleted, StatusFailed,
+	StatusExpired, StatusCrashed, StatusTimedOut, StatusTerminated,
+}
+
+func shouldUpdateStatus(cur, next SessionStatus) bool {
+	curOrder := statusOrder[cur]
+	nextOrder := statusOrder[next]
 
 	if (cur == StatusRunning && next == StatusIdle) ||
 		(cur == StatusIdle && next == StatusRunning) {
@@ -79,6 +80,13 @@ func shouldUpdateStatus(cur, next SessionStatus) bool {
 	return nextOrder > curOrder
 }
 
+// TerminalStatuses lists the statuses IsTerminalStatus reports, shared by
+// queries that filter on them instead of building the list per call.
+var TerminalStatuses = []SessionStatus{
+	StatusCompleted, StatusFailed, StatusExpired,
+	StatusCrashed, StatusTimedOut, StatusTerminated,
+}
+
 func IsTerminalStatus(status SessionStatus) bool {
 	switch status {
 	case StatusCompleted, StatusFailed, StatusExpired,
@@ -105,27 +113,34 @@ func CanTransitionTo(current, target SessionStatus) bool {
 	return shouldUpdateStatus(current, target)
 }
 
-func GetValidTransitions(current SessionStatus) []SessionStatus {
-	if IsTerminalStatus(current) {
-		return []SessionStatus{}
-	}
-
-	var valid []SessionStatus
-	allStatuses := []SessionStatus{
-		StatusPending, StatusStarting, StatusAvailable, StatusClaimed,
-		StatusRunning, StatusIdle, StatusCompleted, StatusFailed,
-		StatusExpired, StatusCrashed, StatusTimedOut, StatusTerminated,
+// validTransitions holds GetValidTransitions' answer for every known
+// status, computed once at startup.
+var validTransitions = func() map[SessionStatus][]SessionStatus {
+	table := make(map[SessionStatus][]SessionStatus, len(allStatuses))
+	for _, current := range allStatuses {
+		table[current] = transitionsFrom(current)
 	}
+	return table
+}()
 
+func transitionsFrom(current SessionStatus) []SessionStatus {
+	valid := []SessionStatus{}
 	for _, status := range allStatuses {
 		if CanTransitionTo(current, status) {
 			valid = append(valid, status)
 		}
 	}
-
 	return valid
 }
 
+func GetValidTransitions(current SessionStatus) []SessionStatus {
+	valid, ok := validTransitions[current]
+	if !ok {
+		return transitionsFrom(current)
+	}
+	return append(make([]SessionStatus, 0, len(valid)), valid...)
+}
+
 func GetPoolTransitions(current SessionStatus) []SessionStatus {
 	switch current {
 	case StatusAvailable:
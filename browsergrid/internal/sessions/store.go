@@ -7,6 +7,7 @@ import (
 
 	"github.com/google/uuid"
 	"gorm.io/gorm"
+	"gorm.io/gorm/clause"
 )
 
 type Store struct{ db *gorm.DB }
@@ -24,9 +25,51 @@ func (s *Store) CreateSession(ctx context.Context, sess *Session) error {
 	return s.db.WithContext(ctx).Create(sess).Error
 }
 
+// CreateSessionWithEvent inserts sess together with its session_created
+// event in one transaction, so creating a session commits once.
+func (s *Store) CreateSessionWithEvent(ctx context.Context, sess *Session) error {
+	if sess.ID == uuid.Nil {
+		sess.ID = uuid.New()
+	}
+
+	return s.db.WithContext(ctx).Transaction(func(tx *gorm.DB) error {
+		if err := tx.Create(sess).Error; err != nil {
+			return err
+		}
+		return tx.Create(&SessionEvent{
+			ID:        uuid.New(),
+			SessionID: sess.ID,
+			Event:     EvtSessionCreated,
+			Timestamp: time.Now(),
+		}).Error
+	})
+}
+
+// sessionInsertBatchSize bounds the rows per INSERT statement so large batches
+// stay well under Postgres' bind parameter limit.
+const sessionInsertBatchSize = 100
+
+// CreateSessions inserts sessions using multi-row INSERTs instead of one
+// round trip per session. The batches share one transaction, so either every
+// session is created or none is; GORM only adds that transaction itself when
+// SkipDefaultTransaction is off.
+func (s *Store) CreateSessions(ctx context.Context, sessions []*Session) error {
+	if len(sessions) == 0 {
+		return nil
+	}
+	for _, sess := range sessions {
+		if sess.ID == uuid.Nil {
+			sess.ID = uuid.New()
+		}
+	}
+	return s.db.WithContext(ctx).Transaction(func(tx *gorm.DB) error {
+		return tx.CreateInBatches(sessions, sessionInsertBatchSize).Error
+	})
+}
+
 func (s *Store) GetSession(ctx context.Context, id uuid.UUID) (*Session, error) {
 	var sess Session
-	err := s.db.WithContext(ctx).First(&sess, "id = ?", id).Error
+	err := s.db.WithContext(ctx).Take(&sess, "id = ?", id).Error
 	if err != nil {
 		return nil, err
 	}
@@ -40,6 +83,42 @@ func (s *Store) UpdateSessionStatus(ctx context.Context, id uuid.UUID, status Se
 		Update("status", status).Error
 }
 
+// MarkSessionStarting moves a session to starting and returns the updated
+// row from the same UPDATE ... RETURNING, so a worker picking up a start task
+// does not need a separate read. It returns gorm.ErrRecordNotFound when the
+// session does not exist.
+func (s *Store) MarkSessionStarting(ctx context.Context, id uuid.UUID) (*Session, error) {
+	var sess Session
+	result := s.db.WithContext(ctx).Model(&sess).
+		Clauses(clause.Returning{}).
+		Where("id = ?", id).
+		Updates(map[string]interface{}{
+			"status":     StatusStarting,
+			"updated_at": time.Now(),
+		})
+	if result.Error != nil {
+		return nil, result.Error
+	}
+	if result.RowsAffected == 0 {
+		return nil, gorm.ErrRecordNotFound
+	}
+	return &sess, nil
+}
+
+// UpdateSessionsStatus sets status on every session in ids with a single
+// UPDATE rather than one statement per session.
+func (s *Store) UpdateSessionsStatus(ctx context.Context, ids []uuid.UUID, status SessionStatus) error {
+	if len(ids) == 0 {
+		return nil
+	}
+	return s.db.WithContext(ctx).Model(&Session{}).
+		Where("id IN ?", ids).
+		Updates(map[string]interface{}{
+			"status":     status,
+			"updated_at": time.Now(),
+		}).Error
+}
+
 func (s *Store) UpdateSessionEndpoints(ctx context.Context, id uuid.UUID, wsEndpoint, liveURL string, status SessionStatus) error {
 	updates := map[string]interface{}{
 		"status":      status,
@@ -65,6 +144,69 @@ func (s *Store) ListSessions(ctx context.Context,
 	status *SessionStatus, start, end *time.Time,
 	offset, limit int) ([]Session, error) {
 
+	var sessions []Session
+	err := s.sessionListQuery(ctx, status, start, end).
+		Order("created_at DESC, id DESC").
+		Offset(offset).
+		Limit(limit).
+		Find(&sessions).Error
+
+	return sessions, err
+}
+
+// ListSessionsAfter returns the page of sessions that follows cursor using
+// keyset pagination on (created_at, id). A nil cursor returns the first page.
+func (s *Store) ListSessionsAfter(ctx context.Context,
+	status *SessionStatus, start, end *time.Time,
+	cursor *Cursor, limit int) ([]Session, error) {
+
+	query := s.sessionListQuery(ctx, status, start, end)
+	if cursor != nil {
+		query = query.Where("(created_at, id) < (?, ?)", cursor.Timestamp, cursor.ID)
+	}
+
+	var sessions []Session
+	err := query.Order("created_at DESC, id DESC").
+		Limit(limit).
+		Find(&sessions).Error
+
+	return sessions, err
+}
+
+// StreamSessions calls fn for each session matching the filters, newest
+// first, reading rows from an open cursor instead of a slice. A limit of
+// zero or less streams every match.
+func (s *Store) StreamSessions(ctx context.Context,
+	status *SessionStatus, start, end *time.Time,
+	limit int, fn func(*Session) error) error {
+
+	query := s.sessionListQuery(ctx, status, start, end).
+		Order("created_at DESC, id DESC")
+	if limit > 0 {
+		query = query.Limit(limit)
+	}
+
+	rows, err := query.Rows()
+	if err != nil {
+		return err
+	}
+	defer rows.Close()
+
+	for rows.Next() {
+		var sess Session
+		if err := s.db.ScanRows(rows, &sess); err != nil {
+			return err
+		}
+		if err := fn(&sess); err != nil {
+			return err
+		}
+	}
+	return rows.Err()
+}
+
+func (s *Store) sessionListQuery(ctx context.Context,
+	status *SessionStatus, start, end *time.Time) *gorm.DB {
+
 	query := s.db.WithContext(ctx).Model(&Session{})
 
 	if status != nil {
@@ -76,14 +218,7 @@ func (s *Store) ListSessions(ctx context.Context,
 	if end != nil {
 		query = query.Where("created_at <= ?", *end)
 	}
-
-	var sessions []Session
-	err := query.Order("created_at DESC").
-		Offset(offset).
-		Limit(limit).
-		Find(&sessions).Error
-
-	return sessions, err
+	return query
 }
 
 func (s *Store) CreatePool(ctx context.Context, pool *Pool) error {
@@ -92,7 +227,7 @@ func (s *Store) CreatePool(ctx context.Context, pool *Pool) error {
 
 func (s *Store) GetPool(ctx context.Context, id string) (*Pool, error) {
 	var pool Pool
-	err := s.db.WithContext(ctx).First(&pool, "id = ?", id).Error
+	err := s.db.WithContext(ctx).Take(&pool, "id = ?", id).Error
 	if err != nil {
 		return nil, err
 	}
@@ -148,105 +283,114 @@ func (s *Store) GetAvailableSessions(ctx context.Context, poolID string, limit i
 	return sessions, err
 }
 
-func (s *Store) ClaimSession(ctx context.Context, sessionID uuid.UUID, claimedBy string) error {
-	now := time.Now()
-
-	return s.db.WithContext(ctx).Transaction(func(tx *gorm.DB) error {
-		var session Session
-		err := tx.Where("id = ? AND status = ? AND claimed_by IS NULL",
-			sessionID, StatusAvailable).First(&session).Error
-		if err != nil {
-			return fmt.Errorf("session not available for claiming: %w", err)
-		}
-
-		err = tx.Model(&Session{}).
-			Where("id = ?", sessionID).
-			Updates(map[string]interface{}{
-				"status":     StatusClaimed,
-				"claimed_at": &now,
-				"claimed_by": claimedBy,
-				"updated_at": now,
-			}).Error
-		if err != nil {
-			return err
-		}
-
-		if session.PoolID != nil {
-			err = tx.Model(&Pool{}).
-				Where("id = ?", *session.PoolID).
-				UpdateColumn("available_size", gorm.Expr("available_size - 1")).Error
-			if err != nil {
-				return err
-			}
-		}
+// claimSQL claims one available session and takes it out of its pool's
+// available count in the same statement, so the two cannot drift apart and
+// the claim costs a single round trip.
+const claimSQL = `
+WITH claimed AS (
+	UPDATE sessions
+	SET status = @claimed, claimed_at = @now, claimed_by = @claimed_by, updated_at = @now
+	WHERE id = @id AND status = @available AND claimed_by IS NULL
+	RETURNING pool_id
+), pool AS (
+	UPDATE session_pools SET available_size = available_size - 1
+	FROM claimed
+	WHERE session_pools.id = claimed.pool_id
+)
+SELECT count(*) FROM claimed`
 
-		return nil
-	})
+// ClaimSession claims an available session with a single conditional UPDATE,
+// so two concurrent callers can never both claim the same session.
+func (s *Store) ClaimSession(ctx context.Context, sessionID uuid.UUID, claimedBy string) error {
+	var claimed int64
+	err := s.db.WithContext(ctx).Raw(claimSQL, map[string]interface{}{
+		"claimed":    StatusClaimed,
+		"available":  StatusAvailable,
+		"claimed_by": claimedBy,
+		"id":         sessionID,
+		"now":        time.Now(),
+	}).Scan(&claimed).Error
+	if err != nil {
+		return err
+	}
+	if claimed == 0 {
+		return fmt.Errorf("session not available for claiming: %w", gorm.ErrRecordNotFound)
+	}
+	return nil
 }
 
-func (s *Store) ReleaseSession(ctx context.Context, sessionID uuid.UUID) error {
-	return s.db.WithContext(ctx).Transaction(func(tx *gorm.DB) error {
-		var session Session
-		err := tx.Where("id = ?", sessionID).First(&session).Error
-		if err != nil {
-			return err
-		}
-
-		if session.IsPooled && session.PoolID != nil {
-			now := time.Now()
-			err = tx.Model(&Session{}).
-				Where("id = ?", sessionID).
-				Updates(map[string]interface{}{
-					"status":       StatusAvailable,
-					"claimed_at":   nil,
-					"claimed_by":   nil,
-					"available_at": &now,
-					"updated_at":   now,
-				}).Error
-			if err == nil {
-				err = tx.Model(&Pool{}).
-					Where("id = ?", *session.PoolID).
-					UpdateColumn("available_size", gorm.Expr("available_size + 1")).Error
-			}
-		} else {
-			err = tx.Model(&Session{}).
-				Where("id = ?", sessionID).
-				Update("status", StatusTerminated).Error
-		}
+// releaseSQL returns a pooled session to its pool and bumps the pool's
+// available count, or terminates the session when it is not pooled. Both
+// branches run in one statement; terminated only fires when released matched
+// nothing, so the two never touch the same row.
+const releaseSQL = `
+WITH released AS (
+	UPDATE sessions
+	SET status = @available, claimed_at = NULL, claimed_by = NULL, available_at = @now, updated_at = @now
+	WHERE id = @id AND is_pooled AND pool_id IS NOT NULL
+	RETURNING pool_id
+), pool AS (
+	UPDATE session_pools SET available_size = available_size + 1
+	FROM released
+	WHERE session_pools.id = released.pool_id
+), terminated AS (
+	UPDATE sessions
+	SET status = @terminated, updated_at = @now
+	WHERE id = @id AND NOT EXISTS (SELECT 1 FROM released)
+	RETURNING id
+)
+SELECT (SELECT count(*) FROM released) + (SELECT count(*) FROM terminated)`
 
+// ReleaseSession returns a pooled session to its pool, or terminates a
+// non-pooled one, in a single round trip.
+func (s *Store) ReleaseSession(ctx context.Context, sessionID uuid.UUID) error {
+	var released int64
+	err := s.db.WithContext(ctx).Raw(releaseSQL, map[string]interface{}{
+		"available":  StatusAvailable,
+		"terminated": StatusTerminated,
+		"id":         sessionID,
+		"now":        time.Now(),
+	}).Scan(&released).Error
+	if err != nil {
 		return err
-	})
+	}
+	if released == 0 {
+		return gorm.ErrRecordNotFound
+	}
+	return nil
 }
 
-func (s *Store) MarkSessionAvailable(ctx context.Context, sessionID uuid.UUID) error {
-	now := time.Now()
-
-	return s.db.WithContext(ctx).Transaction(func(tx *gorm.DB) error {
-		var session Session
-		err := tx.Where("id = ?", sessionID).First(&session).Error
-		if err != nil {
-			return err
-		}
-
-		err = tx.Model(&Session{}).
-			Where("id = ?", sessionID).
-			Updates(map[string]interface{}{
-				"status":       StatusAvailable,
-				"available_at": &now,
-				"updated_at":   now,
-			}).Error
-		if err != nil {
-			return err
-		}
-
-		if session.IsPooled && session.PoolID != nil {
-			err = tx.Model(&Pool{}).
-				Where("id = ?", *session.PoolID).
-				UpdateColumn("available_size", gorm.Expr("available_size + 1")).Error
-		}
+// markAvailableSQL flags a session as available and, when it is pooled,
+// bumps its pool's available count in the same statement.
+const markAvailableSQL = `
+WITH marked AS (
+	UPDATE sessions
+	SET status = @available, available_at = @now, updated_at = @now
+	WHERE id = @id
+	RETURNING is_pooled, pool_id
+), pool AS (
+	UPDATE session_pools SET available_size = available_size + 1
+	FROM marked
+	WHERE session_pools.id = marked.pool_id AND marked.is_pooled
+)
+SELECT count(*) FROM marked`
 
+// MarkSessionAvailable flags a session as available in a single statement,
+// bumping its pool's available_size when it is pooled.
+func (s *Store) MarkSessionAvailable(ctx context.Context, sessionID uuid.UUID) error {
+	var marked int64
+	err := s.db.WithContext(ctx).Raw(markAvailableSQL, map[string]interface{}{
+		"available": StatusAvailable,
+		"id":        sessionID,
+		"now":       time.Now(),
+	}).Scan(&marked).Error
+	if err != nil {
 		return err
-	})
+	}
+	if marked == 0 {
+		return gorm.ErrRecordNotFound
+	}
+	return nil
 }
 
 func (s *Store) GetPoolSessions(ctx context.Context, poolID string, status *SessionStatus) ([]Session, error) {
@@ -279,10 +423,65 @@ func (s *Store) CreateEvent(ctx context.Context, ev *SessionEvent) error {
 	return s.db.WithContext(ctx).Create(ev).Error
 }
 
+// RecordEvent stores ev and, when the event implies a status transition,
+// moves the session to that status in the same transaction.
+func (s *Store) RecordEvent(ctx context.Context, ev *SessionEvent) error {
+	if ev.ID == uuid.Nil {
+		ev.ID = uuid.New()
+	}
+
+	newStatus, shouldUpdate := statusFromEvent(ev.Event)
+	if !shouldUpdate {
+		return s.db.WithContext(ctx).Create(ev).Error
+	}
+
+	return s.db.WithContext(ctx).Transaction(func(tx *gorm.DB) error {
+		if err := tx.Create(ev).Error; err != nil {
+			return err
+		}
+		return tx.Model(&Session{}).
+			Where("id = ?", ev.SessionID).
+			Update("status", newStatus).Error
+	})
+}
+
 func (s *Store) ListEvents(ctx context.Context,
 	sessionID *uuid.UUID, eventType *SessionEventType,
 	start, end *time.Time, offset, limit int) ([]SessionEvent, error) {
 
+	var events []SessionEvent
+	err := s.eventListQuery(ctx, sessionID, eventType, start, end).
+		Order("timestamp DESC, id DESC").
+		Offset(offset).
+		Limit(limit).
+		Find(&events).Error
+
+	return events, err
+}
+
+// ListEventsAfter returns the page of events that follows cursor using
+// keyset pagination on (timestamp, id). A nil cursor returns the first page.
+func (s *Store) ListEventsAfter(ctx context.Context,
+	sessionID *uuid.UUID, eventType *SessionEventType,
+	start, end *time.Time, cursor *Cursor, limit int) ([]SessionEvent, error) {
+
+	query := s.eventListQuery(ctx, sessionID, eventType, start, end)
+	if cursor != nil {
+		query = query.Where("(timestamp, id) < (?, ?)", cursor.Timestamp, cursor.ID)
+	}
+
+	var events []SessionEvent
+	err := query.Order("timestamp DESC, id DESC").
+		Limit(limit).
+		Find(&events).Error
+
+	return events, err
+}
+
+func (s *Store) eventListQuery(ctx context.Context,
+	sessionID *uuid.UUID, eventType *SessionEventType,
+	start, end *time.Time) *gorm.DB {
+
 	query := s.db.WithContext(ctx).Model(&SessionEvent{})
 
 	if sessionID != nil {
@@ -297,14 +496,7 @@ func (s *Store) ListEvents(ctx context.Context,
 	if end != nil {
 		query = query.Where("timestamp <= ?", *end)
 	}
-
-	var events []SessionEvent
-	err := query.Order("timestamp DESC").
-		Offset(offset).
-		Limit(limit).
-		Find(&events).Error
-
-	return events, err
+	return query
 }
 
 func (s *Store) CreateMetrics(ctx context.Context, metrics *SessionMetrics) error {
@@ -314,6 +506,71 @@ func (s *Store) CreateMetrics(ctx context.Context, metrics *SessionMetrics) erro
 	return s.db.WithContext(ctx).Create(metrics).Error
 }
 
+// metricsSeriesSQL buckets a session's metrics with generate_series so that
+// intervals without samples are returned as empty rows rather than omitted.
+const metricsSeriesSQL = `
+WITH buckets AS (
+	SELECT generate_series(@start::timestamptz, @end::timestamptz, @step * interval '1 second') AS ts
+)
+SELECT
+	b.ts AS timestamp,
+	avg(m.cpu_percent)::float8 AS cpu_percent,
+	avg(m.memory_mb)::float8 AS memory_mb,
+	max(m.network_rx_bytes) AS network_rx_bytes,
+	max(m.network_tx_bytes) AS network_tx_bytes,
+	count(m.id) AS samples
+FROM buckets b
+LEFT JOIN session_metrics m
+	ON m.session_id = @session_id
+	AND m.timestamp >= b.ts
+	AND m.timestamp < b.ts + @step * interval '1 second'
+GROUP BY b.ts
+ORDER BY b.ts`
+
+// MetricsSeries aggregates a session's metrics into fixed-width buckets
+// covering [start, end].
+func (s *Store) MetricsSeries(ctx context.Context, sessionID uuid.UUID,
+	start, end time.Time, interval time.Duration) ([]SessionMetricsBucket, error) {
+
+	var buckets []SessionMetricsBucket
+	err := s.db.WithContext(ctx).Raw(metricsSeriesSQL, map[string]interface{}{
+		"session_id": sessionID,
+		"start":      start,
+		"end":        end,
+		"step":       interval.Seconds(),
+	}).Scan(&buckets).Error
+
+	return buckets, err
+}
+
+// StreamMetrics calls fn for every metrics sample of a session in [start, end],
+// oldest first. Rows are read from an open cursor one at a time rather than
+// loaded into a slice, so memory use does not grow with the time range.
+func (s *Store) StreamMetrics(ctx context.Context, sessionID uuid.UUID,
+	start, end time.Time, fn func(*SessionMetrics) error) error {
+
+	db := s.db.WithContext(ctx)
+	rows, err := db.Model(&SessionMetrics{}).
+		Where("session_id = ? AND timestamp >= ? AND timestamp <= ?", sessionID, start, end).
+		Order("timestamp ASC").
+		Rows()
+	if err != nil {
+		return err
+	}
+	defer rows.Close()
+
+	for rows.Next() {
+		var m SessionMetrics
+		if err := db.ScanRows(rows, &m); err != nil {
+			return err
+		}
+		if err := fn(&m); err != nil {
+			return err
+		}
+	}
+	return rows.Err()
+}
+
 func (s *Store) AutoMigrate() error {
 	return s.db.AutoMigrate(
 		&Session{},
@@ -202,10 +202,7 @@ func TestListSessions(t *testing.T) {
 		},
 	}
 
-	for _, session := range testSessions {
-		err := store.CreateSession(ctx, session)
-		require.NoError(t, err)
-	}
+	require.NoError(t, store.CreateSessions(ctx, testSessions))
 
 	tests := []struct {
 		name           string
@@ -258,6 +255,11 @@ func TestListSessions(t *testing.T) {
 			minSessions:    0,
 			maxSessions:    0,
 		},
+		{
+			name:           "invalid cursor",
+			queryParams:    "?cursor=not-a-cursor",
+			expectedStatus: http.StatusBadRequest,
+		},
 	}
 
 	for _, tt := range tests {
@@ -683,6 +685,114 @@ func TestCreateMetrics(t *testing.T) {
 	}
 }
 
+func TestListSessions_NDJSON(t *testing.T) {
+	db, router := setupHTTPTestDB(t)
+	store := NewStore(db)
+
+	ctx := context.Background()
+
+	for i := 0; i < 3; i++ {
+		require.NoError(t, store.CreateSession(ctx, &Session{
+			Browser: BrowserChrome, Version: VerLatest, OperatingSystem: OSLinux,
+			Screen: ScreenConfig{Width: 1920, Height: 1080, DPI: 96, Scale: 1.0},
+			Status: StatusRunning,
+		}))
+	}
+
+	req, err := http.NewRequest("GET", "/api/v1/sessions?limit=2", nil)
+	require.NoError(t, err)
+	req.Header.Set("Accept", "application/x-ndjson")
+
+	rr := httptest.NewRecorder()
+	router.ServeHTTP(rr, req)
+
+	assert.Equal(t, http.StatusOK, rr.Code)
+	assert.Equal(t, "application/x-ndjson", rr.Header().Get("Content-Type"))
+
+	lines := bytes.Split(bytes.TrimSpace(rr.Body.Bytes()), []byte("\n"))
+	require.Len(t, lines, 2)
+
+	var prev *time.Time
+	for _, line := range lines {
+		var sess Session
+		require.NoError(t, json.Unmarshal(line, &sess))
+		assert.Equal(t, StatusRunning, sess.Status)
+		if prev != nil {
+			assert.False(t, sess.CreatedAt.After(*prev), "sessions should be newest first")
+		}
+		prev = &sess.CreatedAt
+	}
+
+	// Without a limit the stream falls back to maxSessionStreamSize rather
+	// than failing.
+	req, err = http.NewRequest("GET", "/api/v1/sessions", nil)
+	require.NoError(t, err)
+	req.Header.Set("Accept", "application/x-ndjson")
+
+	rr = httptest.NewRecorder()
+	router.ServeHTTP(rr, req)
+
+	assert.Equal(t, http.StatusOK, rr.Code)
+	assert.Len(t, bytes.Split(bytes.TrimSpace(rr.Body.Bytes()), []byte("\n")), 3)
+}
+
+func TestStreamMetrics(t *testing.T) {
+	db, router := setupHTTPTestDB(t)
+	store := NewStore(db)
+
+	ctx := context.Background()
+
+	testSession := &Session{
+		Browser: BrowserChrome, Version: VerLatest, OperatingSystem: OSLinux,
+		Screen: ScreenConfig{Width: 1920, Height: 1080, DPI: 96, Scale: 1.0},
+		Status: StatusRunning,
+	}
+	require.NoError(t, store.CreateSession(ctx, testSession))
+
+	now := time.Now()
+	for i := 0; i < 3; i++ {
+		require.NoError(t, store.CreateMetrics(ctx, &SessionMetrics{
+			SessionID:  testSession.ID,
+			CPUPercent: &[]float64{float64(10 * i)}[0],
+			Timestamp:  now.Add(-time.Duration(3-i) * time.Minute),
+		}))
+	}
+
+	req, err := http.NewRequest("GET", "/api/v1/sessions/"+testSession.ID.String()+"/metrics/raw", nil)
+	require.NoError(t, err)
+
+	rr := httptest.NewRecorder()
+	router.ServeHTTP(rr, req)
+
+	assert.Equal(t, http.StatusOK, rr.Code)
+	assert.Equal(t, "application/x-ndjson", rr.Header().Get("Content-Type"))
+
+	lines := bytes.Split(bytes.TrimSpace(rr.Body.Bytes()), []byte("\n"))
+	require.Len(t, lines, 3)
+
+	var prev time.Time
+	for _, line := range lines {
+		var m SessionMetrics
+		require.NoError(t, json.Unmarshal(line, &m))
+		assert.Equal(t, testSession.ID, m.SessionID)
+		assert.False(t, m.Timestamp.Before(prev), "samples should be oldest first")
+		prev = m.Timestamp
+	}
+
+	req, err = http.NewRequest("GET", "/api/v1/sessions/"+testSession.ID.String()+"/metrics/raw?start_time=bad", nil)
+	require.NoError(t, err)
+	rr = httptest.NewRecorder()
+	router.ServeHTTP(rr, req)
+	assert.Equal(t, http.StatusBadRequest, rr.Code)
+
+	req, err = http.NewRequest("GET", "/api/v1/sessions/"+testSession.ID.String()+
+		"/metrics/raw?start_time=2025-01-01T00:00:00Z&end_time=2025-01-02T00:00:01Z", nil)
+	require.NoError(t, err)
+	rr = httptest.NewRecorder()
+	router.ServeHTTP(rr, req)
+	assert.Equal(t, http.StatusBadRequest, rr.Code)
+}
+
 func TestSessionStatusTransitions(t *testing.T) {
 	db, router := setupHTTPTestDB(t)
 	store := NewStore(db)
@@ -769,3 +879,30 @@ func TestConcurrentRequests(t *testing.T) {
 
 	assert.Equal(t, numGoroutines, successCount, "All concurrent requests should succeed")
 }
+
+func TestWorkPoolCache(t *testing.T) {
+	db, _ := setupHTTPTestDB(t)
+	ctx := context.Background()
+
+	poolID, err := (&mockPoolService{db: db}).GetOrCreateDefault(ctx, "docker")
+	require.NoError(t, err)
+
+	pools := newWorkPoolCache(time.Minute)
+	pool, err := pools.get(ctx, db, poolID)
+	require.NoError(t, err)
+	assert.Equal(t, 1800, pool.MaxSessionDuration)
+
+	require.NoError(t, db.Exec("UPDATE work_pools SET max_session_duration = 60 WHERE id = ?", poolID).Error)
+
+	pool, err = pools.get(ctx, db, poolID)
+	require.NoError(t, err)
+	assert.Equal(t, 1800, pool.MaxSessionDuration, "fresh entry should be served from cache")
+
+	expired := newWorkPoolCache(0)
+	pool, err = expired.get(ctx, db, poolID)
+	require.NoError(t, err)
+	assert.Equal(t, 60, pool.MaxSessionDuration)
+
+	_, err = pools.get(ctx, db, uuid.New())
+	assert.Error(t, err)
+}
@@ -2,6 +2,7 @@ package sessions
 
 import (
 	"context"
+	"errors"
 	"log"
 	"os"
 	"testing"
@@ -146,6 +147,103 @@ func TestStore_CreateSession(t *testing.T) {
 	}
 }
 
+func TestStore_CreateSessionWithEvent(t *testing.T) {
+	db := setupTestDB(t)
+	store := NewStore(db)
+	ctx := context.Background()
+
+	sess := &Session{
+		Browser:         BrowserChrome,
+		Version:         VerLatest,
+		OperatingSystem: OSLinux,
+		Screen:          ScreenConfig{Width: 1920, Height: 1080, DPI: 96, Scale: 1.0},
+		Status:          StatusPending,
+	}
+	if err := store.CreateSessionWithEvent(ctx, sess); err != nil {
+		t.Fatalf("CreateSessionWithEvent() error = %v", err)
+	}
+	if sess.ID == uuid.Nil {
+		t.Fatal("Expected session ID to be generated")
+	}
+
+	eventType := EvtSessionCreated
+	events, err := store.ListEvents(ctx, &sess.ID, &eventType, nil, nil, 0, 10)
+	if err != nil {
+		t.Fatalf("Failed to list events: %v", err)
+	}
+	if len(events) != 1 {
+		t.Errorf("Expected 1 session_created event, got %d", len(events))
+	}
+}
+
+func TestStore_CreateSessions(t *testing.T) {
+	db := setupTestDB(t)
+	store := NewStore(db)
+	ctx := context.Background()
+
+	batch := make([]*Session, 250)
+	for i := range batch {
+		batch[i] = &Session{
+			Browser: BrowserChrome, Version: VerLatest, OperatingSystem: OSLinux,
+			Screen: ScreenConfig{Width: 1920, Height: 1080, DPI: 96, Scale: 1.0},
+			Status: StatusPending,
+		}
+	}
+
+	if err := store.CreateSessions(ctx, batch); err != nil {
+		t.Fatalf("CreateSessions() error = %v", err)
+	}
+
+	for _, session := range batch {
+		if session.ID == uuid.Nil {
+			t.Fatal("Expected session ID to be generated")
+		}
+	}
+
+	var count int64
+	if err := db.Model(&Session{}).Count(&count).Error; err != nil {
+		t.Fatalf("Failed to count sessions: %v", err)
+	}
+	if count != int64(len(batch)) {
+		t.Errorf("Expected %d sessions, got %d", len(batch), count)
+	}
+
+	if err := store.CreateSessions(ctx, nil); err != nil {
+		t.Errorf("CreateSessions(nil) error = %v", err)
+	}
+}
+
+func TestStore_CreateSessions_AllOrNothing(t *testing.T) {
+	db := setupTestDB(t)
+	// Match the binaries' config, where GORM adds no implicit transaction.
+	store := NewStore(db.Session(&gorm.Session{SkipDefaultTransaction: true}))
+	ctx := context.Background()
+
+	batch := make([]*Session, 250)
+	for i := range batch {
+		batch[i] = &Session{
+			ID:      uuid.New(),
+			Browser: BrowserChrome, Version: VerLatest, OperatingSystem: OSLinux,
+			Screen: ScreenConfig{Width: 1920, Height: 1080, DPI: 96, Scale: 1.0},
+			Status: StatusPending,
+		}
+	}
+	// The second INSERT batch collides with a row from the first.
+	batch[150].ID = batch[0].ID
+
+	if err := store.CreateSessions(ctx, batch); err == nil {
+		t.Fatal("Expected CreateSessions() to fail on a duplicate ID")
+	}
+
+	var count int64
+	if err := db.Model(&Session{}).Count(&count).Error; err != nil {
+		t.Fatalf("Failed to count sessions: %v", err)
+	}
+	if count != 0 {
+		t.Errorf("Expected no sessions after a failed batch, got %d", count)
+	}
+}
+
 func TestStore_GetSession(t *testing.T) {
 	db := setupTestDB(t)
 	store := NewStore(db)
@@ -256,6 +354,80 @@ func TestStore_UpdateSessionStatus(t *testing.T) {
 	}
 }
 
+func TestStore_UpdateSessionsStatus(t *testing.T) {
+	db := setupTestDB(t)
+	store := NewStore(db)
+	ctx := context.Background()
+
+	var ids []uuid.UUID
+	for i := 0; i < 3; i++ {
+		sess := &Session{
+			Browser:         BrowserChrome,
+			Version:         VerLatest,
+			OperatingSystem: OSLinux,
+			Screen:          ScreenConfig{Width: 1920, Height: 1080, DPI: 96, Scale: 1.0},
+			Status:          StatusPending,
+		}
+		if err := store.CreateSession(ctx, sess); err != nil {
+			t.Fatalf("Failed to create test session: %v", err)
+		}
+		ids = append(ids, sess.ID)
+	}
+
+	if err := store.UpdateSessionsStatus(ctx, ids[:2], StatusFailed); err != nil {
+		t.Fatalf("UpdateSessionsStatus() error = %v", err)
+	}
+	if err := store.UpdateSessionsStatus(ctx, nil, StatusFailed); err != nil {
+		t.Fatalf("UpdateSessionsStatus() with no IDs error = %v", err)
+	}
+
+	for i, id := range ids {
+		sess, err := store.GetSession(ctx, id)
+		if err != nil {
+			t.Fatalf("Failed to get session: %v", err)
+		}
+		want := StatusFailed
+		if i == 2 {
+			want = StatusPending
+		}
+		if sess.Status != want {
+			t.Errorf("Session %d: expected status %s, got %s", i, want, sess.Status)
+		}
+	}
+}
+
+func TestStore_MarkSessionStarting(t *testing.T) {
+	db := setupTestDB(t)
+	store := NewStore(db)
+	ctx := context.Background()
+
+	sess := &Session{
+		Browser:         BrowserChrome,
+		Version:         VerLatest,
+		OperatingSystem: OSLinux,
+		Screen:          ScreenConfig{Width: 1920, Height: 1080, DPI: 96, Scale: 1.0},
+		Status:          StatusPending,
+	}
+	if err := store.CreateSession(ctx, sess); err != nil {
+		t.Fatalf("Failed to create test session: %v", err)
+	}
+
+	got, err := store.MarkSessionStarting(ctx, sess.ID)
+	if err != nil {
+		t.Fatalf("MarkSessionStarting() error = %v", err)
+	}
+	if got.ID != sess.ID || got.Status != StatusStarting {
+		t.Errorf("Expected session %s in status %s, got %s in %s", sess.ID, StatusStarting, got.ID, got.Status)
+	}
+	if got.Browser != BrowserChrome || got.Screen.Width != 1920 {
+		t.Errorf("Expected returned row to carry session fields, got %+v", got)
+	}
+
+	if _, err := store.MarkSessionStarting(ctx, uuid.New()); !errors.Is(err, gorm.ErrRecordNotFound) {
+		t.Errorf("Expected ErrRecordNotFound for missing session, got %v", err)
+	}
+}
+
 func TestStore_ListSessions(t *testing.T) {
 	db := setupTestDB(t)
 	store := NewStore(db)
@@ -364,6 +536,66 @@ func TestStore_ListSessions(t *testing.T) {
 	}
 }
 
+func TestStore_ListSessionsAfter(t *testing.T) {
+	db := setupTestDB(t)
+	store := NewStore(db)
+	ctx := context.Background()
+
+	base := time.Now().Add(-time.Hour)
+	for i := 0; i < 5; i++ {
+		session := &Session{
+			Browser: BrowserChrome, Version: VerLatest, OperatingSystem: OSLinux,
+			Screen:    ScreenConfig{Width: 1920, Height: 1080, DPI: 96, Scale: 1.0},
+			Status:    StatusPending,
+			CreatedAt: base.Add(time.Duration(i) * time.Minute),
+		}
+		if err := store.CreateSession(ctx, session); err != nil {
+			t.Fatalf("Failed to create test session: %v", err)
+		}
+	}
+
+	seen := make(map[uuid.UUID]bool)
+	var cursor *Cursor
+	var prev time.Time
+	pages := 0
+	for {
+		page, err := store.ListSessionsAfter(ctx, nil, nil, nil, cursor, 2)
+		if err != nil {
+			t.Fatalf("ListSessionsAfter() error = %v", err)
+		}
+		if len(page) == 0 {
+			break
+		}
+		pages++
+		for _, session := range page {
+			if seen[session.ID] {
+				t.Errorf("Session %s returned twice", session.ID)
+			}
+			seen[session.ID] = true
+			if !prev.IsZero() && session.CreatedAt.After(prev) {
+				t.Errorf("Sessions not ordered by created_at DESC")
+			}
+			prev = session.CreatedAt
+		}
+		last := page[len(page)-1]
+		cursor, err = DecodeCursor(Cursor{Timestamp: last.CreatedAt, ID: last.ID}.Encode())
+		if err != nil {
+			t.Fatalf("DecodeCursor() error = %v", err)
+		}
+	}
+
+	if len(seen) != 5 {
+		t.Errorf("Expected 5 sessions across pages, got %d", len(seen))
+	}
+	if pages != 3 {
+		t.Errorf("Expected 3 pages, got %d", pages)
+	}
+
+	if _, err := DecodeCursor("not-a-cursor"); err != ErrInvalidCursor {
+		t.Errorf("Expected ErrInvalidCursor, got %v", err)
+	}
+}
+
 func TestStore_PoolOperations(t *testing.T) {
 	db := setupTestDB(t)
 	store := NewStore(db)
@@ -483,6 +715,14 @@ func TestStore_PooledSessionOperations(t *testing.T) {
 		t.Errorf("Expected 1 available session, got %d", len(availableSessions))
 	}
 
+	pool, err := store.GetPool(ctx, testPool.ID)
+	if err != nil {
+		t.Fatalf("Failed to get pool: %v", err)
+	}
+	if pool.AvailableSize != 1 {
+		t.Errorf("Expected available_size 1 after marking available, got %d", pool.AvailableSize)
+	}
+
 	claimedBy := "user123"
 	err = store.ClaimSession(ctx, testSession.ID, claimedBy)
 	if err != nil {
@@ -500,6 +740,14 @@ func TestStore_PooledSessionOperations(t *testing.T) {
 		t.Errorf("Expected claimed_by %v, got %v", claimedBy, claimedSession.ClaimedBy)
 	}
 
+	pool, err = store.GetPool(ctx, testPool.ID)
+	if err != nil {
+		t.Fatalf("Failed to get pool: %v", err)
+	}
+	if pool.AvailableSize != 0 {
+		t.Errorf("Expected available_size 0 after claim, got %d", pool.AvailableSize)
+	}
+
 	err = store.ReleaseSession(ctx, testSession.ID)
 	if err != nil {
 		t.Fatalf("Failed to release session: %v", err)
@@ -515,6 +763,46 @@ func TestStore_PooledSessionOperations(t *testing.T) {
 	if releasedSession.ClaimedBy != nil {
 		t.Errorf("Expected claimed_by to be nil, got %v", releasedSession.ClaimedBy)
 	}
+
+	pool, err = store.GetPool(ctx, testPool.ID)
+	if err != nil {
+		t.Fatalf("Failed to get pool: %v", err)
+	}
+	if pool.AvailableSize != 1 {
+		t.Errorf("Expected available_size 1 after release, got %d", pool.AvailableSize)
+	}
+}
+
+func TestStore_ReleaseSession_NonPooled(t *testing.T) {
+	db := setupTestDB(t)
+	store := NewStore(db)
+	ctx := context.Background()
+
+	session := &Session{
+		Browser:         BrowserChrome,
+		Version:         VerLatest,
+		OperatingSystem: OSLinux,
+		Screen:          ScreenConfig{Width: 1920, Height: 1080, DPI: 96, Scale: 1.0},
+		Status:          StatusRunning,
+	}
+	if err := store.CreateSession(ctx, session); err != nil {
+		t.Fatalf("Failed to create session: %v", err)
+	}
+
+	if err := store.ReleaseSession(ctx, session.ID); err != nil {
+		t.Fatalf("Failed to release session: %v", err)
+	}
+	released, err := store.GetSession(ctx, session.ID)
+	if err != nil {
+		t.Fatalf("Failed to get released session: %v", err)
+	}
+	if released.Status != StatusTerminated {
+		t.Errorf("Expected status %v, got %v", StatusTerminated, released.Status)
+	}
+
+	if err := store.ReleaseSession(ctx, uuid.New()); !errors.Is(err, gorm.ErrRecordNotFound) {
+		t.Errorf("Expected gorm.ErrRecordNotFound for a missing session, got %v", err)
+	}
 }
 
 func TestStore_ClaimSession_EdgeCases(t *testing.T) {
@@ -645,6 +933,52 @@ func TestStore_EventOperations(t *testing.T) {
 	}
 }
 
+func TestStore_RecordEvent(t *testing.T) {
+	db := setupTestDB(t)
+	store := NewStore(db)
+	ctx := context.Background()
+
+	testSession := &Session{
+		Browser:         BrowserChrome,
+		Version:         VerLatest,
+		OperatingSystem: OSLinux,
+		Screen:          ScreenConfig{Width: 1920, Height: 1080, DPI: 96, Scale: 1.0},
+		Status:          StatusPending,
+	}
+	if err := store.CreateSession(ctx, testSession); err != nil {
+		t.Fatalf("Failed to create test session: %v", err)
+	}
+
+	ev := &SessionEvent{SessionID: testSession.ID, Event: EvtBrowserStarted}
+	if err := store.RecordEvent(ctx, ev); err != nil {
+		t.Fatalf("RecordEvent() error = %v", err)
+	}
+	if ev.ID == uuid.Nil {
+		t.Error("Expected event ID to be generated")
+	}
+
+	expected, _ := statusFromEvent(EvtBrowserStarted)
+	sess, err := store.GetSession(ctx, testSession.ID)
+	if err != nil {
+		t.Fatalf("Failed to get session: %v", err)
+	}
+	if sess.Status != expected {
+		t.Errorf("Expected status %s, got %s", expected, sess.Status)
+	}
+
+	if err := store.RecordEvent(ctx, &SessionEvent{SessionID: testSession.ID, Event: EvtHeartbeat}); err != nil {
+		t.Fatalf("RecordEvent() without transition error = %v", err)
+	}
+
+	events, err := store.ListEvents(ctx, &testSession.ID, nil, nil, nil, 0, 100)
+	if err != nil {
+		t.Fatalf("Failed to list events: %v", err)
+	}
+	if len(events) != 2 {
+		t.Errorf("Expected 2 events, got %d", len(events))
+	}
+}
+
 func TestStore_MetricsOperations(t *testing.T) {
 	db := setupTestDB(t)
 	store := NewStore(db)
@@ -693,6 +1027,60 @@ func TestStore_MetricsOperations(t *testing.T) {
 	}
 }
 
+func TestStore_MetricsSeries(t *testing.T) {
+	db := setupTestDB(t)
+	store := NewStore(db)
+	ctx := context.Background()
+
+	testSession := &Session{
+		Browser:         BrowserChrome,
+		Version:         VerLatest,
+		OperatingSystem: OSLinux,
+		Screen:          ScreenConfig{Width: 1920, Height: 1080, DPI: 96, Scale: 1.0},
+		Status:          StatusRunning,
+	}
+	if err := store.CreateSession(ctx, testSession); err != nil {
+		t.Fatalf("Failed to create test session: %v", err)
+	}
+
+	start := time.Now().Add(-10 * time.Minute).Truncate(time.Minute)
+	end := start.Add(4 * time.Minute)
+
+	// Two samples in the first bucket, one in the third, none in the others
+	for _, offset := range []time.Duration{10 * time.Second, 40 * time.Second, 2*time.Minute + 5*time.Second} {
+		cpu := 50.0
+		if err := store.CreateMetrics(ctx, &SessionMetrics{
+			SessionID:  testSession.ID,
+			CPUPercent: &cpu,
+			Timestamp:  start.Add(offset),
+		}); err != nil {
+			t.Fatalf("Failed to create metrics: %v", err)
+		}
+	}
+
+	buckets, err := store.MetricsSeries(ctx, testSession.ID, start, end, time.Minute)
+	if err != nil {
+		t.Fatalf("MetricsSeries() error = %v", err)
+	}
+
+	if len(buckets) != 5 {
+		t.Fatalf("Expected 5 buckets, got %d", len(buckets))
+	}
+
+	expectedSamples := []int{2, 0, 1, 0, 0}
+	for i, bucket := range buckets {
+		if bucket.Samples != expectedSamples[i] {
+			t.Errorf("Bucket %d: expected %d samples, got %d", i, expectedSamples[i], bucket.Samples)
+		}
+		if bucket.Samples == 0 && bucket.CPUPercent != nil {
+			t.Errorf("Bucket %d: expected nil CPU percent for empty bucket", i)
+		}
+	}
+	if buckets[0].CPUPercent == nil || *buckets[0].CPUPercent != 50.0 {
+		t.Errorf("Expected averaged CPU percent 50, got %v", buckets[0].CPUPercent)
+	}
+}
+
 func TestStore_CleanupExpiredSessions(t *testing.T) {
 	db := setupTestDB(t)
 	store := NewStore(db)
@@ -1,38 +1,45 @@
 package workpool
 
 import (
+	"errors"
 	"net/http"
 	"strconv"
 
 	"github.com/gin-gonic/gin"
+	json "github.com/goccy/go-json"
 	"github.com/google/uuid"
 	"gorm.io/gorm"
+
+	"github.com/autocrawlerHQ/browsergrid/internal/middleware"
+	"github.com/autocrawlerHQ/browsergrid/internal/sessions"
 )
 
 func RegisterRoutes(rg *gin.RouterGroup, db *gorm.DB) {
 	store := NewStore(db)
+	lists := newListCache(workPoolListCacheTTL, workPoolListCacheMaxEntries)
 
-	rg.POST("/workpools", createWorkPool(store))
-	rg.GET("/workpools", listWorkPools(store))
-	rg.GET("/workpools/:id", getWorkPool(store))
-	rg.PATCH("/workpools/:id", updateWorkPool(store))
-	rg.DELETE("/workpools/:id", deleteWorkPool(store))
-	rg.POST("/workpools/:id/scale", scaleWorkPool(store))
-	rg.POST("/workpools/:id/drain", drainWorkPool(store))
+	rg.POST("/workpools", createWorkPool(store, lists))
+	rg.GET("/workpools", middleware.ETag(), listWorkPools(store, lists))
+	rg.GET("/workpools/:id", middleware.ETag(), getWorkPool(store))
+	rg.PATCH("/workpools/:id", updateWorkPool(store, lists))
+	rg.DELETE("/workpools/:id", deleteWorkPool(store, lists))
+	rg.POST("/workpools/:id/scale", scaleWorkPool(store, lists))
+	rg.POST("/workpools/:id/drain", drainWorkPool(store, lists))
 }
 
 // CreateWorkPool creates a new work pool
 // @Summary Create a new work pool
-// @Description Create a new work pool to manage browser workers
+// @Description Create a new work pool to manage browser workers. Names starting with "default-" are reserved for per-provider default pools and must be unique.
 // @Tags workpools
 // @Accept json
 // @Produce json
 // @Param workpool body WorkPool true "Work pool configuration"
 // @Success 201 {object} WorkPool
 // @Failure 400 {object} ErrorResponse
+// @Failure 409 {object} ErrorResponse "A pool with this default- name already exists"
 // @Failure 500 {object} ErrorResponse
 // @Router /api/v1/workpools [post]
-func createWorkPool(store *Store) gin.HandlerFunc {
+func createWorkPool(store *Store, lists *listCache) gin.HandlerFunc {
 	return func(c *gin.Context) {
 		var req WorkPool
 		if err := c.ShouldBindJSON(&req); err != nil {
@@ -54,9 +61,14 @@ func createWorkPool(store *Store) gin.HandlerFunc {
 		}
 
 		if err := store.CreateWorkPool(c.Request.Context(), &req); err != nil {
+			if errors.Is(err, ErrDefaultPoolNameTaken) {
+				c.JSON(http.StatusConflict, gin.H{"error": err.Error()})
+				return
+			}
 			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 			return
 		}
+		lists.invalidate()
 
 		c.JSON(http.StatusCreated, req)
 	}
@@ -69,10 +81,13 @@ func createWorkPool(store *Store) gin.HandlerFunc {
 // @Accept json
 // @Produce json
 // @Param paused query boolean false "Filter by paused status"
+// @Param cursor query string false "Opaque cursor from a previous response's next_cursor"
+// @Param limit query integer false "Maximum number of pools to return; omit with cursor to list all" minimum(1) maximum(1000)
 // @Success 200 {object} WorkPoolListResponse "List of work pools"
+// @Failure 400 {object} ErrorResponse "Invalid cursor"
 // @Failure 500 {object} ErrorResponse
 // @Router /api/v1/workpools [get]
-func listWorkPools(store *Store) gin.HandlerFunc {
+func listWorkPools(store *Store, lists *listCache) gin.HandlerFunc {
 	return func(c *gin.Context) {
 		var paused *bool
 		if v := c.Query("paused"); v != "" {
@@ -81,19 +96,79 @@ func listWorkPools(store *Store) gin.HandlerFunc {
 			}
 		}
 
-		pools, err := store.ListWorkPools(c.Request.Context(), paused)
+		var cursor *sessions.Cursor
+		if v := c.Query("cursor"); v != "" {
+			decoded, err := sessions.DecodeCursor(v)
+			if err != nil {
+				c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+				return
+			}
+			cursor = decoded
+		}
+
+		limit, _ := strconv.Atoi(c.Query("limit"))
+		if limit > maxWorkPoolPageSize {
+			limit = maxWorkPoolPageSize
+		}
+
+		cacheKey := listCacheKey(paused, c.Query("cursor"), limit)
+		body, generation, ok := lists.get(cacheKey)
+		if ok {
+			c.Data(http.StatusOK, jsonContentType, body)
+			return
+		}
+
+		var (
+			pools []WorkPool
+			err   error
+		)
+		if limit <= 0 && cursor == nil {
+			pools, err = store.ListWorkPools(c.Request.Context(), paused)
+		} else {
+			if limit <= 0 {
+				limit = defaultWorkPoolPageSize
+			}
+			pools, err = store.ListWorkPoolsAfter(c.Request.Context(), paused, cursor, limit)
+		}
 		if err != nil {
 			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 			return
 		}
 
-		c.JSON(http.StatusOK, gin.H{
-			"pools": pools,
-			"total": len(pools),
+		var nextCursor string
+		if limit > 0 && len(pools) == limit {
+			last := pools[len(pools)-1]
+			nextCursor = sessions.Cursor{Timestamp: last.CreatedAt, ID: last.ID}.Encode()
+		}
+		body, err = json.Marshal(WorkPoolListResponse{
+			Pools:      pools,
+			Total:      len(pools),
+			NextCursor: nextCursor,
 		})
+		if err != nil {
+			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+			return
+		}
+		lists.put(cacheKey, generation, body)
+		c.Data(http.StatusOK, jsonContentType, body)
+	}
+}
+
+func listCacheKey(paused *bool, cursor string, limit int) string {
+	p := "any"
+	if paused != nil {
+		p = strconv.FormatBool(*paused)
 	}
+	return p + "|" + strconv.Itoa(limit) + "|" + cursor
 }
 
+const (
+	defaultWorkPoolPageSize = 100
+	maxWorkPoolPageSize     = 1000
+
+	jsonContentType = "application/json; charset=utf-8"
+)
+
 // GetWorkPool retrieves a specific work pool by ID
 // @Summary Get a work pool
 // @Description Get details of a specific work pool by ID
@@ -138,9 +213,10 @@ func getWorkPool(store *Store) gin.HandlerFunc {
 // @Param updates body map[string]interface{} true "Fields to update"
 // @Success 200 {object} MessageResponse
 // @Failure 400 {object} ErrorResponse
+// @Failure 409 {object} ErrorResponse "A pool with this default- name already exists"
 // @Failure 500 {object} ErrorResponse
 // @Router /api/v1/workpools/{id} [patch]
-func updateWorkPool(store *Store) gin.HandlerFunc {
+func updateWorkPool(store *Store, lists *listCache) gin.HandlerFunc {
 	return func(c *gin.Context) {
 		id, err := uuid.Parse(c.Param("id"))
 		if err != nil {
@@ -155,9 +231,14 @@ func updateWorkPool(store *Store) gin.HandlerFunc {
 		}
 
 		if err := store.UpdateWorkPool(c.Request.Context(), id, updates); err != nil {
+			if errors.Is(err, ErrDefaultPoolNameTaken) {
+				c.JSON(http.StatusConflict, gin.H{"error": err.Error()})
+				return
+			}
 			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 			return
 		}
+		lists.invalidate()
 
 		c.JSON(http.StatusOK, gin.H{"message": "pool updated"})
 	}
@@ -174,7 +255,7 @@ func updateWorkPool(store *Store) gin.HandlerFunc {
 // @Failure 400 {object} ErrorResponse
 // @Failure 500 {object} ErrorResponse
 // @Router /api/v1/workpools/{id} [delete]
-func deleteWorkPool(store *Store) gin.HandlerFunc {
+func deleteWorkPool(store *Store, lists *listCache) gin.HandlerFunc {
 	return func(c *gin.Context) {
 		id, err := uuid.Parse(c.Param("id"))
 		if err != nil {
@@ -186,6 +267,7 @@ func deleteWorkPool(store *Store) gin.HandlerFunc {
 			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 			return
 		}
+		lists.invalidate()
 
 		c.JSON(http.StatusOK, gin.H{"message": "pool deleted"})
 	}
@@ -203,7 +285,7 @@ func deleteWorkPool(store *Store) gin.HandlerFunc {
 // @Failure 400 {object} ErrorResponse
 // @Failure 500 {object} ErrorResponse
 // @Router /api/v1/workpools/{id}/scale [post]
-func scaleWorkPool(store *Store) gin.HandlerFunc {
+func scaleWorkPool(store *Store, lists *listCache) gin.HandlerFunc {
 	return func(c *gin.Context) {
 		id, err := uuid.Parse(c.Param("id"))
 		if err != nil {
@@ -270,6 +352,7 @@ func scaleWorkPool(store *Store) gin.HandlerFunc {
 			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 			return
 		}
+		lists.invalidate()
 
 		c.JSON(http.StatusOK, gin.H{
 			"message": "pool scaled",
@@ -289,7 +372,7 @@ func scaleWorkPool(store *Store) gin.HandlerFunc {
 // @Failure 400 {object} ErrorResponse
 // @Failure 500 {object} ErrorResponse
 // @Router /api/v1/workpools/{id}/drain [post]
-func drainWorkPool(store *Store) gin.HandlerFunc {
+func drainWorkPool(store *Store, lists *listCache) gin.HandlerFunc {
 	return func(c *gin.Context) {
 		id, err := uuid.Parse(c.Param("id"))
 		if err != nil {
@@ -301,6 +384,7 @@ func drainWorkPool(store *Store) gin.HandlerFunc {
 			c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 			return
 		}
+		lists.invalidate()
 
 		c.JSON(http.StatusOK, gin.H{"message": "pool drained"})
 	}
@@ -0,0 +1,82 @@
+package workpool
+
+import (
+	"sync"
+	"time"
+)
+
+const (
+	workPoolListCacheTTL        = 10 * time.Second
+	workPoolListCacheMaxEntries = 256
+)
+
+// listCache memoizes encoded work pool list responses per query for a short
+// TTL, so a hit skips both the query and JSON encoding. The HTTP handlers
+// that mutate pools invalidate it; writes made elsewhere (other API
+// replicas, the pool service) become visible once the TTL lapses.
+type listCache struct {
+	mu         sync.Mutex
+	ttl        time.Duration
+	maxEntries int
+	generation uint64
+	entries    map[string]listCacheEntry
+}
+
+type listCacheEntry struct {
+	body    []byte
+	expires time.Time
+}
+
+func newListCache(ttl time.Duration, maxEntries int) *listCache {
+	return &listCache{
+		ttl:        ttl,
+		maxEntries: maxEntries,
+		entries:    make(map[string]listCacheEntry),
+	}
+}
+
+// get returns the cached response for key, if still fresh, along with the
+// current generation to hand back to put.
+func (c *listCache) get(key string) ([]byte, uint64, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	entry, ok := c.entries[key]
+	if ok && time.Now().Before(entry.expires) {
+		return entry.body, c.generation, true
+	}
+	return nil, c.generation, false
+}
+
+// put stores body under key unless the cache was invalidated after the
+// caller's get, in which case the response may already be stale.
+func (c *listCache) put(key string, generation uint64, body []byte) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if generation != c.generation {
+		return
+	}
+
+	now := time.Now()
+	if len(c.entries) >= c.maxEntries {
+		for k, entry := range c.entries {
+			if !now.Before(entry.expires) {
+				delete(c.entries, k)
+			}
+		}
+		if len(c.entries) >= c.maxEntries {
+			c.entries = make(map[string]listCacheEntry)
+		}
+	}
+
+	c.entries[key] = listCacheEntry{body: body, expires: now.Add(c.ttl)}
+}
+
+func (c *listCache) invalidate() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	c.generation++
+	c.entries = make(map[string]listCacheEntry)
+}
@@ -16,11 +16,13 @@ const (
 	ProviderK8s    ProviderType = "k8s"
 )
 
-// WorkPool represents a work pool for managing browser workers
+// WorkPool represents a work pool for managing browser workers. Names
+// starting with "default-" are reserved for per-provider default pools and
+// must be unique; other names may repeat.
 // @Description Work pool configuration for managing browser workers
 type WorkPool struct {
-	ID          uuid.UUID    `json:"id" example:"550e8400-e29b-41d4-a716-446655440000"`
-	Name        string       `json:"name" example:"Chrome Workers"`
+	ID          uuid.UUID    `json:"id" example:"550e8400-e29b-41d4-a716-446655440000" gorm:"index:idx_work_pools_created_at_id,priority:2,sort:desc"`
+	Name        string       `json:"name" example:"Chrome Workers" gorm:"uniqueIndex:idx_work_pools_default_name,where:name LIKE 'default-%'"`
 	Description string       `json:"description" example:"Pool for Chrome browser workers"`
 	Provider    ProviderType `json:"provider" example:"k8s"`
 
@@ -37,7 +39,7 @@ type WorkPool struct {
 	DefaultEnv   datatypes.JSON `json:"default_env" swaggertype:"object"`
 	DefaultImage *string        `json:"default_image" example:"browsergrid/chrome:latest"`
 
-	CreatedAt time.Time `json:"created_at" example:"2023-01-01T00:00:00Z"`
+	CreatedAt time.Time `json:"created_at" example:"2023-01-01T00:00:00Z" gorm:"index:idx_work_pools_created_at_id,priority:1,sort:desc"`
 	UpdatedAt time.Time `json:"updated_at" example:"2023-01-01T00:00:00Z"`
 } //@name WorkPool
 
@@ -80,8 +82,9 @@ func (wp *WorkPool) SessionsToCreate(currentSessions, pendingSessions int) int {
 // WorkPoolListResponse represents a response containing a list of work pools
 // @Description Response containing a list of work pools
 type WorkPoolListResponse struct {
-	Pools []WorkPool `json:"pools"`
-	Total int        `json:"total" example:"5"`
+	Pools      []WorkPool `json:"pools"`
+	Total      int        `json:"total" example:"5"`
+	NextCursor string     `json:"next_cursor,omitempty" example:"MjAyMy0wMS0wMVQwMDowMDowMFp8NTUwZTg0MDAtZTI5Yi00MWQ0LWE3MTYtNDQ2NjU1NDQwMDAw"`
 } //@name WorkPoolListResponse
 
 // ScalingRequest represents scaling parameters for a work pool
@@ -7,6 +7,7 @@ import (
 
 	"github.com/google/uuid"
 	"gorm.io/gorm"
+	"gorm.io/gorm/clause"
 )
 
 type PoolServiceImpl struct{ db *gorm.DB }
@@ -16,22 +17,21 @@ func NewPoolService(db *gorm.DB) *PoolServiceImpl {
 }
 
 func (p *PoolServiceImpl) GetOrCreateDefault(ctx context.Context, provider string) (uuid.UUID, error) {
-	if err := p.db.WithContext(ctx).AutoMigrate(&WorkPool{}); err != nil {
-		return uuid.Nil, err
-	}
+	return getOrCreateDefault(ctx, p.db, provider)
+}
 
+// getOrCreateDefault returns the ID of the default pool for provider,
+// creating it if needed. Creation is INSERT ... ON CONFLICT DO NOTHING against
+// idx_work_pools_default_name, so concurrent callers cannot create duplicates.
+func getOrCreateDefault(ctx context.Context, db *gorm.DB, provider string) (uuid.UUID, error) {
 	poolName := fmt.Sprintf("default-%s", provider)
 
-	var pool WorkPool
-	err := p.db.WithContext(ctx).Where("name = ?", poolName).First(&pool).Error
-	if err == nil {
-		return pool.ID, nil
-	}
-	if err != nil && err != gorm.ErrRecordNotFound {
-		return uuid.Nil, err
+	id, err := defaultPoolID(ctx, db, poolName)
+	if err != gorm.ErrRecordNotFound {
+		return id, err
 	}
 
-	pool = WorkPool{
+	pool := WorkPool{
 		ID:             uuid.New(),
 		Name:           poolName,
 		Provider:       ProviderType(provider),
@@ -41,5 +41,39 @@ func (p *PoolServiceImpl) GetOrCreateDefault(ctx context.Context, provider strin
 		UpdatedAt:      time.Now(),
 	}
 
-	return pool.ID, p.db.WithContext(ctx).Create(&pool).Error
+	result := db.WithContext(ctx).
+		Clauses(clause.OnConflict{
+			Columns:     []clause.Column{{Name: "name"}},
+			TargetWhere: clause.Where{Exprs: []clause.Expression{clause.Expr{SQL: defaultPoolNamePredicate}}},
+			DoNothing:   true,
+		}).
+		Create(&pool)
+	if result.Error != nil {
+		return uuid.Nil, result.Error
+	}
+	if result.RowsAffected == 1 {
+		return pool.ID, nil
+	}
+
+	// Another caller created the pool between our lookup and insert.
+	return defaultPoolID(ctx, db, poolName)
+}
+
+// defaultPoolNamePredicate must match the WHERE clause of
+// idx_work_pools_default_name for ON CONFLICT to infer that index.
+const defaultPoolNamePredicate = "name LIKE 'default-%'"
+
+func defaultPoolID(ctx context.Context, db *gorm.DB, name string) (uuid.UUID, error) {
+	var ids []uuid.UUID
+	err := db.WithContext(ctx).Model(&WorkPool{}).
+		Where("name = ?", name).
+		Limit(1).
+		Pluck("id", &ids).Error
+	if err != nil {
+		return uuid.Nil, err
+	}
+	if len(ids) == 0 {
+		return uuid.Nil, gorm.ErrRecordNotFound
+	}
+	return ids[0], nil
 }
@@ -2,14 +2,22 @@ package workpool
 
 import (
 	"context"
+	"errors"
 	"time"
 
 	"github.com/google/uuid"
+	"github.com/jackc/pgx/v5/pgconn"
 	"gorm.io/gorm"
 
 	"github.com/autocrawlerHQ/browsergrid/internal/sessions"
 )
 
+// ErrDefaultPoolNameTaken is returned when a create or rename collides with an
+// existing pool name starting with "default-". That prefix is reserved for the
+// per-provider pools GetOrCreateDefault creates, and idx_work_pools_default_name
+// keeps such names unique; other pool names may repeat.
+var ErrDefaultPoolNameTaken = errors.New(`a pool with this name already exists; "default-" names must be unique`)
+
 type Store struct {
 	db *gorm.DB
 }
@@ -22,12 +30,12 @@ func (s *Store) CreateWorkPool(ctx context.Context, pool *WorkPool) error {
 	if pool.ID == uuid.Nil {
 		pool.ID = uuid.New()
 	}
-	return s.db.WithContext(ctx).Create(pool).Error
+	return translatePoolError(s.db.WithContext(ctx).Create(pool).Error)
 }
 
 func (s *Store) GetWorkPool(ctx context.Context, id uuid.UUID) (*WorkPool, error) {
 	var pool WorkPool
-	err := s.db.WithContext(ctx).First(&pool, "id = ?", id).Error
+	err := s.db.WithContext(ctx).Take(&pool, "id = ?", id).Error
 	if err != nil {
 		return nil, err
 	}
@@ -55,11 +63,39 @@ func (s *Store) ListWorkPools(ctx context.Context, paused *bool) ([]WorkPool, er
 	return pools, err
 }
 
+// ListWorkPoolsAfter returns up to limit pools following cursor, using
+// keyset pagination on (created_at, id). A nil cursor returns the first page.
+func (s *Store) ListWorkPoolsAfter(ctx context.Context, paused *bool, cursor *sessions.Cursor, limit int) ([]WorkPool, error) {
+	query := s.db.WithContext(ctx).Model(&WorkPool{})
+
+	if paused != nil {
+		query = query.Where("paused = ?", *paused)
+	}
+	if cursor != nil {
+		query = query.Where("(created_at, id) < (?, ?)", cursor.Timestamp, cursor.ID)
+	}
+
+	var pools []WorkPool
+	err := query.Order("created_at DESC, id DESC").Limit(limit).Find(&pools).Error
+	return pools, err
+}
+
 func (s *Store) UpdateWorkPool(ctx context.Context, id uuid.UUID, updates map[string]interface{}) error {
 	updates["updated_at"] = time.Now()
-	return s.db.WithContext(ctx).Model(&WorkPool{}).
+	err := s.db.WithContext(ctx).Model(&WorkPool{}).
 		Where("id = ?", id).
 		Updates(updates).Error
+	return translatePoolError(err)
+}
+
+// translatePoolError maps a violation of idx_work_pools_default_name to
+// ErrDefaultPoolNameTaken and returns any other error unchanged.
+func translatePoolError(err error) error {
+	var pgErr *pgconn.PgError
+	if errors.As(err, &pgErr) && pgErr.Code == "23505" && pgErr.ConstraintName == "idx_work_pools_default_name" {
+		return ErrDefaultPoolNameTaken
+	}
+	return err
 }
 
 func (s *Store) DeleteWorkPool(ctx context.Context, id uuid.UUID) error {
@@ -79,23 +115,35 @@ func (s *Store) DrainWorkPool(ctx context.Context, id uuid.UUID) error {
 		Updates(updates).Error
 }
 
+// activeStatuses are the statuses that count against a pool's concurrency.
+var activeStatuses = []sessions.SessionStatus{
+	sessions.StatusStarting, sessions.StatusRunning, sessions.StatusIdle,
+}
+
+// GetPoolCapacity returns a pool's max concurrency and its active session
+// count. The count is a correlated subquery so both arrive in one round trip.
 func (s *Store) GetPoolCapacity(ctx context.Context, poolID uuid.UUID) (int, int, error) {
-	var pool WorkPool
-	err := s.db.WithContext(ctx).First(&pool, "id = ?", poolID).Error
-	if err != nil {
-		return 0, 0, err
+	var capacity struct {
+		MaxConcurrency int
+		ActiveCount    int
 	}
-
-	var activeCount int64
-	err = s.db.WithContext(ctx).Model(&sessions.Session{}).
-		Where("work_pool_id = ? AND status IN ?", poolID,
-			[]sessions.SessionStatus{sessions.StatusStarting, sessions.StatusRunning, sessions.StatusIdle}).
-		Count(&activeCount).Error
-	if err != nil {
-		return 0, 0, err
+	result := s.db.WithContext(ctx).Raw(`
+		SELECT wp.max_concurrency,
+		       (SELECT count(*) FROM sessions
+		        WHERE work_pool_id = wp.id AND status IN ?) AS active_count
+		FROM work_pools wp
+		WHERE wp.id = ?`,
+		activeStatuses,
+		poolID,
+	).Scan(&capacity)
+	if result.Error != nil {
+		return 0, 0, result.Error
+	}
+	if result.RowsAffected == 0 {
+		return 0, 0, gorm.ErrRecordNotFound
 	}
 
-	return pool.MaxConcurrency, int(activeCount), nil
+	return capacity.MaxConcurrency, capacity.ActiveCount, nil
 }
 
 func (s *Store) AutoMigrate() error {
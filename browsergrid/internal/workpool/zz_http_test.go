@@ -158,6 +158,40 @@ func TestCreateWorkPool(t *testing.T) {
 	}
 }
 
+func TestWorkPoolDefaultNameConflict(t *testing.T) {
+	db, router := setupHTTPTestDB(t)
+	store := NewStore(db)
+	ctx := context.Background()
+
+	post := func(name string) int {
+		body, err := json.Marshal(WorkPool{Name: name, Provider: ProviderDocker, MaxConcurrency: 5})
+		require.NoError(t, err)
+		req, err := http.NewRequest("POST", "/api/v1/workpools", bytes.NewBuffer(body))
+		require.NoError(t, err)
+		req.Header.Set("Content-Type", "application/json")
+		rr := httptest.NewRecorder()
+		router.ServeHTTP(rr, req)
+		return rr.Code
+	}
+
+	assert.Equal(t, http.StatusCreated, post("default-staging"))
+	assert.Equal(t, http.StatusConflict, post("default-staging"))
+	assert.Equal(t, http.StatusCreated, post("shared-name"))
+	assert.Equal(t, http.StatusCreated, post("shared-name"), "only default- names are unique")
+
+	other := &WorkPool{Name: "other-pool", Provider: ProviderDocker, MaxConcurrency: 5}
+	require.NoError(t, store.CreateWorkPool(ctx, other))
+
+	body, err := json.Marshal(map[string]interface{}{"name": "default-staging"})
+	require.NoError(t, err)
+	req, err := http.NewRequest("PATCH", "/api/v1/workpools/"+other.ID.String(), bytes.NewBuffer(body))
+	require.NoError(t, err)
+	req.Header.Set("Content-Type", "application/json")
+	rr := httptest.NewRecorder()
+	router.ServeHTTP(rr, req)
+	assert.Equal(t, http.StatusConflict, rr.Code)
+}
+
 func TestListWorkPools(t *testing.T) {
 	db, router := setupHTTPTestDB(t)
 	store := NewStore(db)
@@ -0,0 +1,61 @@
+package workpool
+
+import (
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestListCache(t *testing.T) {
+	resp := []byte(`{"pools":[{"name":"cached"}],"total":1}`)
+
+	t.Run("hit within ttl", func(t *testing.T) {
+		c := newListCache(time.Minute, 8)
+		_, gen, ok := c.get("k")
+		assert.False(t, ok)
+
+		c.put("k", gen, resp)
+		got, _, ok := c.get("k")
+		assert.True(t, ok)
+		assert.Equal(t, resp, got)
+	})
+
+	t.Run("miss after ttl", func(t *testing.T) {
+		c := newListCache(time.Millisecond, 8)
+		_, gen, _ := c.get("k")
+		c.put("k", gen, resp)
+
+		time.Sleep(5 * time.Millisecond)
+		_, _, ok := c.get("k")
+		assert.False(t, ok)
+	})
+
+	t.Run("invalidate drops entries and in-flight puts", func(t *testing.T) {
+		c := newListCache(time.Minute, 8)
+		_, gen, _ := c.get("k")
+		c.put("k", gen, resp)
+
+		_, stale, _ := c.get("other")
+		c.invalidate()
+
+		_, _, ok := c.get("k")
+		assert.False(t, ok)
+
+		c.put("other", stale, resp)
+		_, _, ok = c.get("other")
+		assert.False(t, ok, "response read before invalidation must not be cached")
+	})
+
+	t.Run("bounded size", func(t *testing.T) {
+		c := newListCache(time.Minute, 2)
+		_, gen, _ := c.get("a")
+		c.put("a", gen, resp)
+		c.put("b", gen, resp)
+		c.put("c", gen, resp)
+
+		assert.LessOrEqual(t, len(c.entries), 2)
+		_, _, ok := c.get("c")
+		assert.True(t, ok)
+	})
+}
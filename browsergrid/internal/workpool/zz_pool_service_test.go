@@ -149,27 +149,6 @@ func TestPoolServiceImpl_GetOrCreateDefault_Concurrent(t *testing.T) {
 	assert.Equal(t, int64(1), count, "Only one pool should be created despite concurrent calls")
 }
 
-func TestPoolServiceImpl_GetOrCreateDefault_TableAutoMigration(t *testing.T) {
-	db, err := gorm.Open(postgres.Open(testConnStr), &gorm.Config{
-		Logger: logger.Default.LogMode(logger.Silent),
-	})
-	require.NoError(t, err)
-
-	db.Exec("DROP TABLE IF EXISTS work_pools")
-
-	service := NewPoolService(db)
-	ctx := context.Background()
-
-	poolID, err := service.GetOrCreateDefault(ctx, "docker")
-	require.NoError(t, err)
-	assert.NotEqual(t, uuid.Nil, poolID)
-
-	var pool WorkPool
-	err = db.Where("id = ?", poolID).First(&pool).Error
-	require.NoError(t, err)
-	assert.Equal(t, "default-docker", pool.Name)
-}
-
 func TestPoolServiceImpl_GetOrCreateDefault_InvalidProvider(t *testing.T) {
 	db := setupPoolServiceTestDB(t)
 	defer cleanupPoolServiceTestDB(db)
@@ -325,6 +325,57 @@ func TestStore_ListWorkPools(t *testing.T) {
 	}
 }
 
+func TestStore_ListWorkPoolsAfter(t *testing.T) {
+	db := setupTestDB(t)
+	store := NewStore(db)
+	ctx := context.Background()
+
+	base := time.Now().Add(-time.Hour)
+	for i := 0; i < 5; i++ {
+		pool := &WorkPool{
+			Name:           "page-pool",
+			Provider:       ProviderDocker,
+			MaxConcurrency: 10,
+			CreatedAt:      base.Add(time.Duration(i) * time.Minute),
+		}
+		if err := store.CreateWorkPool(ctx, pool); err != nil {
+			t.Fatalf("Failed to create test work pool: %v", err)
+		}
+	}
+
+	var (
+		seen   []uuid.UUID
+		cursor *sessions.Cursor
+	)
+	for {
+		page, err := store.ListWorkPoolsAfter(ctx, nil, cursor, 2)
+		if err != nil {
+			t.Fatalf("ListWorkPoolsAfter() error = %v", err)
+		}
+		for _, pool := range page {
+			seen = append(seen, pool.ID)
+		}
+		if len(page) < 2 {
+			break
+		}
+		last := page[len(page)-1]
+		cursor = &sessions.Cursor{Timestamp: last.CreatedAt, ID: last.ID}
+	}
+
+	all, err := store.ListWorkPools(ctx, nil)
+	if err != nil {
+		t.Fatalf("ListWorkPools() error = %v", err)
+	}
+	if len(seen) != len(all) {
+		t.Fatalf("Expected %d pools across pages, got %d", len(all), len(seen))
+	}
+	for i := range all {
+		if seen[i] != all[i].ID {
+			t.Errorf("Page order mismatch at %d: got %v, want %v", i, seen[i], all[i].ID)
+		}
+	}
+}
+
 func TestStore_UpdateWorkPool(t *testing.T) {
 	db := setupTestDB(t)
 	store := NewStore(db)
@@ -480,6 +531,11 @@ func TestStore_GetPoolCapacity(t *testing.T) {
 	if activeCount != 2 {
 		t.Errorf("Expected active count 2, got %d", activeCount)
 	}
+
+	_, _, err = store.GetPoolCapacity(ctx, uuid.New())
+	if err != gorm.ErrRecordNotFound {
+		t.Errorf("Expected gorm.ErrRecordNotFound for unknown pool, got %v", err)
+	}
 }
 
 func TestStore_AutoMigrate(t *testing.T) {
@@ -0,0 +1,4 @@
+-- Create index "idx_sessions_created_at_id" to table: "sessions"
+CREATE INDEX "idx_sessions_created_at_id" ON "public"."sessions" ("created_at" DESC, "id" DESC);
+-- Create index "idx_session_events_timestamp_id" to table: "session_events"
+CREATE INDEX "idx_session_events_timestamp_id" ON "public"."session_events" ("timestamp" DESC, "id" DESC);
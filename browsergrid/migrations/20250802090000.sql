@@ -0,0 +1,2 @@
+-- Create index "idx_session_metrics_session_id_timestamp" to table: "session_metrics"
+CREATE INDEX "idx_session_metrics_session_id_timestamp" ON "public"."session_metrics" ("session_id", "timestamp");
@@ -0,0 +1,2 @@
+-- Create index "idx_sessions_pool_available" to table: "sessions"
+CREATE INDEX "idx_sessions_pool_available" ON "public"."sessions" ("pool_id", "available_at") WHERE ((status = 'available'::text) AND (claimed_by IS NULL));
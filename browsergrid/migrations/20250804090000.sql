@@ -0,0 +1,2 @@
+-- Create index "idx_session_metrics_timestamp_brin" to table: "session_metrics"
+CREATE INDEX "idx_session_metrics_timestamp_brin" ON "public"."session_metrics" USING brin ("timestamp");
@@ -0,0 +1,2 @@
+-- Create index "idx_sessions_work_pool_id_status" to table: "sessions"
+CREATE INDEX "idx_sessions_work_pool_id_status" ON "public"."sessions" ("work_pool_id", "status");
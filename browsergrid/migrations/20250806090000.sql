@@ -0,0 +1,2 @@
+-- Create index "idx_sessions_idle" to table: "sessions"
+CREATE INDEX "idx_sessions_idle" ON "public"."sessions" ("work_pool_id", "updated_at") WHERE (status = 'idle'::text);
@@ -0,0 +1,2 @@
+-- Create index "idx_session_events_session_id_event_timestamp" to table: "session_events"
+CREATE INDEX "idx_session_events_session_id_event_timestamp" ON "public"."session_events" ("session_id", "event", "timestamp" DESC);
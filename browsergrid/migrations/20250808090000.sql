@@ -0,0 +1,6 @@
+-- Move sessions off duplicate default pools onto the oldest pool of each name
+WITH "dupes" AS (SELECT "id", first_value("id") OVER (PARTITION BY "name" ORDER BY "created_at", "id") AS "keep_id" FROM "public"."work_pools" WHERE (name ~~ 'default-%'::text)) UPDATE "public"."sessions" SET "work_pool_id" = "dupes"."keep_id" FROM "dupes" WHERE "sessions"."work_pool_id" = "dupes"."id" AND "dupes"."id" <> "dupes"."keep_id";
+-- Delete the duplicate default pools so the unique index can be built
+WITH "dupes" AS (SELECT "id", first_value("id") OVER (PARTITION BY "name" ORDER BY "created_at", "id") AS "keep_id" FROM "public"."work_pools" WHERE (name ~~ 'default-%'::text)) DELETE FROM "public"."work_pools" USING "dupes" WHERE "work_pools"."id" = "dupes"."id" AND "dupes"."id" <> "dupes"."keep_id";
+-- Create index "idx_work_pools_default_name" to table: "work_pools"
+CREATE UNIQUE INDEX "idx_work_pools_default_name" ON "public"."work_pools" ("name") WHERE (name ~~ 'default-%'::text);
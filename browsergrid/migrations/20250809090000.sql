@@ -0,0 +1,2 @@
+-- Create index "idx_work_pools_created_at_id" to table: "work_pools"
+CREATE INDEX "idx_work_pools_created_at_id" ON "public"."work_pools" ("created_at" DESC, "id" DESC);
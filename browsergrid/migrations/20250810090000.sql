@@ -0,0 +1,4 @@
+-- Create index "idx_deployments_name_version" to table: "deployments"
+CREATE INDEX "idx_deployments_name_version" ON "public"."deployments" ("name", "version");
+-- Create index "idx_deployment_runs_deployment_id_created_at" to table: "deployment_runs"
+CREATE INDEX "idx_deployment_runs_deployment_id_created_at" ON "public"."deployment_runs" ("deployment_id", "created_at" DESC);
@@ -0,0 +1,2 @@
+-- Create index "idx_sessions_profile_id_status" to table: "sessions"
+CREATE INDEX "idx_sessions_profile_id_status" ON "public"."sessions" ("profile_id", "status");